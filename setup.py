@@ -3,6 +3,7 @@
 """
 AlphaGrid 量化平台安装脚本
 """
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -18,6 +19,21 @@ def read_requirements(filename):
                 if line.strip() and not line.startswith('#')]
     return []
 
+# 可选：用 mypyc 将数据类型转换模块编译为C扩展（ALPHAGRID_MYPYC=1 时启用，需安装 mypy）
+MYPYC_MODULES = [
+    "src/qp/data/types/derivative.py",
+    "src/qp/data/types/financial.py",
+    "src/qp/data/types/fundamental.py",
+]
+
+
+def build_ext_modules():
+    if os.environ.get("ALPHAGRID_MYPYC") != "1":
+        return []
+    from mypyc.build import mypycify
+    return mypycify(MYPYC_MODULES, opt_level="3")
+
+
 setup(
     name="alphagrid",
     version="0.1.0",
@@ -29,6 +45,7 @@ setup(
     url="https://github.com/alphagrid/alphagrid",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=build_ext_modules(),
     python_requires=">=3.10",
     install_requires=read_requirements("requirements-prod.txt"),
     extras_require={
@@ -398,7 +398,8 @@ def get_data_hub(config_path: str = None):
 # ========== 研究层数据API ==========
 
 def get_price(symbols: List[str], start_offset: int, end_date: str, 
-              freq: str = "1d", adjust: str = "adj") -> pd.DataFrame:
+              freq: str = "1d", adjust: str = "adj",
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     获取价格数据
     
@@ -408,6 +409,7 @@ def get_price(symbols: List[str], start_offset: int, end_date: str,
         end_date: 结束日期
         freq: 频率，默认"1d"（日线）
         adjust: 复权方式，"adj"表示前复权
+        columns: 只返回的列（可选，默认全部列）
         
     Returns:
         价格数据DataFrame，包含列: symbol, trade_date, close, open, high, low, volume, amount, vwap
@@ -467,6 +469,8 @@ def get_price(symbols: List[str], start_offset: int, end_date: str,
                 })
         
         df = pd.DataFrame(data)
+        if columns is not None:
+            df = df[list(columns)]
         logger.info(f"价格数据获取完成，记录数: {len(df)}")
         return df
         
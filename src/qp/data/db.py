@@ -1,15 +1,26 @@
 # qp/data/db.py
 """数据库抽象层 - 提供统一的数据存储接口"""
 from __future__ import annotations
+import os
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import yaml
 from pathlib import Path
 
-from .types import BarData, Exchange, Interval
+from .types import BAR_SCHEMA, BarData, Exchange, Interval, bars_to_arrow, df_to_bars_arrow
+from .types.common import _to_utc
 
 
+# ========== 常量定义 ==========
+# 每个RecordBatch的行数（8列×8192行约512KB，与常见L2缓存同量级）
+BATCH_SIZE = 8192
+
+BARS_FILE = "bars.parquet"
+
 class BaseDatabase(ABC):
     """数据库基类"""
     
@@ -24,25 +35,171 @@ class BaseDatabase(ABC):
                   end: Optional[pd.Timestamp] = None) -> List[BarData]:
         """加载K线数据"""
         pass
+    
+    def load_latest_bar(self, symbol: str, exchange: Exchange,
+                        interval: Interval) -> Optional[BarData]:
+        """加载最新一根K线（默认实现读取全量后取末尾，子类可覆盖为只读尾部）"""
+        bars = self.load_bars(symbol, exchange, interval)
+        return bars[-1] if bars else None
+    
+    def bars_version(self, symbol: str, exchange: Exchange,
+                     interval: Interval) -> Optional[Tuple]:
+        """K线数据的版本签名（数据变化后签名随之变化），默认 None 表示无法判断，调用方不应缓存"""
+        return None
+    
+    def save_bars_table(self, table: pa.Table, symbol: str,
+                        exchange: Exchange, interval: Interval) -> int:
+        """保存列式K线（BAR_SCHEMA），默认实现转回对象列表后调用 save_bars"""
+        return self.save_bars(df_to_bars_arrow(table, symbol, exchange, interval))
+    
+    def load_bars_table(self, symbol: str, exchange: Exchange, interval: Interval,
+                        start: Optional[pd.Timestamp] = None,
+                        end: Optional[pd.Timestamp] = None) -> pa.Table:
+        """加载列式K线（BAR_SCHEMA），默认实现基于 load_bars"""
+        return bars_to_arrow(self.load_bars(symbol, exchange, interval, start, end))
 
 
 class ParquetDatabase(BaseDatabase):
-    """Parquet数据库实现（占位）"""
+    """
+    Parquet数据库实现
+
+    - 每个 交易所/代码/周期 一个文件：{root}/{exchange}/{symbol}/{interval}/bars.parquet
+    - 按 BATCH_SIZE 行的 RecordBatch 流式写入与读取，避免整表行列互转
+    """
     
     def __init__(self, root: str = "data/history_root"):
         self.root = root
     
+    def _bars_path(self, symbol: str, exchange: Exchange, interval: Interval) -> Path:
+        """K线文件路径"""
+        return Path(os.path.expanduser(self.root)) / exchange.value / symbol / interval.value / BARS_FILE
+    
+    def bars_version(self, symbol: str, exchange: Exchange,
+                     interval: Interval) -> Optional[Tuple]:
+        """K线文件的 (mtime, 大小) 签名；写入经原子替换，任一进程写入后签名即变化"""
+        try:
+            st = os.stat(self._bars_path(symbol, exchange, interval))
+        except FileNotFoundError:
+            return ()
+        return (st.st_mtime_ns, st.st_size)
+    
     def save_bars(self, bars: List[BarData]) -> int:
-        """保存K线数据"""
-        # TODO: 实现实际的存储逻辑
+        """保存K线数据（按 symbol/exchange/interval 分组后按列写入）"""
+        groups: Dict[Tuple[str, Exchange, Interval], List[BarData]] = {}
+        for bar in bars:
+            groups.setdefault((bar.symbol, bar.exchange, bar.interval), []).append(bar)
+        
+        for (symbol, exchange, interval), group in groups.items():
+            self.save_bars_table(bars_to_arrow(group), symbol, exchange, interval)
         return len(bars)
     
+    def save_bars_table(self, table: pa.Table, symbol: str,
+                        exchange: Exchange, interval: Interval) -> int:
+        """
+        保存列式K线
+
+        与已有文件按 datetime 合并（新数据覆盖旧数据），按 BATCH_SIZE 行分批写临时文件后原子替换。
+        """
+        path = self._bars_path(symbol, exchange, interval)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        merged = table.select(BAR_SCHEMA.names).cast(BAR_SCHEMA)
+        if path.exists():
+            # 先旧后新拼接，同一时间戳保留后者
+            df = pa.concat_tables([pq.read_table(path, schema=BAR_SCHEMA), merged]).to_pandas()
+            df = (df.drop_duplicates(subset=["datetime"], keep="last")
+                  .sort_values("datetime", kind="mergesort"))
+            merged = pa.Table.from_pandas(df, schema=BAR_SCHEMA, preserve_index=False)
+        else:
+            merged = merged.sort_by("datetime")
+        
+        tmp = path.with_suffix(".tmp.parquet")
+        with pq.ParquetWriter(tmp, BAR_SCHEMA, compression="zstd") as writer:
+            for batch in merged.to_batches(max_chunksize=BATCH_SIZE):
+                writer.write_batch(batch)
+        os.replace(tmp, path)
+        return table.num_rows
+    
+    def iter_load_bars(self, symbol: str, exchange: Exchange, interval: Interval,
+                       start: Optional[pd.Timestamp] = None,
+                       end: Optional[pd.Timestamp] = None,
+                       columns: Optional[List[str]] = None) -> Iterator[pa.RecordBatch]:
+        """
+        按批读取K线数据
+
+        Args:
+            symbol: 股票代码
+            exchange: 交易所
+            interval: 时间周期
+            start: 开始时间（可选）
+            end: 结束时间（可选）
+            columns: 读取的列（可选，datetime 列始终读取）
+
+        Yields:
+            不超过 BATCH_SIZE 行的 RecordBatch（列数据不做拷贝）
+        """
+        path = self._bars_path(symbol, exchange, interval)
+        if not path.exists():
+            return
+        
+        if columns is not None and "datetime" not in columns:
+            columns = ["datetime", *columns]
+        start = _to_utc(pd.Timestamp(start)) if start is not None else None
+        end = _to_utc(pd.Timestamp(end)) if end is not None else None
+        
+        pf = pq.ParquetFile(path)
+        for batch in pf.iter_batches(batch_size=BATCH_SIZE, columns=columns):
+            if start is None and end is None:
+                yield batch
+                continue
+            
+            # 文件按时间有序：整批早于起点则跳过，整批晚于终点则结束
+            dts = batch.column("datetime")
+            if batch.num_rows == 0 or (start is not None and dts[-1].as_py() < start):
+                continue
+            if end is not None and dts[0].as_py() > end:
+                break
+            
+            mask = None
+            if start is not None:
+                mask = pc.greater_equal(dts, pa.scalar(start, type=dts.type))
+            if end is not None:
+                upper = pc.less_equal(dts, pa.scalar(end, type=dts.type))
+                mask = upper if mask is None else pc.and_(mask, upper)
+            yield batch.filter(mask)
+    
+    def load_latest_bar(self, symbol: str, exchange: Exchange,
+                        interval: Interval) -> Optional[BarData]:
+        """加载最新一根K线（文件按时间有序，只读取最后一个行组）"""
+        path = self._bars_path(symbol, exchange, interval)
+        if not path.exists():
+            return None
+        
+        pf = pq.ParquetFile(path)
+        if pf.num_row_groups == 0:
+            return None
+        table = pf.read_row_group(pf.num_row_groups - 1)
+        if table.num_rows == 0:
+            return None
+        return df_to_bars_arrow(table.slice(table.num_rows - 1), symbol, exchange, interval)[0]
+    
+    def load_bars_table(self, symbol: str, exchange: Exchange, interval: Interval,
+                        start: Optional[pd.Timestamp] = None,
+                        end: Optional[pd.Timestamp] = None) -> pa.Table:
+        """加载列式K线（各批次直接拼为表，不做拷贝）"""
+        return pa.Table.from_batches(
+            list(self.iter_load_bars(symbol, exchange, interval, start, end)), schema=BAR_SCHEMA
+        )
+    
     def load_bars(self, symbol: str, exchange: Exchange, interval: Interval,
                   start: Optional[pd.Timestamp] = None,
                   end: Optional[pd.Timestamp] = None) -> List[BarData]:
         """加载K线数据"""
-        # TODO: 实现实际的加载逻辑
-        return []
+        return [
+            bar
+            for batch in self.iter_load_bars(symbol, exchange, interval, start, end)
+            for bar in df_to_bars_arrow(batch, symbol, exchange, interval)
+        ]
 
 
 class DataHub:
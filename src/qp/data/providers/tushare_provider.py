@@ -2,11 +2,21 @@
 """TuShare数据提供者"""
 from __future__ import annotations
 import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import tushare as ts
 from .base import BaseProvider
 from ..types import BarData, Exchange, Interval, df_to_bars
 
+# 参与复权的价格列
+OHLC_COLUMNS = ["open", "high", "low", "close"]
+
+# IO线程池大小：日线与复权因子两个HTTP请求并行发出
+IO_WORKERS = 2
+
+# TuShare 交易日期格式（固定 YYYYMMDD，指定格式走快速解析路径）
+TRADE_DATE_FORMAT = "%Y%m%d"
+
 # 列名映射
 COLUMN_MAPPING = {
     "trade_date": "datetime",
@@ -27,8 +37,32 @@ class TuShareProvider(BaseProvider):
         token = token or os.getenv("TUSHARE_TOKEN")
         if not token:
             raise ValueError("请提供TuShare token或设置环境变量TUSHARE_TOKEN")
-        ts.set_token(token)
-        self.pro = ts.pro_api()
+        self._token = token
+        self._pro = None
+        # 本实例的IO线程池（首次并行请求时创建，close() 时关闭）
+        self._io_pool: ThreadPoolExecutor | None = None
+
+    @property
+    def pro(self):
+        """TuShare Pro 接口（首次使用时才导入 tushare 并初始化）"""
+        if self._pro is None:
+            import tushare as ts
+            ts.set_token(self._token)
+            self._pro = ts.pro_api()
+        return self._pro
+
+    @property
+    def io_pool(self) -> ThreadPoolExecutor:
+        """IO线程池（首次使用时创建，多次调用间复用）"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="tushare-io")
+        return self._io_pool
+
+    def close(self):
+        """关闭IO线程池（之后再次请求会重新创建）"""
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
 
     def _fetch_daily_data(self, symbol: str, start: pd.Timestamp,
                          end: pd.Timestamp) -> pd.DataFrame:
@@ -43,37 +77,41 @@ class TuShareProvider(BaseProvider):
         df = raw.rename(columns=COLUMN_MAPPING)
         
         # 转换日期
-        df["datetime"] = pd.to_datetime(df["datetime"]).dt.tz_localize("UTC")
+        df["datetime"] = pd.to_datetime(df["datetime"], format=TRADE_DATE_FORMAT, utc=True)
         df = df.sort_values("datetime")
         
         return df[["datetime", "open", "high", "low", "close", "volume"]]
 
-    def _apply_adjust_factor(self, df: pd.DataFrame, symbol: str,
-                            start: pd.Timestamp, end: pd.Timestamp, adjust: str) -> pd.DataFrame:
-        """应用复权因子"""
-        if adjust == "none":
-            return df
-        
-        # 获取复权因子
-        factor_df = self.pro.adj_factor(
+    def _fetch_adj_factor(self, symbol: str, start: pd.Timestamp,
+                          end: pd.Timestamp) -> pd.DataFrame:
+        """获取复权因子"""
+        return self.pro.adj_factor(
             ts_code=symbol,
             start_date=start.strftime("%Y%m%d"),
             end_date=end.strftime("%Y%m%d")
         )
+
+    def _apply_adjust_factor(self, df: pd.DataFrame, factor_df: pd.DataFrame,
+                            adjust: str) -> pd.DataFrame:
+        """应用复权因子"""
+        if adjust == "none":
+            return df
         
         factor_df = factor_df.rename(columns={"trade_date": "datetime"})
-        factor_df["datetime"] = pd.to_datetime(factor_df["datetime"]).dt.tz_localize("UTC")
-        factor_df = factor_df[["datetime", "adj_factor"]].sort_values("datetime")
-        
-        # 合并因子
-        df = df.merge(factor_df, on="datetime", how="left").ffill()
+        factor_df["datetime"] = pd.to_datetime(factor_df["datetime"], format=TRADE_DATE_FORMAT, utc=True)
+        factor = factor_df.drop_duplicates("datetime", keep="last").set_index("datetime")["adj_factor"]
+        if not factor.index.is_monotonic_increasing:
+            # TuShare 按日期倒序返回，有序时跳过排序
+            factor = factor.sort_index()
         
-        # 计算复权价格
-        base_factor = df["adj_factor"].iloc[-1]
-        ratio = (df["adj_factor"] / base_factor) if adjust == "qfq" else (base_factor / df["adj_factor"])
+        # 按K线日期对齐因子（只对因子列前向填充，不合并整表）
+        af = factor.reindex(df["datetime"]).ffill().to_numpy(dtype=np.float64)
         
-        for col in ["open", "high", "low", "close"]:
-            df[col] = df[col].astype(float) * ratio
+        # 计算复权价格：一次二维乘法代替逐列赋值
+        base_factor = af[-1]
+        ratio = (af / base_factor) if adjust == "qfq" else (base_factor / af)
+        df = df.copy()
+        df[OHLC_COLUMNS] = df[OHLC_COLUMNS].to_numpy(dtype=np.float64) * ratio[:, None]
         
         return df[["datetime", "open", "high", "low", "close", "volume"]]
 
@@ -96,7 +134,15 @@ class TuShareProvider(BaseProvider):
         if interval != Interval.DAILY:
             raise NotImplementedError("TuShare提供者当前仅支持日线数据")
         
-        df = self._fetch_daily_data(symbol, start, end)
-        df = self._apply_adjust_factor(df, symbol, start, end, adjust)
+        if adjust == "none":
+            # 只有一个请求，直接在当前线程完成
+            return df_to_bars(self._fetch_daily_data(symbol, start, end), symbol, exchange, interval)
+        
+        # 日线与复权因子互不依赖，并行请求（先在当前线程完成接口初始化，避免两个IO线程重复初始化）
+        _ = self.pro
+        pool = self.io_pool
+        daily_future = pool.submit(self._fetch_daily_data, symbol, start, end)
+        factor_future = pool.submit(self._fetch_adj_factor, symbol, start, end)
+        df = self._apply_adjust_factor(daily_future.result(), factor_future.result(), adjust)
         
         return df_to_bars(df, symbol, exchange, interval)
@@ -2,7 +2,6 @@
 """Yahoo Finance数据提供者"""
 from __future__ import annotations
 import pandas as pd
-import yfinance as yf
 from .base import BaseProvider
 from ..types import Exchange, Interval, BarData, df_to_bars
 
@@ -44,6 +43,7 @@ class YFProvider(BaseProvider):
         auto_adjust = (adjust != "none")
         
         # 下载数据
+        import yfinance as yf  # 延迟导入，避免加载 providers 包时拉起整个依赖树
         df = yf.download(
             symbol,
             start=start.tz_convert(None),
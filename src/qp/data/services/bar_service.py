@@ -1,14 +1,26 @@
 # qp/data/services/bar_service.py
 """K线数据服务"""
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Iterable, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from ..types import BarData, Exchange, Interval, bars_to_df, df_to_bars
+from ..types import BarBatch, BarData, Exchange, Interval
+from ..types.common import _to_utc_series
 from ..db import BaseDatabase, ParquetDatabase
 from .base import BaseDataService
 
 
+# 参与复权的价格列
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+# 进程内 load_bars 结果缓存容量
+LOAD_CACHE_SIZE = 256
+
 # 重采样规则映射
 RESAMPLE_RULES = {
     Interval.DAILY: "1D",
@@ -21,6 +33,12 @@ RESAMPLE_RULES = {
 }
 
 
+def _utc_factors(factor_series: pd.Series) -> pd.Series:
+    """复权因子的日期索引规整为UTC（无时区按UTC处理，与K线时间戳口径一致）"""
+    index = pd.DatetimeIndex(_to_utc_series(pd.Series(factor_series.index)))
+    return factor_series.set_axis(index)
+
+
 class BarDataService(BaseDataService):
     """
     K线数据服务
@@ -37,6 +55,9 @@ class BarDataService(BaseDataService):
         """
         super().__init__()
         self.db = db or ParquetDatabase()
+        # 按 (symbol, exchange, interval, start, end, 文件版本) 缓存加载结果；
+        # 文件版本随任意写入变化，其他实例/进程写入后不会读到旧结果
+        self._load_cached = lru_cache(maxsize=LOAD_CACHE_SIZE)(self._load_bars_uncached)
     
     # ========== 持久化 ==========
     def save_bars(self, bars: Iterable[BarData]) -> int:
@@ -49,7 +70,51 @@ class BarDataService(BaseDataService):
         Returns:
             保存的记录数
         """
-        return self.db.save_bars(list(bars))
+        saved = self.db.save_bars(list(bars))
+        self._load_cached.cache_clear()
+        return saved
+    
+    def save_batch(self, batch: BarBatch) -> int:
+        """
+        保存列式K线批次
+        
+        Args:
+            batch: K线批次
+            
+        Returns:
+            保存的记录数
+        """
+        saved = self.db.save_bars_table(batch.table, batch.symbol, batch.exchange, batch.interval)
+        self._load_cached.cache_clear()
+        return saved
+    
+    def load_batch(self, symbol: str, exchange: Exchange, interval: Interval,
+                   start: Optional[pd.Timestamp] = None,
+                   end: Optional[pd.Timestamp] = None) -> BarBatch:
+        """
+        加载列式K线批次（不构造 BarData 对象）
+        
+        Args:
+            symbol: 股票代码
+            exchange: 交易所
+            interval: 时间周期
+            start: 开始时间（可选）
+            end: 结束时间（可选）
+            
+        Returns:
+            K线批次
+        """
+        symbol = self._validate_symbol(symbol)
+        self._validate_date_range(start, end)
+        table = self.db.load_bars_table(symbol, exchange, interval, start, end)
+        return BarBatch(table, symbol, exchange, interval)
+    
+    def _load_bars_uncached(self, symbol: str, exchange: Exchange, interval: Interval,
+                            start: Optional[pd.Timestamp],
+                            end: Optional[pd.Timestamp],
+                            version: tuple) -> tuple[BarData, ...]:
+        """从数据库加载K线（结果为不可变元组，供缓存复用；version 仅参与缓存键）"""
+        return tuple(self.db.load_bars(symbol, exchange, interval, start, end))
     
     def load_bars(self, symbol: str, exchange: Exchange, interval: Interval,
                   start: Optional[pd.Timestamp] = None,
@@ -69,7 +134,11 @@ class BarDataService(BaseDataService):
         """
         symbol = self._validate_symbol(symbol)
         self._validate_date_range(start, end)
-        return self.db.load_bars(symbol, exchange, interval, start, end)
+        version = self.db.bars_version(symbol, exchange, interval)
+        if version is None:
+            # 数据库无法提供版本签名时不缓存
+            return self.db.load_bars(symbol, exchange, interval, start, end)
+        return list(self._load_cached(symbol, exchange, interval, start, end, version))
     
     # ========== 导入数据 ==========
     def import_from_provider(self, provider, symbol: str, exchange: Exchange,
@@ -96,6 +165,42 @@ class BarDataService(BaseDataService):
         bars = provider.query_bars(symbol, exchange, interval, start, end, adjust)
         return self.save_bars(bars)
     
+    def import_many(self, provider, symbols: list[str], exchange: Exchange,
+                    interval: Interval, start: pd.Timestamp, end: pd.Timestamp,
+                    adjust: str = "none", max_workers: int = 4) -> int:
+        """
+        并发从数据提供者导入多只股票
+
+        拉取在线程池中并行执行（IO密集），写入在当前线程按完成顺序依次进行。
+        
+        Args:
+            provider: 数据提供者实例
+            symbols: 股票代码列表
+            exchange: 交易所
+            interval: 时间周期
+            start: 开始日期
+            end: 结束日期
+            adjust: 复权类型 ('none', 'qfq', 'hfq')
+            max_workers: 并发拉取的线程数（受数据源限流约束）
+            
+        Returns:
+            导入的总记录数
+        """
+        self._validate_date_range(start, end)
+        symbols = [self._validate_symbol(s) for s in symbols]
+        if not symbols:
+            return 0
+        
+        total = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            futures = [
+                executor.submit(provider.query_bars, symbol, exchange, interval, start, end, adjust)
+                for symbol in symbols
+            ]
+            for future in as_completed(futures):
+                total += self.save_bars(future.result())
+        return total
+    
     # ========== 重采样 ==========
     def _resample_ohlcv(self, df: pd.DataFrame, rule: str) -> pd.DataFrame:
         """
@@ -113,23 +218,28 @@ class BarDataService(BaseDataService):
             "high": "max",
             "low": "min",
             "close": "last",
-            "volume": lambda x: x.sum(min_count=1),
+            "volume": "sum",
         }
         
-        # 可选字段
-        if "turnover" in df.columns:
-            agg_dict["turnover"] = lambda x: x.sum(min_count=1)
-        else:
-            df["turnover"] = df["close"] * df["volume"]
-            agg_dict["turnover"] = lambda x: x.sum(min_count=1)
+        # 可选字段（不修改调用方的 df：缺失的成交额在局部副本上补算）
+        if "turnover" not in df.columns:
+            df = df.assign(turnover=df["close"].to_numpy() * df["volume"].to_numpy())
+        agg_dict["turnover"] = "sum"
         
-        if "open_interest" in df.columns:
-            agg_dict["open_interest"] = "last"
-        else:
-            df["open_interest"] = 0
+        has_open_interest = "open_interest" in df.columns
+        if has_open_interest:
             agg_dict["open_interest"] = "last"
         
+        # 全部使用字符串聚合名，走 pandas 的 Cython 路径
         resampled = df.resample(rule).agg(agg_dict)
+        if not has_open_interest:
+            # 常量列在聚合后按组数补齐，而不是按原始行数
+            resampled["open_interest"] = 0
+        
+        # 保持 sum(min_count=1) 语义：组内无有效值时为 NaN 而不是 0
+        sum_cols = ["volume", "turnover"]
+        counts = df[sum_cols].resample(rule).count()
+        resampled[sum_cols] = resampled[sum_cols].where(counts > 0)
         return resampled.dropna(subset=["open", "high", "low", "close"], how="any")
     
     def resample(self, bars: list[BarData], to: Interval) -> list[BarData]:
@@ -148,28 +258,31 @@ class BarDataService(BaseDataService):
         """
         if not bars:
             return []
+        return self.resample_batch(BarBatch.from_bars(bars), to).to_bars()
+    
+    def resample_batch(self, batch: BarBatch, to: Interval) -> BarBatch:
+        """
+        重采样列式K线批次
         
-        df = bars_to_df(bars)
-        if df.empty:
-            return []
-        
-        df = df.set_index("datetime").sort_index()
-        
+        Args:
+            batch: K线批次
+            to: 目标周期
+            
+        Returns:
+            重采样后的K线批次
+            
+        Raises:
+            ValueError: 如果不支持目标周期
+        """
         # 获取重采样规则
         rule = RESAMPLE_RULES.get(to)
         if rule is None:
             raise ValueError(f"不支持的重采样周期: {to}")
         
-        # 执行重采样
+        # 批次已按时间排序，直接以 datetime 为索引重采样
+        df = batch.to_df().set_index("datetime")
         resampled_df = self._resample_ohlcv(df, rule)
-        
-        # 获取元数据
-        symbol = df.reset_index().iloc[0]["symbol"]
-        exchange = df.reset_index().iloc[0]["exchange"]
-        
-        # 转换回BarData
-        result_df = resampled_df.reset_index()
-        return df_to_bars(result_df, symbol, exchange, to)
+        return BarBatch.from_df(resampled_df.reset_index(), batch.symbol, batch.exchange, to)
     
     # ========== 复权 ==========
     def apply_adjust(self, bars: list[BarData],
@@ -187,23 +300,43 @@ class BarDataService(BaseDataService):
         if factor_series is None or not bars:
             return bars
         
-        df = bars_to_df(bars).set_index("datetime")
+        factor_series = _utc_factors(factor_series)
+        # 快速路径：因子与K线逐条对齐（同长、同时间戳、有序无重复）时直接逐条相乘；
+        # 两侧均按UTC比较，输出时间戳与列式路径一致
+        if len(factor_series) == len(bars):
+            dates = pd.DatetimeIndex(_to_utc_series(pd.Series([b.datetime for b in bars])))
+            if dates.is_monotonic_increasing and dates.is_unique and factor_series.index.equals(dates):
+                factors = factor_series.ffill().to_numpy(dtype=np.float64).tolist()
+                return [BarData(
+                    b.symbol, b.exchange, b.interval, dt,
+                    b.open_price * f, b.high_price * f, b.low_price * f, b.close_price * f,
+                    b.volume, b.turnover, b.open_interest,
+                ) for b, dt, f in zip(bars, dates, factors)]
         
-        # 对齐因子
-        factor = factor_series.reindex(df.index).ffill()
+        return self.apply_adjust_batch(BarBatch.from_bars(bars), factor_series).to_bars()
+    
+    def apply_adjust_batch(self, batch: BarBatch, factor_series: pd.Series) -> BarBatch:
+        """
+        对列式K线批次应用复权因子
         
-        # 应用到价格列
-        price_columns = ["open", "high", "low", "close"]
-        for col in price_columns:
-            df[col] = df[col].astype(float) * factor
+        Args:
+            batch: K线批次
+            factor_series: 复权因子序列，index为日期
+            
+        Returns:
+            复权后的K线批次
+        """
+        # 对齐因子后直接在Arrow列上相乘，不经过DataFrame（K线时间戳为UTC，因子索引同样规整为UTC）
+        dates = pd.DatetimeIndex(batch.table.column("datetime").to_pandas())
+        factor_series = _utc_factors(factor_series)
+        factor = pa.array(factor_series.reindex(dates).ffill().to_numpy(dtype=np.float64))
         
-        # 转换回BarData
-        return df_to_bars(
-            df.reset_index(),
-            bars[0].symbol,
-            bars[0].exchange,
-            bars[0].interval
-        )
+        table = batch.table
+        for col in PRICE_COLUMNS:
+            table = table.set_column(
+                table.schema.get_field_index(col), col, pc.multiply(table.column(col), factor)
+            )
+        return BarBatch(table, batch.symbol, batch.exchange, batch.interval)
     
     # ========== 便捷方法 ==========
     def get_latest_bar(self, symbol: str, exchange: Exchange, 
@@ -219,8 +352,8 @@ class BarDataService(BaseDataService):
         Returns:
             最新的K线数据，如果不存在则返回None
         """
-        bars = self.load_bars(symbol, exchange, interval)
-        return bars[-1] if bars else None
+        symbol = self._validate_symbol(symbol)
+        return self.db.load_latest_bar(symbol, exchange, interval)
     
     def get_bars_between(self, symbol: str, exchange: Exchange,
                         interval: Interval, start: pd.Timestamp,
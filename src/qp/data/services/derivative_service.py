@@ -8,9 +8,11 @@
 from __future__ import annotations
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 from .base import BaseDataService
+from ..types._jit import column_sums
 from ..providers.derivative_provider import DerivativeProvider, MockDerivativeProvider
 from ..types.derivative import (
     AnnouncementData, NewsSentimentData, ResearchReportData,
@@ -236,10 +238,12 @@ class DerivativeDataService(BaseDataService):
                 "outflow_days": 0
             }
         
-        total_net_amount = sum(f.net_amount for f in flows)
-        total_inflow = sum(f.inflow_amount for f in flows)
-        total_outflow = sum(f.outflow_amount for f in flows)
-        avg_turnover_rate = sum(f.turnover_rate for f in flows) / len(flows)
+        values = np.array(
+            [(f.net_amount, f.inflow_amount, f.outflow_amount, f.turnover_rate) for f in flows],
+            dtype=np.float64
+        )
+        total_net_amount, total_inflow, total_outflow, total_turnover_rate = column_sums(values).tolist()
+        avg_turnover_rate = total_turnover_rate / len(flows)
         
         inflow_days = sum(1 for f in flows if f.direction == FlowDirection.INFLOW)
         outflow_days = sum(1 for f in flows if f.direction == FlowDirection.OUTFLOW)
@@ -332,11 +336,15 @@ class DerivativeDataService(BaseDataService):
                 "avg_price_change": 0.0
             }
         
-        total_buy_amount = sum(dt.buy_amount for dt in dragon_tigers)
-        total_sell_amount = sum(dt.sell_amount for dt in dragon_tigers)
-        total_net_amount = sum(dt.net_amount for dt in dragon_tigers)
-        avg_turnover_rate = sum(dt.turnover_rate for dt in dragon_tigers) / len(dragon_tigers)
-        avg_price_change = sum(dt.price_change for dt in dragon_tigers) / len(dragon_tigers)
+        values = np.array(
+            [(dt.buy_amount, dt.sell_amount, dt.net_amount, dt.turnover_rate, dt.price_change)
+             for dt in dragon_tigers],
+            dtype=np.float64
+        )
+        (total_buy_amount, total_sell_amount, total_net_amount,
+         total_turnover_rate, total_price_change) = column_sums(values).tolist()
+        avg_turnover_rate = total_turnover_rate / len(dragon_tigers)
+        avg_price_change = total_price_change / len(dragon_tigers)
         
         return {
             "total_count": len(dragon_tigers),
@@ -1,13 +1,46 @@
 # qp/data/services/fundamental_service.py
 """基本面数据服务"""
 from __future__ import annotations
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import inspect
+from typing import List, Optional, Tuple
 import pandas as pd
 
 from ..types import FundamentalData, Exchange, fundamentals_to_df
+from ..types._jit import rolling_pct_rank
 from .base import BaseDataService
 
 
+# 进程内 load_fundamentals 结果缓存容量
+LOAD_CACHE_SIZE = 1024
+
+# 各类指标的列（按输出顺序）
+VALUATION_COLUMNS = ('date', 'pe_ratio', 'pe_ttm', 'pb_ratio', 'ps_ratio', 'pcf_ratio')
+PROFITABILITY_COLUMNS = ('date', 'roe', 'roa', 'roic', 'gross_margin', 'net_margin', 'operating_margin')
+GROWTH_COLUMNS = ('date', 'revenue_growth', 'revenue_growth_qoq', 'profit_growth', 'profit_growth_qoq')
+
+
+def _accepts_columns(store) -> bool:
+    """存储的 load_fundamentals 是否支持 columns 参数（列裁剪下推）"""
+    load = getattr(store, 'load_fundamentals', None)
+    if load is None:
+        return False
+    try:
+        params = inspect.signature(load).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'columns' in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _select_columns(df: pd.DataFrame, columns: tuple) -> pd.DataFrame:
+    """按给定顺序选出 df 中存在的列（列名先转为集合，逐列判断为 O(1)）"""
+    present = set(df.columns)
+    return df[[col for col in columns if col in present]]
+
+
 class FundamentalDataService(BaseDataService):
     """
     基本面数据服务
@@ -25,6 +58,11 @@ class FundamentalDataService(BaseDataService):
         """
         super().__init__()
         self.store = store
+        # 存储是否支持列裁剪（设置存储时检查一次）
+        self._store_columns = _accepts_columns(store)
+        # 按 (symbol, exchange, start, end, columns, 文件版本) 缓存加载结果；
+        # 文件版本由存储的 fundamentals_version 提供，其他实例/进程写入后不会读到旧结果
+        self._load_cached = lru_cache(maxsize=LOAD_CACHE_SIZE)(self._load_fundamentals_uncached)
     
     def set_store(self, store):
         """
@@ -34,6 +72,8 @@ class FundamentalDataService(BaseDataService):
             store: FundamentalStore实例
         """
         self.store = store
+        self._store_columns = _accepts_columns(store)
+        self._load_cached.cache_clear()
     
     # ========== 基本面数据导入 ==========
     def import_fundamentals(self, provider, symbol: str, exchange: Exchange,
@@ -63,12 +103,57 @@ class FundamentalDataService(BaseDataService):
         data_list = provider.query_fundamentals(symbol, exchange, start, end)
         df = fundamentals_to_df(data_list)
         
-        return self.store.save_fundamentals(symbol, exchange.value, df)
+        saved = self.store.save_fundamentals(symbol, exchange.value, df)
+        self._load_cached.cache_clear()
+        return saved
+    
+    def import_fundamentals_batch(self, provider, symbols: List[str], exchange: Exchange,
+                                  start: pd.Timestamp, end: pd.Timestamp,
+                                  max_workers: int = 4) -> int:
+        """
+        批量导入多只股票的基本面数据
+        
+        拉取在线程池中并行执行（IO密集），拉取完成后逐只股票保存。
+        
+        Args:
+            provider: 数据提供者实例
+            symbols: 股票代码列表
+            exchange: 交易所
+            start: 开始日期
+            end: 结束日期
+            max_workers: 并发拉取的线程数（受数据源限流约束）
+            
+        Returns:
+            导入的总记录数
+            
+        Raises:
+            RuntimeError: 如果store未设置
+        """
+        if self.store is None:
+            raise RuntimeError("Store未设置，请先调用set_store()")
+        
+        symbols = [self._validate_symbol(s) for s in symbols]
+        self._validate_date_range(start, end)
+        if not symbols:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            results = list(executor.map(
+                lambda symbol: provider.query_fundamentals(symbol, exchange, start, end), symbols
+            ))
+        
+        saved = sum(
+            self.store.save_fundamentals(symbol, exchange.value, fundamentals_to_df(data_list))
+            for symbol, data_list in zip(symbols, results)
+        )
+        self._load_cached.cache_clear()
+        return saved
     
     # ========== 基本面数据查询 ==========
     def load_fundamentals(self, symbol: str, exchange: Exchange,
                          start: Optional[pd.Timestamp] = None,
-                         end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+                         end: Optional[pd.Timestamp] = None,
+                         columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         加载基本面数据
         
@@ -77,6 +162,7 @@ class FundamentalDataService(BaseDataService):
             exchange: 交易所
             start: 开始日期（可选）
             end: 结束日期（可选）
+            columns: 只读取的列（可选，存储支持时下推做列裁剪，否则返回全部列）
             
         Returns:
             基本面数据DataFrame
@@ -90,7 +176,25 @@ class FundamentalDataService(BaseDataService):
         symbol = self._validate_symbol(symbol)
         self._validate_date_range(start, end)
         
-        return self.store.load_fundamentals(symbol, exchange.value, start, end)
+        # 存储不支持列裁剪时按全量加载缓存，由调用方自行选列
+        key_columns = tuple(columns) if columns is not None and self._store_columns else None
+        version_of = getattr(self.store, 'fundamentals_version', None)
+        if version_of is None:
+            # 存储无法提供版本签名时不缓存
+            return self._load_fundamentals_uncached(symbol, exchange, start, end, key_columns, None)
+        version = version_of(symbol, exchange.value)
+        # 返回副本，避免调用方修改缓存中的DataFrame
+        return self._load_cached(symbol, exchange, start, end, key_columns, version).copy()
+    
+    def _load_fundamentals_uncached(self, symbol: str, exchange: Exchange,
+                                    start: Optional[pd.Timestamp],
+                                    end: Optional[pd.Timestamp],
+                                    columns: Optional[Tuple[str, ...]],
+                                    version: Optional[tuple]) -> pd.DataFrame:
+        """从存储加载基本面数据（供缓存复用；version 仅参与缓存键）"""
+        if columns is None:
+            return self.store.load_fundamentals(symbol, exchange.value, start, end)
+        return self.store.load_fundamentals(symbol, exchange.value, start, end, columns=list(columns))
     
     # ========== 便捷方法 ==========
     def get_fundamentals_at_date(self, symbol: str, exchange: Exchange,
@@ -106,10 +210,7 @@ class FundamentalDataService(BaseDataService):
         Returns:
             基本面数据（Series格式）
         """
-        df = self.load_fundamentals(symbol, exchange, end=date)
-        if df.empty:
-            return pd.Series()
-        return df.iloc[-1]
+        return self._load_latest(symbol, exchange, date)
     
     def get_latest_fundamentals(self, symbol: str, exchange: Exchange) -> pd.Series:
         """
@@ -122,7 +223,21 @@ class FundamentalDataService(BaseDataService):
         Returns:
             最新基本面数据（Series格式）
         """
-        df = self.load_fundamentals(symbol, exchange)
+        return self._load_latest(symbol, exchange)
+    
+    def _load_latest(self, symbol: str, exchange: Exchange,
+                     asof: Optional[pd.Timestamp] = None) -> pd.Series:
+        """
+        读取截至 asof 的最新一条基本面数据
+        
+        存储实现了 load_fundamentals_latest 时直接取单行，否则退回加载历史后取末行。
+        """
+        load_latest = getattr(self.store, 'load_fundamentals_latest', None)
+        if load_latest is None:
+            df = self.load_fundamentals(symbol, exchange, end=asof)
+        else:
+            symbol = self._validate_symbol(symbol)
+            df = load_latest(symbol, exchange.value, asof)
         if df.empty:
             return pd.Series()
         return df.iloc[-1]
@@ -142,15 +257,12 @@ class FundamentalDataService(BaseDataService):
         Returns:
             估值指标DataFrame
         """
-        df = self.load_fundamentals(symbol, exchange, start, end)
+        df = self.load_fundamentals(symbol, exchange, start, end, columns=VALUATION_COLUMNS)
         if df.empty:
             return pd.DataFrame()
         
         # 选择估值相关列
-        valuation_cols = ['date', 'pe_ratio', 'pe_ttm', 'pb_ratio', 'ps_ratio', 'pcf_ratio']
-        available_cols = [col for col in valuation_cols if col in df.columns]
-        
-        return df[available_cols]
+        return _select_columns(df, VALUATION_COLUMNS)
     
     def get_profitability_metrics(self, symbol: str, exchange: Exchange,
                                   start: Optional[pd.Timestamp] = None,
@@ -167,15 +279,12 @@ class FundamentalDataService(BaseDataService):
         Returns:
             盈利能力指标DataFrame
         """
-        df = self.load_fundamentals(symbol, exchange, start, end)
+        df = self.load_fundamentals(symbol, exchange, start, end, columns=PROFITABILITY_COLUMNS)
         if df.empty:
             return pd.DataFrame()
         
         # 选择盈利能力相关列
-        profitability_cols = ['date', 'roe', 'roa', 'roic', 'gross_margin', 'net_margin', 'operating_margin']
-        available_cols = [col for col in profitability_cols if col in df.columns]
-        
-        return df[available_cols]
+        return _select_columns(df, PROFITABILITY_COLUMNS)
     
     def get_growth_metrics(self, symbol: str, exchange: Exchange,
                           start: Optional[pd.Timestamp] = None,
@@ -192,15 +301,12 @@ class FundamentalDataService(BaseDataService):
         Returns:
             成长性指标DataFrame
         """
-        df = self.load_fundamentals(symbol, exchange, start, end)
+        df = self.load_fundamentals(symbol, exchange, start, end, columns=GROWTH_COLUMNS)
         if df.empty:
             return pd.DataFrame()
         
         # 选择成长性相关列
-        growth_cols = ['date', 'revenue_growth', 'revenue_growth_qoq', 'profit_growth', 'profit_growth_qoq']
-        available_cols = [col for col in growth_cols if col in df.columns]
-        
-        return df[available_cols]
+        return _select_columns(df, GROWTH_COLUMNS)
     
     def calculate_valuation_percentile(self, symbol: str, exchange: Exchange,
                                       metric: str = 'pe_ratio',
@@ -217,15 +323,13 @@ class FundamentalDataService(BaseDataService):
         Returns:
             包含百分位的DataFrame
         """
-        df = self.load_fundamentals(symbol, exchange)
+        df = self.load_fundamentals(symbol, exchange, columns=['date', metric])
         if df.empty or metric not in df.columns:
             return pd.DataFrame()
         
         # 计算滚动百分位
         result = df[['date', metric]].copy()
-        result[f'{metric}_percentile'] = df[metric].rolling(window=window, min_periods=1).apply(
-            lambda x: (x.iloc[-1] <= x).sum() / len(x) * 100
-        )
+        result[f'{metric}_percentile'] = rolling_pct_rank(df[metric].to_numpy(dtype=float, na_value=float('nan')), window)
         
         return result
 
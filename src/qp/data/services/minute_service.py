@@ -253,7 +253,8 @@ class MinuteDataService(BaseDataService):
                 "volume_total": 0.0
             }
         
-        df = bars_to_df(bars)
+        # 存储层读出的数据已按时间去重
+        df = bars_to_df(bars, deduplicate=False)
         
         if df.empty:
             return {
@@ -167,6 +167,14 @@ class BarReader:
             df["date"] = pd.to_datetime(df["date"])
         
         return df
+    
+    def query_arrow(self, files: List[str],
+                    start: Optional[pd.Timestamp] = None,
+                    end: Optional[pd.Timestamp] = None,
+                    columns: Optional[List[str]] = None) -> pa.Table:
+        """执行查询并直接返回Arrow表，跳过pandas中间层"""
+        query, params = self._build_query(files, columns, start, end)
+        return self.conn.execute(query, params).fetch_arrow_table()
 
 
 def load_multi_bars(
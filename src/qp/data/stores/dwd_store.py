@@ -160,7 +160,8 @@ class DWDStore(BaseStore):
     
     def load_fundamental(self, exchange: str, symbol: str,
                         start_date: Optional[pd.Timestamp] = None,
-                        end_date: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+                        end_date: Optional[pd.Timestamp] = None,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         加载规整基本面数据
         
@@ -169,6 +170,7 @@ class DWDStore(BaseStore):
             symbol: 股票代码
             start_date: 开始日期
             end_date: 结束日期
+            columns: 只读取的列（可选，date 列始终读取；文件中不存在的列忽略）
             
         Returns:
             规整基本面数据DataFrame
@@ -178,7 +180,11 @@ class DWDStore(BaseStore):
         if not store_path.exists():
             return pd.DataFrame()
         
-        df = pd.read_parquet(store_path)
+        if columns is not None:
+            # 列裁剪：只从Parquet读取需要的列
+            present = set(pq.read_schema(store_path).names)
+            columns = [c for c in dict.fromkeys(['date', *columns]) if c in present]
+        df = pd.read_parquet(store_path, columns=columns)
         df['date'] = pd.to_datetime(df['date'])
         
         # 时间过滤
@@ -189,6 +195,75 @@ class DWDStore(BaseStore):
         
         return df.sort_values('date')
     
+    def load_fundamentals(self, symbol: str, exchange: str,
+                          start: Optional[pd.Timestamp] = None,
+                          end: Optional[pd.Timestamp] = None,
+                          columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        加载规整基本面数据（FundamentalDataService 的存储接口）
+        
+        Args:
+            symbol: 股票代码
+            exchange: 交易所代码
+            start: 开始日期
+            end: 结束日期
+            columns: 只读取的列（可选）
+            
+        Returns:
+            规整基本面数据DataFrame
+        """
+        return self.load_fundamental(exchange, symbol, start, end, columns=columns)
+    
+    def fundamentals_version(self, symbol: str, exchange: str) -> tuple:
+        """
+        规整基本面文件的版本签名（FundamentalDataService 的缓存接口）
+        
+        Args:
+            symbol: 股票代码
+            exchange: 交易所代码
+            
+        Returns:
+            (mtime, 文件大小)，文件不存在时为空元组；任一写入后签名即变化
+        """
+        try:
+            st = os.stat(self.root / "fundamental" / exchange / f"{symbol}.parquet")
+        except FileNotFoundError:
+            return ()
+        return (st.st_mtime_ns, st.st_size)
+    
+    def load_fundamentals_latest(self, symbol: str, exchange: str,
+                                 asof: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        加载截至指定日期的最新一条规整基本面数据（FundamentalDataService 的存储接口）
+        
+        文件按 date 升序写入，从最后一个行组向前读取，找到即返回，不读取全量历史。
+        
+        Args:
+            symbol: 股票代码
+            exchange: 交易所代码
+            asof: 截止日期（可选，默认取最新一条）
+            
+        Returns:
+            单行DataFrame（无数据时为空DataFrame）
+        """
+        store_path = self.root / "fundamental" / exchange / f"{symbol}.parquet"
+        
+        if not store_path.exists():
+            return pd.DataFrame()
+        
+        pf = pq.ParquetFile(store_path)
+        for i in range(pf.num_row_groups - 1, -1, -1):
+            df = pf.read_row_group(i).to_pandas()
+            if df.empty:
+                continue
+            df['date'] = pd.to_datetime(df['date'])
+            if asof is not None:
+                df = df[df['date'] <= asof]
+            if not df.empty:
+                return df.iloc[[-1]]
+        
+        return pd.DataFrame()
+    
     def _prepare_fundamental_dataframe(self, fundamental_data: List[DWDFundamentalData]) -> pd.DataFrame:
         """准备基本面数据DataFrame"""
         if not fundamental_data:
@@ -7,22 +7,49 @@
 
 from __future__ import annotations
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 import duckdb
 
 from .base import StoreConfig, BaseStore, ManifestIndex
 from ..types.third_party import (
     IndexComponentData, IndustryClassificationData, MacroData,
+    INDEX_COMPONENT_SCHEMA, INDUSTRY_CLASSIFICATION_SCHEMA, MACRO_DATA_SCHEMA,
     index_components_to_df, df_to_index_components,
     industry_classifications_to_df, df_to_industry_classifications,
     macro_data_to_df, df_to_macro_data
 )
 
 
+# ========== 写入参数 ==========
+# 低基数字符串列，使用字典编码
+DICTIONARY_COLUMNS = [
+    'symbol', 'index_code', 'industry_standard', 'industry_level',
+    'data_code', 'data_type', 'frequency'
+]
+COMPRESSION_LEVEL = 3
+MAX_ROW_GROUP_SIZE = 128_000
+DATA_PAGE_SIZE = 1 << 20
+# 并行重建清单索引的最大线程数
+MANIFEST_WORKERS = 8
+# load_* 查询结果的LRU缓存容量
+QUERY_CACHE_SIZE = 128
+
+# Hive分区布局（key=value 目录），分区列由目录名提供，不再写入文件
+HIVE_PART_TEMPLATE = "part-{i}.parquet"
+HIVE_READ_OPTIONS = "union_by_name=true, hive_partitioning=true, hive_types_autocast=false"
+
+
+def _hive_dir(root: str | Path, **partitions: Any) -> str:
+    """构建Hive分区目录，如 root/data_type=cpi/frequency=monthly（字符串路径，避免Path对象开销）"""
+    return os.path.join(root, *[f"{key}={value}" for key, value in partitions.items()])
+
+
 class ThirdPartyStore(BaseStore):
     """第三方数据存储基类"""
     
@@ -31,16 +58,145 @@ class ThirdPartyStore(BaseStore):
         self.index_component_dir = self.root / "index_components"
         self.industry_classification_dir = self.root / "industry_classifications"
         self.macro_data_dir = self.root / "macro_data"
-        self._ensure_directories()
+        # 目录列表缓存: path -> (st_mtime_ns, parquet文件列表, 子目录列表)
+        self._listing_cache: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        # 查询结果LRU缓存: 查询键 -> (文件mtime签名, 结果列表)
+        self._query_cache: OrderedDict[Tuple, Tuple[Tuple, List[Any]]] = OrderedDict()
+        # 目录在首次写入时由 write_dataset 按需创建；读取路径容忍目录不存在
     
-    def _ensure_directories(self):
-        """确保所有必要的目录存在"""
-        for directory in [
-            self.index_component_dir,
-            self.industry_classification_dir,
-            self.macro_data_dir
-        ]:
-            directory.mkdir(parents=True, exist_ok=True)
+    def _scan_dir(self, dir_path: str | Path) -> Tuple[List[str], List[str]]:
+        """
+        单次os.scandir遍历目录，返回(parquet文件列表, 子目录列表)
+
+        结果按目录mtime缓存，目录内容变化后自动失效
+        """
+        path = os.fspath(dir_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._listing_cache.pop(path, None)
+            return [], []
+        
+        cached = self._listing_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        
+        files, subdirs = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.parquet'):
+                    files.append(entry.path)
+        files.sort()
+        subdirs.sort()
+        
+        self._listing_cache[path] = (mtime_ns, files, subdirs)
+        return files, subdirs
+    
+    def _scan_parquet(self, dir_path: str | Path) -> List[str]:
+        """列出目录下的Parquet文件"""
+        return self._scan_dir(dir_path)[0]
+    
+    def _list_subdirs(self, dir_path: str | Path) -> List[str]:
+        """列出目录下的子目录"""
+        return self._scan_dir(dir_path)[1]
+    
+    def _walk_parquet(self, dir_path: str | Path) -> List[str]:
+        """递归列出目录树下的Parquet文件（复用按目录缓存的列表）"""
+        files, subdirs = self._scan_dir(dir_path)
+        result = list(files)
+        for subdir in subdirs:
+            result.extend(self._walk_parquet(subdir))
+        return result
+    
+    def _cached_query(self, key: Tuple, file_paths: List[str],
+                      loader: Callable[[], List[Any]]) -> List[Any]:
+        """
+        带LRU缓存的查询
+
+        以涉及文件的(路径, mtime)作为签名，任一文件增删或改写后缓存自动失效
+        """
+        try:
+            signature = tuple((p, os.stat(p).st_mtime_ns) for p in file_paths)
+        except FileNotFoundError:
+            # 列表与磁盘不一致（并发写入中），直接查询不缓存
+            return loader()
+        
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            self._query_cache.move_to_end(key)
+            return list(cached[1])
+        
+        result = loader()
+        self._query_cache[key] = (signature, result)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return list(result)
+    
+    def _refresh_manifests(self, dirs: set[Path]) -> None:
+        """
+        每个写入过的目录只重建一次清单索引
+
+        各目录互不相关，读取Parquet元数据时pyarrow会释放GIL，故按目录并行重建
+        """
+        def refresh(part_dir: Path) -> None:
+            manifest_index = ManifestIndex(part_dir)
+            manifest_index.save_atomically(manifest_index.build_from_files())
+        
+        if len(dirs) <= 1:
+            for part_dir in dirs:
+                refresh(part_dir)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(MANIFEST_WORKERS, len(dirs))) as executor:
+            # list() 触发迭代以便抛出工作线程中的异常
+            list(executor.map(refresh, dirs))
+    
+    def _write_dataset(self, df: pd.DataFrame, base_dir: Path, schema: pa.Schema,
+                       partitioning: Dict[str, pa.DataType], sort_by: str | List[str],
+                       basename_template: str,
+                       existing_data_behavior: str = "overwrite_or_ignore") -> set[Path]:
+        """
+        按Hive分区写入Parquet数据集，返回写入过的分区目录
+
+        分区与写文件由pyarrow.dataset在C++侧单次扫描完成；按聚簇列排序后写入，
+        配合字典编码和列统计信息，便于DuckDB按min/max裁剪行组
+        """
+        df = df.sort_values(sort_by, kind="mergesort")
+        # 列类型沿用类型模块中的Schema，分区列按分区类型写入（如宏观数据派生的 year 列）
+        for name, typ in partitioning.items():
+            i = schema.get_field_index(name)
+            schema = schema.set(i, pa.field(name, typ)) if i >= 0 else schema.append(pa.field(name, typ))
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        
+        file_columns = [c for c in table.column_names if c not in partitioning]
+        dictionary_cols = [c for c in DICTIONARY_COLUMNS if c in file_columns]
+        file_options = ds.ParquetFileFormat().make_write_options(
+            compression=self.config.compression,
+            compression_level=COMPRESSION_LEVEL if self.config.compression == "zstd" else None,
+            use_dictionary=dictionary_cols if self.config.use_dictionary else False,
+            data_page_size=DATA_PAGE_SIZE,
+            write_statistics=True
+        )
+        ds.write_dataset(
+            table,
+            base_dir=str(base_dir),
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema(list(partitioning.items())), flavor="hive"),
+            basename_template=basename_template,
+            existing_data_behavior=existing_data_behavior,
+            file_options=file_options,
+            max_rows_per_group=MAX_ROW_GROUP_SIZE,
+            preserve_order=True
+        )
+        
+        keys = df[list(partitioning)].drop_duplicates()
+        return {
+            Path(_hive_dir(base_dir, **dict(zip(partitioning, key))))
+            for key in keys.itertuples(index=False, name=None)
+        }
 
 
 class IndexComponentStore(ThirdPartyStore):
@@ -49,6 +205,7 @@ class IndexComponentStore(ThirdPartyStore):
     def __init__(self, config: StoreConfig):
         super().__init__(config)
         self.data_dir = self.index_component_dir
+        self._data_root = str(self.data_dir)
     
     def save_index_components(self, components: List[IndexComponentData]) -> int:
         """保存指数成分数据"""
@@ -58,73 +215,68 @@ class IndexComponentStore(ThirdPartyStore):
         # 转换为DataFrame
         df = index_components_to_df(components)
         
-        # 按指数代码分组保存
-        saved_count = 0
-        for index_code, group_df in df.groupby('index_code'):
-            # 创建索引代码目录
-            index_dir = self.data_dir / index_code
-            index_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 生成文件名（按日期）
-            date_str = pd.Timestamp.now().strftime('%Y%m%d')
-            file_path = index_dir / f"{index_code}_{date_str}.parquet"
-            
-            # 保存为Parquet文件
-            table = pa.Table.from_pandas(group_df)
-            pq.write_table(table, file_path)
-            
-            # 更新清单索引
-            manifest_index = ManifestIndex(index_dir)
-            manifest = manifest_index.build_from_files()
-            manifest_index.save_atomically(manifest)
-            
-            saved_count += len(group_df)
-        
-        return saved_count
-    
-    def load_index_components(self, index_code: str, 
-                            effective_date: Optional[str] = None) -> List[IndexComponentData]:
-        """加载指数成分数据"""
-        index_dir = self.data_dir / index_code
+        # 按指数代码分区保存: index_code=*/{日期}_{i}.parquet
+        date_str = pd.Timestamp.now().strftime('%Y%m%d')
+        dirs_touched = self._write_dataset(
+            df, self.data_dir, INDEX_COMPONENT_SCHEMA,
+            partitioning={'index_code': pa.string()},
+            sort_by='symbol',
+            basename_template=f"{date_str}_{{i}}.parquet"
+        )
         
-        if not index_dir.exists():
-            return []
+        # 更新清单索引
+        self._refresh_manifests(dirs_touched)
         
-        # 读取所有Parquet文件
-        files = list(index_dir.glob("*.parquet"))
-        if not files:
+        return len(df)
+    
+    def _query_index_components(self, index_code: str, where: List[str], params: List[Any],
+                                limit: Optional[int] = None) -> List[IndexComponentData]:
+        """在DuckDB侧完成过滤、排序和截断"""
+        # 读取分区下所有Parquet文件
+        file_paths = self._scan_parquet(_hive_dir(self._data_root, index_code=index_code))
+        if not file_paths:
             return []
         
-        # 使用DuckDB查询
-        conn = duckdb.connect()
-        
-        # 将Path对象转换为字符串列表
-        file_paths = [str(f) for f in files]
-        
+        conditions = " AND ".join(["index_code = ?"] + where)
         query = f"""
-        SELECT * FROM read_parquet({file_paths})
-        WHERE index_code = '{index_code}'
+        SELECT * FROM read_parquet(?, {HIVE_READ_OPTIONS})
+        WHERE {conditions}
+        ORDER BY weight DESC
         """
+        key = ('index', index_code, tuple(where), tuple(params), limit)
+        params = [file_paths, index_code] + params
         
-        if effective_date:
-            query += f" AND effective_date >= '{effective_date}'"
-        
-        query += " ORDER BY weight DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        df = conn.execute(query).df()
-        conn.close()
+        def load() -> List[IndexComponentData]:
+            # 使用DuckDB查询
+            conn = duckdb.connect()
+            try:
+                df = conn.execute(query, params).df()
+            finally:
+                conn.close()
+            return df_to_index_components(df)
         
-        return df_to_index_components(df)
+        return self._cached_query(key, file_paths, load)
+    
+    def load_index_components(self, index_code: str, 
+                            effective_date: Optional[str] = None) -> List[IndexComponentData]:
+        """加载指数成分数据"""
+        if effective_date:
+            return self._query_index_components(
+                index_code, ["effective_date >= ?"], [pd.Timestamp(effective_date)]
+            )
+        return self._query_index_components(index_code, [], [])
     
     def get_index_components_by_weight(self, index_code: str, min_weight: float = 0.01) -> List[IndexComponentData]:
         """获取权重大于指定值的成分股"""
-        components = self.load_index_components(index_code)
-        return [comp for comp in components if comp.weight >= min_weight]
+        return self._query_index_components(index_code, ["weight >= ?"], [min_weight])
     
     def get_top_components(self, index_code: str, top_n: int = 10) -> List[IndexComponentData]:
         """获取权重排名前N的成分股"""
-        components = self.load_index_components(index_code)
-        return sorted(components, key=lambda x: x.weight, reverse=True)[:top_n]
+        return self._query_index_components(index_code, [], [], limit=top_n)
 
 
 class IndustryClassificationStore(ThirdPartyStore):
@@ -133,6 +285,7 @@ class IndustryClassificationStore(ThirdPartyStore):
     def __init__(self, config: StoreConfig):
         super().__init__(config)
         self.data_dir = self.industry_classification_dir
+        self._data_root = str(self.data_dir)
     
     def save_industry_classifications(self, classifications: List[IndustryClassificationData]) -> int:
         """保存行业分类数据"""
@@ -142,84 +295,69 @@ class IndustryClassificationStore(ThirdPartyStore):
         # 转换为DataFrame
         df = industry_classifications_to_df(classifications)
         
-        # 按行业标准分组保存
-        saved_count = 0
-        for (industry_standard, industry_level), group_df in df.groupby(['industry_standard', 'industry_level']):
-            # 创建目录结构
-            standard_dir = self.data_dir / industry_standard
-            level_dir = standard_dir / industry_level
-            level_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 生成文件名
-            date_str = pd.Timestamp.now().strftime('%Y%m%d')
-            file_path = level_dir / f"{industry_standard}_{industry_level}_{date_str}.parquet"
-            
-            # 保存为Parquet文件
-            table = pa.Table.from_pandas(group_df)
-            pq.write_table(table, file_path)
-            
-            # 更新清单索引
-            manifest_index = ManifestIndex(level_dir)
-            manifest = manifest_index.build_from_files()
-            manifest_index.save_atomically(manifest)
-            
-            saved_count += len(group_df)
-        
-        return saved_count
+        # 按行业标准和级别分区保存: industry_standard=*/industry_level=*/{日期}_{i}.parquet
+        date_str = pd.Timestamp.now().strftime('%Y%m%d')
+        dirs_touched = self._write_dataset(
+            df, self.data_dir, INDUSTRY_CLASSIFICATION_SCHEMA,
+            partitioning={'industry_standard': pa.string(), 'industry_level': pa.string()},
+            sort_by='symbol',
+            basename_template=f"{date_str}_{{i}}.parquet"
+        )
+        
+        # 更新清单索引
+        self._refresh_manifests(dirs_touched)
+        
+        return len(df)
     
     def load_industry_classifications(self, symbol: str,
                                     industry_standard: Optional[str] = None,
                                     industry_level: Optional[str] = None) -> List[IndustryClassificationData]:
         """加载行业分类数据"""
-        classifications = []
-        
         # 确定搜索范围
         if industry_standard and industry_level:
-            search_dirs = [self.data_dir / industry_standard / industry_level]
+            search_dirs = [_hive_dir(self._data_root, industry_standard=industry_standard,
+                                     industry_level=industry_level)]
         elif industry_standard:
-            search_dirs = [self.data_dir / industry_standard / level for level in ['level1', 'level2', 'level3', 'level4']]
+            search_dirs = self._list_subdirs(_hive_dir(self._data_root, industry_standard=industry_standard))
         else:
             search_dirs = []
-            for std_dir in self.data_dir.iterdir():
-                if std_dir.is_dir():
-                    for level_dir in std_dir.iterdir():
-                        if level_dir.is_dir():
-                            search_dirs.append(level_dir)
+            for std_dir in self._list_subdirs(self._data_root):
+                search_dirs.extend(self._list_subdirs(std_dir))
         
-        # 搜索所有相关目录
+        # 汇总所有相关目录下的文件
+        file_paths = []
         for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-            
-            files = list(search_dir.glob("*.parquet"))
-            if not files:
-                continue
-            
-            # 使用DuckDB查询
+            file_paths.extend(self._scan_parquet(search_dir))
+        
+        if not file_paths:
+            return []
+        
+        # 使用DuckDB一次性扫描所有文件
+        query = f"""
+        SELECT * FROM read_parquet(?, {HIVE_READ_OPTIONS})
+        WHERE symbol = ?
+        """
+        params: List[Any] = [file_paths, symbol]
+        
+        if industry_standard:
+            query += " AND industry_standard = ?"
+            params.append(industry_standard)
+        if industry_level:
+            query += " AND industry_level = ?"
+            params.append(industry_level)
+        
+        query += " ORDER BY industry_standard, industry_level"
+        
+        def load() -> List[IndustryClassificationData]:
             conn = duckdb.connect()
-            
-            # 将Path对象转换为字符串列表
-            file_paths = [str(f) for f in files]
-            
-            query = f"""
-            SELECT * FROM read_parquet({file_paths})
-            WHERE symbol = '{symbol}'
-            """
-            
-            if industry_standard:
-                query += f" AND industry_standard = '{industry_standard}'"
-            if industry_level:
-                query += f" AND industry_level = '{industry_level}'"
-            
-            query += " ORDER BY industry_level"
-            
-            df = conn.execute(query).df()
-            conn.close()
-            
-            if not df.empty:
-                classifications.extend(df_to_industry_classifications(df))
-        
-        return classifications
+            try:
+                df = conn.execute(query, params).df()
+            finally:
+                conn.close()
+            return df_to_industry_classifications(df) if not df.empty else []
+        
+        key = ('industry', symbol, industry_standard, industry_level)
+        return self._cached_query(key, file_paths, load)
     
     def get_industry_by_level(self, symbol: str, level: str,
                             industry_standard: Optional[str] = None) -> Optional[IndustryClassificationData]:
@@ -234,138 +372,99 @@ class MacroDataStore(ThirdPartyStore):
     def __init__(self, config: StoreConfig):
         super().__init__(config)
         self.data_dir = self.macro_data_dir
+        self._data_root = str(self.data_dir)
     
     def save_macro_data(self, macro_data: List[MacroData]) -> int:
         """保存宏观数据"""
         if not macro_data:
             return 0
         
-        # 转换为DataFrame
+        # 转换为DataFrame，并派生年份分区列
         df = macro_data_to_df(macro_data)
+        df['year'] = df['date'].dt.year.astype('int32')
+        
+        # 按数据类型、频率、年份分区保存: data_type=*/frequency=*/year=*/part-{i}.parquet
+        # 写入的年份分区整体替换，与按年覆盖文件的语义一致
+        dirs_touched = self._write_dataset(
+            df, self.data_dir, MACRO_DATA_SCHEMA,
+            partitioning={'data_type': pa.string(), 'frequency': pa.string(), 'year': pa.int32()},
+            sort_by=['data_code', 'date'],
+            basename_template=HIVE_PART_TEMPLATE,
+            existing_data_behavior="delete_matching"
+        )
         
-        # 按数据类型和频率分组保存
-        saved_count = 0
-        for (data_type, frequency), group_df in df.groupby(['data_type', 'frequency']):
-            # 创建目录结构
-            type_dir = self.data_dir / data_type
-            freq_dir = type_dir / frequency
-            freq_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 按年份分组保存
-            for year, year_df in group_df.groupby(group_df['date'].dt.year):
-                file_path = freq_dir / f"{data_type}_{frequency}_{year}.parquet"
-                
-                # 保存为Parquet文件
-                table = pa.Table.from_pandas(year_df)
-                pq.write_table(table, file_path)
-                
-                # 更新清单索引
-                manifest_index = ManifestIndex(freq_dir)
-                manifest = manifest_index.build_from_files()
-                manifest_index.save_atomically(manifest)
-                
-                saved_count += len(year_df)
-        
-        return saved_count
+        # 更新清单索引
+        self._refresh_manifests(dirs_touched)
+        
+        return len(df)
     
-    def load_macro_data(self, data_code: str, start_date: Optional[str] = None,
-                       end_date: Optional[str] = None, data_type: Optional[str] = None) -> List[MacroData]:
-        """加载宏观数据"""
-        macro_data = []
+    def _query_macro(self, data_type: Optional[str], where: List[str], params: List[Any],
+                     start_date: Optional[str], end_date: Optional[str],
+                     latest_only: bool = False) -> List[MacroData]:
+        """
+        按Hive分区扫描宏观数据
+
+        data_type/year 为分区列，DuckDB在打开文件前即可按目录裁剪；
+        latest_only 时只取日期最新的一条（SQL侧 Top-1）
+        """
+        key = ('macro', data_type, tuple(where), tuple(params), start_date, end_date, latest_only)
+        
+        # 数据文件列表（用于缓存签名）
+        search_root = (_hive_dir(self._data_root, data_type=data_type)
+                       if data_type else self._data_root)
+        file_paths = self._walk_parquet(search_root)
+        if not file_paths:
+            return []
         
-        # 确定搜索范围
         if data_type:
-            search_dirs = [self.data_dir / data_type]
-        else:
-            search_dirs = [d for d in self.data_dir.iterdir() if d.is_dir()]
-        
-        # 搜索所有相关目录
-        for type_dir in search_dirs:
-            if not type_dir.exists():
-                continue
-            
-            for freq_dir in type_dir.iterdir():
-                if not freq_dir.is_dir():
-                    continue
-                
-                files = list(freq_dir.glob("*.parquet"))
-                if not files:
-                    continue
-                
-                # 使用DuckDB查询
-                conn = duckdb.connect()
-                
-                # 将Path对象转换为字符串列表
-                file_paths = [str(f) for f in files]
-                
-                query = f"""
-                SELECT * FROM read_parquet({file_paths})
-                WHERE data_code = '{data_code}'
-                """
-                
-                if start_date:
-                    query += f" AND date >= '{start_date}'"
-                if end_date:
-                    query += f" AND date <= '{end_date}'"
-                
-                query += " ORDER BY date"
-                
-                df = conn.execute(query).df()
+            where = where + ["data_type = ?"]
+            params = params + [data_type]
+        if start_date:
+            start = pd.Timestamp(start_date)
+            where = where + ["year >= ?", "date >= ?"]
+            params = params + [start.year, start]
+        if end_date:
+            end = pd.Timestamp(end_date)
+            where = where + ["year <= ?", "date <= ?"]
+            params = params + [end.year, end]
+        
+        pattern = os.path.join(self._data_root, "**", "*.parquet")
+        conditions = " AND ".join(where) or "TRUE"
+        order = "ORDER BY date DESC LIMIT 1" if latest_only else "ORDER BY date"
+        query = f"""
+        SELECT * FROM read_parquet(?, {HIVE_READ_OPTIONS}, hive_types={{'year': INTEGER}})
+        WHERE {conditions}
+        {order}
+        """
+        
+        def load() -> List[MacroData]:
+            conn = duckdb.connect()
+            try:
+                df = conn.execute(query, [pattern] + params).df()
+            except duckdb.IOException:
+                # 尚无任何数据文件
+                return []
+            finally:
                 conn.close()
-                
-                if not df.empty:
-                    macro_data.extend(df_to_macro_data(df))
+            return df_to_macro_data(df) if not df.empty else []
         
-        return macro_data
+        return self._cached_query(key, file_paths, load)
+    
+    def load_macro_data(self, data_code: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, data_type: Optional[str] = None) -> List[MacroData]:
+        """加载宏观数据"""
+        return self._query_macro(data_type, ["data_code = ?"], [data_code], start_date, end_date)
     
     def get_latest_macro_data(self, data_code: str) -> Optional[MacroData]:
         """获取最新的宏观数据"""
-        macro_data = self.load_macro_data(data_code)
-        if macro_data:
-            return max(macro_data, key=lambda x: x.date)
-        return None
+        macro_data = self._query_macro(None, ["data_code = ?"], [data_code], None, None,
+                                       latest_only=True)
+        return macro_data[0] if macro_data else None
     
     def get_macro_data_by_type(self, data_type: str, start_date: Optional[str] = None,
                               end_date: Optional[str] = None) -> List[MacroData]:
         """按数据类型获取宏观数据"""
-        type_dir = self.data_dir / data_type
-        if not type_dir.exists():
-            return []
-        
-        macro_data = []
-        for freq_dir in type_dir.iterdir():
-            if not freq_dir.is_dir():
-                continue
-            
-            files = list(freq_dir.glob("*.parquet"))
-            if not files:
-                continue
-            
-            # 使用DuckDB查询
-            conn = duckdb.connect()
-            
-            # 将Path对象转换为字符串列表
-            file_paths = [str(f) for f in files]
-            
-            query = f"""
-            SELECT * FROM read_parquet({file_paths})
-            WHERE data_type = '{data_type}'
-            """
-            
-            if start_date:
-                query += f" AND date >= '{start_date}'"
-            if end_date:
-                query += f" AND date <= '{end_date}'"
-            
-            query += " ORDER BY date"
-            
-            df = conn.execute(query).df()
-            conn.close()
-            
-            if not df.empty:
-                macro_data.extend(df_to_macro_data(df))
-        
-        return macro_data
+        return self._query_macro(data_type, [], [], start_date, end_date)
 
 
 def get_third_party_store(config: Optional[StoreConfig] = None) -> ThirdPartyStore:
@@ -13,6 +13,7 @@ from .common import (
     Exchange,
     Interval,
     _to_utc,
+    _to_utc_series,
     _get_enum_value,
 )
 
@@ -21,8 +22,12 @@ from .bar import (
     BarData,
     BAR_COLUMNS,
     BAR_DTYPES,
+    BAR_SCHEMA,
+    BarBatch,
     bars_to_df,
     df_to_bars,
+    df_to_bars_arrow,
+    bars_to_arrow,
 )
 
 # ========== 财务数据相关 ==========
@@ -32,6 +37,7 @@ from .financial import (
     ReportPeriod,
     FINANCIAL_COLUMNS,
     financials_to_df,
+    financials_to_arrow,
     df_to_financials,
 )
 
@@ -40,6 +46,7 @@ from .fundamental import (
     FundamentalData,
     FUNDAMENTAL_COLUMNS,
     fundamentals_to_df,
+    fundamentals_to_arrow,
     df_to_fundamentals,
 )
 
@@ -53,6 +60,10 @@ from .derivative import (
     AnnouncementData, NewsSentimentData, ResearchReportData,
     CapitalFlowData, ThemeData, DragonTigerData,
     
+    # 列式批量容器
+    AnnouncementBatch, NewsSentimentBatch, ResearchReportBatch,
+    CapitalFlowBatch, ThemeBatch, DragonTigerBatch,
+    
     # 转换函数
     announcements_to_df, df_to_announcements,
     news_sentiments_to_df, df_to_news_sentiments,
@@ -60,11 +71,15 @@ from .derivative import (
     capital_flows_to_df, df_to_capital_flows,
     themes_to_df, df_to_themes,
     dragon_tigers_to_df, df_to_dragon_tigers,
+    announcements_to_arrow, news_sentiments_to_arrow, research_reports_to_arrow,
+    capital_flows_to_arrow, themes_to_arrow, dragon_tigers_to_arrow,
     
     # 常量
     ANNOUNCEMENT_COLUMNS, NEWS_SENTIMENT_COLUMNS, RESEARCH_REPORT_COLUMNS,
     CAPITAL_FLOW_COLUMNS, THEME_COLUMNS, DRAGON_TIGER_COLUMNS,
     DERIVATIVE_DTYPES,
+    ANNOUNCEMENT_SCHEMA, NEWS_SENTIMENT_SCHEMA, RESEARCH_REPORT_SCHEMA,
+    CAPITAL_FLOW_SCHEMA, THEME_SCHEMA, DRAGON_TIGER_SCHEMA,
 )
 
 # ========== 第三方数据相关 ==========
@@ -79,10 +94,16 @@ from .third_party import (
     index_components_to_df, df_to_index_components,
     industry_classifications_to_df, df_to_industry_classifications,
     macro_data_to_df, df_to_macro_data,
+    index_components_to_arrow, industry_classifications_to_arrow, macro_data_to_arrow,
+    iter_index_components, iter_industry_classifications, iter_macro_data,
     
     # 常量
     INDEX_COMPONENT_COLUMNS, INDUSTRY_CLASSIFICATION_COLUMNS, MACRO_DATA_COLUMNS,
     THIRD_PARTY_DTYPES,
+    INDEX_COMPONENT_SCHEMA, INDUSTRY_CLASSIFICATION_SCHEMA, MACRO_DATA_SCHEMA,
+    
+    # 列式批量容器
+    IndexComponentBatch, IndustryClassificationBatch, MacroDataBatch,
 )
 
 # ========== 导出清单 ==========
@@ -91,6 +112,7 @@ __all__ = [
     "Exchange",
     "Interval",
     "_to_utc",
+    "_to_utc_series",
     "_get_enum_value",
     
     # K线
@@ -99,6 +121,10 @@ __all__ = [
     "BAR_DTYPES",
     "bars_to_df",
     "df_to_bars",
+    "df_to_bars_arrow",
+    "bars_to_arrow",
+    "BAR_SCHEMA",
+    "BarBatch",
     
     # 财务数据
     "FinancialData",
@@ -106,12 +132,14 @@ __all__ = [
     "ReportPeriod",
     "FINANCIAL_COLUMNS",
     "financials_to_df",
+    "financials_to_arrow",
     "df_to_financials",
     
     # 基本面数据
     "FundamentalData",
     "FUNDAMENTAL_COLUMNS",
     "fundamentals_to_df",
+    "fundamentals_to_arrow",
     "df_to_fundamentals",
     
     # 衍生数据 - 枚举类型
@@ -122,6 +150,10 @@ __all__ = [
     "AnnouncementData", "NewsSentimentData", "ResearchReportData",
     "CapitalFlowData", "ThemeData", "DragonTigerData",
     
+    # 衍生数据 - 列式批量容器
+    "AnnouncementBatch", "NewsSentimentBatch", "ResearchReportBatch",
+    "CapitalFlowBatch", "ThemeBatch", "DragonTigerBatch",
+    
     # 衍生数据 - 转换函数
     "announcements_to_df", "df_to_announcements",
     "news_sentiments_to_df", "df_to_news_sentiments",
@@ -129,11 +161,15 @@ __all__ = [
     "capital_flows_to_df", "df_to_capital_flows",
     "themes_to_df", "df_to_themes",
     "dragon_tigers_to_df", "df_to_dragon_tigers",
+    "announcements_to_arrow", "news_sentiments_to_arrow", "research_reports_to_arrow",
+    "capital_flows_to_arrow", "themes_to_arrow", "dragon_tigers_to_arrow",
     
     # 衍生数据 - 常量
     "ANNOUNCEMENT_COLUMNS", "NEWS_SENTIMENT_COLUMNS", "RESEARCH_REPORT_COLUMNS",
     "CAPITAL_FLOW_COLUMNS", "THEME_COLUMNS", "DRAGON_TIGER_COLUMNS",
     "DERIVATIVE_DTYPES",
+    "ANNOUNCEMENT_SCHEMA", "NEWS_SENTIMENT_SCHEMA", "RESEARCH_REPORT_SCHEMA",
+    "CAPITAL_FLOW_SCHEMA", "THEME_SCHEMA", "DRAGON_TIGER_SCHEMA",
     
     # 第三方数据 - 枚举类型
     "IndexType", "IndustryLevel", "IndustryStandard", "MacroDataType", "DataFrequency",
@@ -145,9 +181,15 @@ __all__ = [
     "index_components_to_df", "df_to_index_components",
     "industry_classifications_to_df", "df_to_industry_classifications",
     "macro_data_to_df", "df_to_macro_data",
+    "index_components_to_arrow", "industry_classifications_to_arrow", "macro_data_to_arrow",
+    "iter_index_components", "iter_industry_classifications", "iter_macro_data",
     
     # 第三方数据 - 常量
     "INDEX_COMPONENT_COLUMNS", "INDUSTRY_CLASSIFICATION_COLUMNS", "MACRO_DATA_COLUMNS",
     "THIRD_PARTY_DTYPES",
+    "INDEX_COMPONENT_SCHEMA", "INDUSTRY_CLASSIFICATION_SCHEMA", "MACRO_DATA_SCHEMA",
+    
+    # 第三方数据 - 列式批量容器
+    "IndexComponentBatch", "IndustryClassificationBatch", "MacroDataBatch",
 ]
 
@@ -0,0 +1,103 @@
+# qp/data/types/_jit.py
+"""
+数值列聚合的JIT加速辅助函数
+
+numba 为可选依赖：已安装时按固定签名在导入时编译（cache=True 落盘复用），
+未安装时退回等价的 numpy 实现，调用方无需区分。
+"""
+from __future__ import annotations
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 尝试导入numba，如果失败则使用numpy实现
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    logger.debug("numba未安装，数值聚合使用numpy实现")
+
+
+def _column_sums_py(values: np.ndarray) -> np.ndarray:
+    """按列求和（二维数组，单次遍历）"""
+    n_rows, n_cols = values.shape
+    sums = np.zeros(n_cols, dtype=np.float64)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            sums[j] += values[i, j]
+    return sums
+
+
+if HAS_NUMBA:
+    _column_sums = njit("float64[:](float64[:, :])", cache=True)(_column_sums_py)
+else:
+    def _column_sums(values: np.ndarray) -> np.ndarray:
+        return values.sum(axis=0)
+
+
+def column_sums(values: np.ndarray) -> np.ndarray:
+    """
+    对二维数值矩阵按列求和
+
+    Args:
+        values: 形如 (行数, 列数) 的数值矩阵，通常由 df[cols].to_numpy() 得到
+
+    Returns:
+        每列之和（float64）
+    """
+    return _column_sums(np.ascontiguousarray(values, dtype=np.float64))
+
+
+def _rolling_pct_rank_py(x: np.ndarray, window: int) -> np.ndarray:
+    """滚动窗口内末值的百分位（窗口内 >= 末值的占比 ×100，窗口全为NaN时为NaN）"""
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        lo = max(0, i - window + 1)
+        last = x[i]
+        count = 0
+        valid = 0
+        for k in range(lo, i + 1):
+            v = x[k]
+            if v == v:
+                valid += 1
+            if last <= v:
+                count += 1
+        out[i] = count / (i - lo + 1) * 100.0 if valid > 0 else np.nan
+    return out
+
+
+if HAS_NUMBA:
+    _rolling_pct_rank = njit("float64[:](float64[:], int64)", parallel=True, cache=True)(_rolling_pct_rank_py)
+else:
+    def _rolling_pct_rank(x: np.ndarray, window: int) -> np.ndarray:
+        from numpy.lib.stride_tricks import sliding_window_view
+        n = x.shape[0]
+        # 前补 window-1 个NaN，使每行都是完整窗口；NaN 不计入有效值、也不满足 last <= v
+        padded = np.concatenate([np.full(window - 1, np.nan), x])
+        windows = sliding_window_view(padded, window)
+        count = (x[:, None] <= windows).sum(axis=1)
+        valid = (~np.isnan(windows)).sum(axis=1)
+        length = np.minimum(np.arange(1, n + 1), window)
+        with np.errstate(invalid="ignore"):
+            return np.where(valid > 0, count / length * 100.0, np.nan)
+
+
+def rolling_pct_rank(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    滚动百分位（等价于 rolling(window, min_periods=1).apply(lambda x: (x.iloc[-1] <= x).sum() / len(x) * 100)）
+
+    Args:
+        values: 一维数值序列
+        window: 窗口长度
+
+    Returns:
+        与输入等长的百分位数组（float64）
+    """
+    x = np.ascontiguousarray(values, dtype=np.float64)
+    if x.shape[0] == 0:
+        return np.empty(0, dtype=np.float64)
+    return _rolling_pct_rank(x, int(window))
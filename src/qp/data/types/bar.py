@@ -2,12 +2,15 @@
 """K线数据相关类型定义"""
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import partial
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
-from .common import Exchange, Interval, _to_utc, _get_enum_value
+from .common import Exchange, Interval, _arrow_table, _to_utc_series, _enum_column
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BarData:
     """K线数据类"""
     symbol: str
@@ -44,29 +47,51 @@ BAR_DTYPES = {
 }
 
 
+# K线Arrow Schema（symbol/exchange/interval 作为批次元数据，不逐行存储）
+BAR_SCHEMA = pa.schema([
+    ("datetime", pa.timestamp("ns", tz="UTC")),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.float64()),
+    ("turnover", pa.float64()),
+    ("open_interest", pa.float64()),
+])
+
+
 # ========== 转换函数 ==========
-def bars_to_df(bars: list[BarData]) -> pd.DataFrame:
-    """将K线数据列表转换为DataFrame"""
+def bars_to_df(bars: list[BarData], deduplicate: bool = True) -> pd.DataFrame:
+    """
+    将K线数据列表转换为DataFrame
+
+    Args:
+        bars: K线数据列表
+        deduplicate: 是否按datetime去重（保留最后一条）；已知无重复的输入（如存储层读出的数据）可传False
+    """
     if not bars:
         return pd.DataFrame(columns=BAR_COLUMNS).astype(BAR_DTYPES)
 
-    recs = [{
-        "symbol": b.symbol,
-        "exchange": _get_enum_value(b.exchange, Exchange),
-        "interval": _get_enum_value(b.interval, Interval),
-        "datetime": _to_utc(pd.Timestamp(b.datetime)),
-        "open": b.open_price,
-        "high": b.high_price,
-        "low": b.low_price,
-        "close": b.close_price,
-        "volume": b.volume,
-        "turnover": b.turnover,
-        "open_interest": b.open_interest
-    } for b in bars]
-
-    return (pd.DataFrame.from_records(recs)
-            .sort_values("datetime")
-            .drop_duplicates(subset=["datetime"], keep="last"))
+    # 按列构建，避免逐行字典分配
+    df = pd.DataFrame({
+        "symbol": [b.symbol for b in bars],
+        "exchange": _enum_column([b.exchange for b in bars], Exchange),
+        "interval": _enum_column([b.interval for b in bars], Interval),
+        "datetime": [b.datetime for b in bars],
+        "open": [b.open_price for b in bars],
+        "high": [b.high_price for b in bars],
+        "low": [b.low_price for b in bars],
+        "close": [b.close_price for b in bars],
+        "volume": [b.volume for b in bars],
+        "turnover": [b.turnover for b in bars],
+        "open_interest": [b.open_interest for b in bars]
+    })
+    df["datetime"] = _to_utc_series(df["datetime"])
+
+    df = df.sort_values("datetime", kind="mergesort", ignore_index=True)
+    if deduplicate:
+        df = df.drop_duplicates(subset=["datetime"], keep="last", ignore_index=True)
+    return df
 
 
 def df_to_bars(df: pd.DataFrame, symbol: str,
@@ -75,17 +100,123 @@ def df_to_bars(df: pd.DataFrame, symbol: str,
     if "datetime" not in df.columns:
         raise ValueError("df 缺少 datetime 列")
 
-    return [BarData(
-        symbol=symbol,
-        exchange=exchange,
-        interval=interval,
-        datetime=pd.Timestamp(getattr(r, "datetime")),
-        open_price=float(getattr(r, "open")),
-        high_price=float(getattr(r, "high")),
-        low_price=float(getattr(r, "low")),
-        close_price=float(getattr(r, "close")),
-        volume=float(getattr(r, "volume", 0.0)),
-        turnover=float(getattr(r, "turnover", 0.0)),
-        open_interest=float(getattr(r, "open_interest", 0.0)),
-    ) for r in df.itertuples(index=False)]
+    # 整列转换一次时间戳，避免逐行构造 pd.Timestamp
+    datetimes = pd.DatetimeIndex(pd.to_datetime(df["datetime"]))
+
+    # 按列取出浮点数组后 zip 组装，避免 itertuples 的逐行元组与 getattr 开销
+    n = len(df)
+
+    def column(name: str, optional: bool = False) -> list[float]:
+        if optional and name not in df.columns:
+            return [0.0] * n
+        return df[name].to_numpy(dtype=float).tolist()
+
+    # symbol/exchange/interval 对整批不变，预先绑定后按位置参数逐行构造
+    make_bar = partial(BarData, symbol, exchange, interval)
+    return list(map(
+        make_bar,
+        datetimes, column("open"), column("high"), column("low"), column("close"),
+        column("volume", True), column("turnover", True), column("open_interest", True)
+    ))
+
+
+def _arrow_column(batch: "pa.RecordBatch | pa.Table", name: str) -> np.ndarray:
+    """取出Arrow列的NumPy视图（无空值的数值列零拷贝）"""
+    col = batch.column(name)
+    if hasattr(col, "combine_chunks"):
+        col = col.combine_chunks()
+    return col.to_numpy(zero_copy_only=False)
+
+
+def df_to_bars_arrow(batch: "pa.RecordBatch | pa.Table", symbol: str,
+                     exchange: Exchange, interval: Interval) -> list[BarData]:
+    """将Arrow RecordBatch/Table转换为K线数据列表，按列取数避免逐行类型转换"""
+    names = set(batch.schema.names)
+    if "datetime" not in names:
+        raise ValueError("batch 缺少 datetime 列")
+
+    n = batch.num_rows
+    datetimes = pd.to_datetime(_arrow_column(batch, "datetime"), utc=True)
+    opens = _arrow_column(batch, "open").astype(float, copy=False)
+    highs = _arrow_column(batch, "high").astype(float, copy=False)
+    lows = _arrow_column(batch, "low").astype(float, copy=False)
+    closes = _arrow_column(batch, "close").astype(float, copy=False)
+    zeros = np.zeros(n)
+    volumes = _arrow_column(batch, "volume").astype(float, copy=False) if "volume" in names else zeros
+    turnovers = _arrow_column(batch, "turnover").astype(float, copy=False) if "turnover" in names else zeros
+    ois = (_arrow_column(batch, "open_interest").astype(float, copy=False)
+           if "open_interest" in names else zeros)
+
+    make_bar = partial(BarData, symbol, exchange, interval)
+    return list(map(
+        make_bar,
+        datetimes, opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(),
+        volumes.tolist(), turnovers.tolist(), ois.tolist()
+    ))
+
+
+def bars_to_arrow(bars: list[BarData]) -> pa.Table:
+    """将K线数据列表按列转为Arrow表（按 datetime 排序，同一时间戳保留最后一条）"""
+    # 先旧后新放入字典，重复时间戳以后出现者为准
+    if any(b.datetime <= a.datetime for a, b in zip(bars, bars[1:])):
+        latest = {pd.Timestamp(b.datetime): b for b in bars}
+        bars = [latest[k] for k in sorted(latest)]
+    return _arrow_table(BAR_SCHEMA, {
+        "datetime": pd.to_datetime([b.datetime for b in bars], utc=True),
+        "open": [b.open_price for b in bars],
+        "high": [b.high_price for b in bars],
+        "low": [b.low_price for b in bars],
+        "close": [b.close_price for b in bars],
+        "volume": [b.volume for b in bars],
+        "turnover": [b.turnover for b in bars],
+        "open_interest": [b.open_interest for b in bars],
+    })
+
+
+@dataclass(eq=False)
+class BarBatch:
+    """
+    列式K线批次
+
+    以 BAR_SCHEMA 的Arrow表保存同一 symbol/exchange/interval 的K线，
+    服务层在批次上直接运算，只在边界处与 list[BarData] 互转。
+    """
+    table: pa.Table
+    symbol: str
+    exchange: Exchange
+    interval: Interval
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @classmethod
+    def from_bars(cls, bars: list[BarData]) -> "BarBatch":
+        """由K线数据列表构造（取首条的 symbol/exchange/interval）"""
+        if not bars:
+            raise ValueError("bars 不能为空")
+        first = bars[0]
+        return cls(bars_to_arrow(bars), first.symbol, first.exchange, first.interval)
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, symbol: str,
+                exchange: Exchange, interval: Interval) -> "BarBatch":
+        """由DataFrame构造（缺少的可选列补0）"""
+        columns = {}
+        for name in BAR_SCHEMA.names:
+            if name in df.columns:
+                columns[name] = df[name]
+            elif name in ("volume", "turnover", "open_interest"):
+                columns[name] = np.zeros(len(df))
+            else:
+                raise ValueError(f"df 缺少 {name} 列")
+        columns["datetime"] = _to_utc_series(pd.Series(columns["datetime"]))
+        table = pa.Table.from_pandas(pd.DataFrame(columns), schema=BAR_SCHEMA, preserve_index=False)
+        return cls(table, symbol, exchange, interval)
+
+    def to_df(self) -> pd.DataFrame:
+        """转为DataFrame（仅价量列与 datetime）"""
+        return self.table.to_pandas()
 
+    def to_bars(self) -> list[BarData]:
+        """转为K线数据列表"""
+        return df_to_bars_arrow(self.table, self.symbol, self.exchange, self.interval)
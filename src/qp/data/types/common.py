@@ -1,7 +1,14 @@
 # qp/data/types/common.py
 """共享的枚举类型和基础定义"""
+from dataclasses import fields
+from datetime import timezone
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Type
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 
 class Exchange(Enum):
@@ -28,13 +35,277 @@ class Interval(Enum):
     MONTHLY = "1mo"
 
 
+# 交易所取值到枚举成员的查找表
+_EXCHANGE_MAP = {m.value: m for m in Exchange}
+
+
 # ========== 工具函数 ==========
 def _to_utc(dt: pd.Timestamp) -> pd.Timestamp:
     """转换为UTC时区"""
-    return dt.tz_convert("UTC") if dt.tzinfo else dt.tz_localize("UTC")
+    tz = dt.tzinfo
+    if tz is None:
+        return dt.tz_localize("UTC")
+    if tz is timezone.utc or str(tz) == "UTC":
+        return dt
+    return dt.tz_convert("UTC")
+
+
+def _to_utc_series(s: pd.Series) -> pd.Series:
+    """整列转换为UTC时区（已是UTC时直接返回）"""
+    if isinstance(s.dtype, pd.DatetimeTZDtype):
+        return s if str(s.dtype.tz) == "UTC" else s.dt.tz_convert("UTC")
+    if pd.api.types.is_datetime64_dtype(s.dtype):
+        return s.dt.tz_localize("UTC")
+    return pd.to_datetime(s, utc=True)
+
+
+def _sort_order(dates: pd.Series) -> Optional[np.ndarray]:
+    """
+    已规整为UTC的日期列的稳定升序排列位置（NaT 排在最后）；已有序时返回 None
+    """
+    if dates.is_monotonic_increasing:
+        return None
+    # 带时区列的 .values 为UTC下的 datetime64[ns]，numpy 排序把 NaT 放在末尾
+    return np.argsort(dates.values, kind="stable")
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_type: Type[Enum]) -> Dict[Enum, Any]:
+    """枚举成员到取值的映射（按类缓存）"""
+    return {member: member.value for member in enum_type}
+
+
+@lru_cache(maxsize=None)
+def _enum_codes(enum_type: Type[Enum]) -> Dict[Any, int]:
+    """枚举成员（及其取值）到分类编码的映射（按类缓存）"""
+    codes: Dict[Any, int] = {}
+    for code, member in enumerate(enum_type):
+        codes[member] = code
+        codes[member.value] = code
+    return codes
+
+
+@lru_cache(maxsize=None)
+def _enum_dtype(enum_type: Type[Enum]) -> pd.CategoricalDtype:
+    """枚举全部取值组成的分类类型（按类缓存，各表共享同一类别索引）"""
+    return pd.CategoricalDtype(list(_enum_values(enum_type).values()), ordered=False)
+
+
+def _enum_categorical(objs: List[Enum], enum_type: Type[Enum]) -> pd.Categorical:
+    """按枚举定义顺序直接构造分类列，跳过字符串推断"""
+    codes = _enum_codes(enum_type)
+    return pd.Categorical.from_codes([codes[o] for o in objs], dtype=_enum_dtype(enum_type))
+
+
+def _enum_dictionary(objs: List[Any], enum_type: Type[Enum]) -> pa.DictionaryArray:
+    """按枚举定义顺序构造Arrow字典列（int16编码）"""
+    codes = _enum_codes(enum_type)
+    return pa.DictionaryArray.from_arrays(
+        pa.array([codes[o] for o in objs], type=pa.int16()),
+        pa.array(list(_enum_values(enum_type).values()), type=pa.string())
+    )
+
+
+def _arrow_table(schema: pa.Schema, columns: Dict[str, Any]) -> pa.Table:
+    """按schema组装Arrow表（已是Arrow数组的列原样使用）"""
+    arrays = []
+    for f in schema:
+        col = columns[f.name]
+        arrays.append(col if isinstance(col, pa.Array) else pa.array(col, type=f.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
 
 
 def _get_enum_value(obj, enum_type):
     """获取枚举值"""
-    return obj.value if isinstance(obj, enum_type) else str(obj)
+    value = _enum_values(enum_type).get(obj)
+    return value if value is not None else str(obj)
+
+
+def _enum_column(objs: List[Any], enum_type: Type[Enum]) -> List[Any]:
+    """批量获取枚举值；整批取值相同时只解析一次"""
+    first = objs[0]
+    if all(o is first for o in objs):
+        return [_get_enum_value(first, enum_type)] * len(objs)
+    get = _enum_values(enum_type).get
+    return [v if (v := get(o)) is not None else str(o) for o in objs]
+
+
+
+def _column_list(data: Any, name: str) -> List[Any]:
+    """
+    整列取出为Python列表（兼容 DataFrame 与 Arrow 表，列不存在时抛 KeyError）
+
+    string / boolean 等以 pd.NA 表示缺失的扩展类型列，缺失值还原为 None。
+    """
+    col = data[name]
+    if isinstance(col, pa.ChunkedArray):
+        return col.to_pylist()
+    if getattr(col.dtype, "na_value", None) is pd.NA and col.hasnans:
+        return col.astype(object).where(col.notna(), None).tolist()
+    return col.tolist()
+
+
+def _iter_row_slices(data: Any, chunk_size: int) -> Iterator[Any]:
+    """按行切成连续分片（DataFrame 用 iloc 视图，Arrow 表用零拷贝 slice）"""
+    is_table = isinstance(data, pa.Table)
+    for start in range(0, len(data), chunk_size):
+        yield data.slice(start, chunk_size) if is_table else data.iloc[start:start + chunk_size]
+
+
+def _df_column(df: Any, name: str, default: Any = None) -> Iterable[Any]:
+    """整列取出为Python列表；列不存在时返回默认值的惰性重复（不分配整列）"""
+    names = df.column_names if isinstance(df, pa.Table) else df.columns
+    if name in names:
+        return _column_list(df, name)
+    return repeat(default, len(df))
+
+
+def _optional_column(df: Any, name: str) -> Iterable[Any]:
+    """可选字段整列取出：NaN / NaT / pd.NA 等缺失值还原为 None；列不存在时全为 None"""
+    names = df.column_names if isinstance(df, pa.Table) else df.columns
+    if name not in names:
+        return repeat(None, len(df))
+    col = df[name]
+    if isinstance(col, pa.ChunkedArray):
+        # 由 numpy 数组构造的Arrow浮点列中 NaN 并非 null，一并还原
+        return [None if v != v else v for v in col.to_pylist()]
+    if col.hasnans:
+        return col.astype(object).where(col.notna(), None).tolist()
+    return col.tolist()
+
+
+def _narrow_dtypes(df: pd.DataFrame, dtypes: Dict[str, Any],
+                   enum_columns: Dict[str, Type[Enum]]) -> pd.DataFrame:
+    """按声明的 dtype 一次性收窄列类型；枚举列固定全量类别，带时区的日期列保持不变"""
+    target = {}
+    for col in df.columns:
+        dtype = dtypes.get(col)
+        if dtype is None:
+            continue
+        if dtype == 'datetime64[ns]' and isinstance(df[col].dtype, pd.DatetimeTZDtype):
+            continue
+        enum_type = enum_columns.get(col)
+        if enum_type is not None:
+            # 固定类别后各分区写出的 Parquet 字典页保持一致
+            dtype = _enum_dtype(enum_type)
+        if pd.api.types.is_dtype_equal(df[col].dtype, dtype):
+            # 已按目标类型构造（如 _enum_categorical 产出的分类列），无需再转换
+            continue
+        target[col] = dtype
+    return df.astype(target, copy=False)
+
+
+def _merge_extra_fields(columns: Dict[str, List[Any]], data_list: List[Any]) -> Dict[str, List[Any]]:
+    """将 extra_fields 按列并入列字典（缺失处补 None，键按首次出现顺序）"""
+    extras = [d.extra_fields or {} for d in data_list]
+    keys = dict.fromkeys(k for e in extras for k in e)
+    for key in keys:
+        base = columns.get(key)
+        if base is None:
+            columns[key] = [e.get(key) for e in extras]
+        else:
+            columns[key] = [e.get(key, v) for e, v in zip(extras, base)]
+    return columns
+
+
+# ========== 列式批量容器 ==========
+
+def _py_scalar(value: Any) -> Any:
+    """列数组元素还原为 Python 标量（与 Series.tolist() 一致，datetime64 还原为 Timestamp）"""
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NA:
+        return None
+    return value
+
+
+def _optional_scalar(value: Any) -> Any:
+    """可选字段的列数组元素：缺失值还原为 None（与 _optional_column 一致）"""
+    value = _py_scalar(value)
+    return None if pd.isna(value) else value
+
+
+def _concat_column(a: Any, b: Any) -> Any:
+    """拼接两列；分类列沿用同一组类别直接拼接编码"""
+    if isinstance(a, pd.Categorical):
+        return pd.Categorical.from_codes(np.concatenate([a.codes, b.codes]), categories=a.categories)
+    return np.concatenate([a, b])
+
+
+class _ColumnBatch:
+    """
+    列式（SoA）批量容器基类
+
+    每个字段保存一整列（np.ndarray / pd.Categorical），数值列按子类 _dtypes() 声明的
+    窄类型存放，转为 DataFrame 时不再逐对象取属性。子类需提供 _ITEM / _to_df / _from_df。
+    """
+    # 单行对应的数据类
+    _ITEM: ClassVar[type]
+    _ENUMS: ClassVar[Dict[str, type]] = {}
+    # 按行取出时需额外还原的列（如逗号拼接的列表列）: 字段名 -> 还原函数
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    _dtypes = staticmethod(dict)
+
+    def __len__(self) -> int:
+        return len(getattr(self, fields(self)[0].name))
+
+    def __getitem__(self, i: int):
+        """按行取出单个数据对象（兼容原 List[XxxData] 用法），直接由各列元素构造"""
+        values = {}
+        for f in fields(self):
+            name = f.name
+            value = getattr(self, name)[i]
+            enum_type = self._ENUMS.get(name)
+            if enum_type is not None:
+                # 分类列元素即枚举取值
+                values[name] = enum_type(value)
+            elif name in self._CONVERTERS:
+                values[name] = self._CONVERTERS[name](value)
+            else:
+                values[name] = _py_scalar(value)
+        return self._ITEM(**values)
+
+    def to_df(self) -> pd.DataFrame:
+        """转为DataFrame（列数组直接引用，不拷贝）"""
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)}, copy=False)
+
+    def to_list(self) -> list:
+        """转为数据对象列表"""
+        return self._from_df(self.to_df())
+
+    def append(self, other):
+        """与另一批同类数据拼接，返回新批次"""
+        return type(self)(**{
+            f.name: _concat_column(getattr(self, f.name), getattr(other, f.name))
+            for f in fields(self)
+        })
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame):
+        """由DataFrame构造（需包含全部列）"""
+        columns = {}
+        dtypes = cls._dtypes()
+        for f in fields(cls):
+            name = f.name
+            enum_type = cls._ENUMS.get(name)
+            if enum_type is not None:
+                columns[name] = pd.Categorical(df[name], categories=list(_enum_values(enum_type).values()))
+                continue
+            dtype = dtypes.get(name)
+            if dtype in ('float32', 'int8'):
+                columns[name] = df[name].to_numpy(dtype=dtype)
+            elif dtype == 'boolean':
+                columns[name] = df[name].to_numpy(dtype=bool)
+            elif getattr(df[name].dtype, "na_value", None) is pd.NA:
+                # string 等扩展类型列：缺失值以 None 存放，按行取出时不再带出 pd.NA
+                columns[name] = df[name].to_numpy(dtype=object, na_value=None)
+            else:
+                columns[name] = df[name].to_numpy()
+        return cls(**columns)
 
+    @classmethod
+    def from_items(cls, items: list):
+        """由数据对象列表构造"""
+        return cls.from_df(cls._to_df(items))
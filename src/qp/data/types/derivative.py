@@ -6,11 +6,19 @@
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, ClassVar, Dict, List, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from .common import (
+    _ColumnBatch, _arrow_table, _column_list, _df_column, _enum_categorical, _enum_dictionary, _narrow_dtypes,
+    _optional_column, _optional_scalar
+)
 
 
 # ========== 枚举定义 ==========
@@ -88,9 +96,82 @@ class DragonTigerReason(Enum):
     OTHER = "other"                  # 其他
 
 
+# 取值到枚举成员的查找表（未命中时回退到 Enum(value) 以保留 ValueError）
+_ANN_TYPE_MAP = {m.value: m for m in AnnouncementType}
+_SENTIMENT_MAP = {m.value: m for m in NewsSentiment}
+_REPORT_TYPE_MAP = {m.value: m for m in ReportType}
+_RATING_MAP = {m.value: m for m in ReportRating}
+_FLOW_TYPE_MAP = {m.value: m for m in FlowType}
+_DIRECTION_MAP = {m.value: m for m in FlowDirection}
+_THEME_TYPE_MAP = {m.value: m for m in ThemeType}
+_DT_TYPE_MAP = {m.value: m for m in DragonTigerType}
+_DT_REASON_MAP = {m.value: m for m in DragonTigerReason}
+
+# 枚举列名到枚举类型
+_ENUM_COLUMNS = {
+    'announcement_type': AnnouncementType,
+    'sentiment': NewsSentiment,
+    'report_type': ReportType,
+    'rating': ReportRating,
+    'flow_type': FlowType,
+    'direction': FlowDirection,
+    'theme_type': ThemeType,
+    'dragon_tiger_type': DragonTigerType,
+    'reason': DragonTigerReason,
+}
+
+
+# ========== 工具函数 ==========
+
+def _from_batch(cls, rows: List[Dict[str, Any]], date_fields: tuple) -> list:
+    """由原始字典批量构造数据对象：日期列整列解析一次，避免逐个实例调用 pd.to_datetime"""
+    if not rows:
+        return []
+    parsed = {}
+    for name in date_fields:
+        if not any(name in row for row in rows):
+            continue
+        dates = pd.to_datetime([row.get(name) for row in rows], cache=True)
+        parsed[name] = [None if ts is pd.NaT else ts for ts in dates]
+    return [
+        cls(**{**row, **{name: values[i] for name, values in parsed.items()}})
+        for i, row in enumerate(rows)
+    ]
+
+
+def _split_joined(value: Any) -> List[str]:
+    """还原逗号拼接的列表列；Arrow 列表列读出时已是序列，直接转为列表"""
+    if isinstance(value, str):
+        # 单值/空串时不走 split，空串还原为空列表
+        if ',' in value:
+            return value.split(',')
+        return [value] if value else []
+    if value is None or value is pd.NA or isinstance(value, float):
+        return []
+    return list(value)
+
+
+def _intern_column(values: List[Any]) -> List[Any]:
+    """驻留低基数字符串列（代码、来源、机构等），重复值共享同一对象"""
+    intern = sys.intern
+    return [intern(v) if type(v) is str else v for v in values]
+
+
+def _join_lists(lists: List[List[str]]) -> List[str]:
+    """列表列拼接为逗号分隔字符串；整批为空列表时直接返回空串列，跳过逐行 join"""
+    if not any(lists):
+        return [''] * len(lists)
+    return list(map(','.join, lists))
+
+
+def _apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """按 DERIVATIVE_DTYPES 一次性收窄列类型"""
+    return _narrow_dtypes(df, DERIVATIVE_DTYPES, _ENUM_COLUMNS)
+
+
 # ========== 数据类定义 ==========
 
-@dataclass
+@dataclass(slots=True)
 class AnnouncementData:
     """公告数据"""
     symbol: str
@@ -108,10 +189,15 @@ class AnnouncementData:
         if isinstance(self.announcement_date, str):
             self.announcement_date = pd.to_datetime(self.announcement_date)
         if isinstance(self.announcement_type, str):
-            self.announcement_type = AnnouncementType(self.announcement_type)
+            self.announcement_type = _ANN_TYPE_MAP.get(self.announcement_type) or AnnouncementType(self.announcement_type)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[AnnouncementData]:
+        """由原始字典批量构造公告数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('announcement_date',))
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsSentimentData:
     """新闻情绪数据"""
     symbol: str
@@ -129,10 +215,15 @@ class NewsSentimentData:
         if isinstance(self.publish_date, str):
             self.publish_date = pd.to_datetime(self.publish_date)
         if isinstance(self.sentiment, str):
-            self.sentiment = NewsSentiment(self.sentiment)
+            self.sentiment = _SENTIMENT_MAP.get(self.sentiment) or NewsSentiment(self.sentiment)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[NewsSentimentData]:
+        """由原始字典批量构造新闻情绪数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('publish_date',))
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchReportData:
     """研报数据"""
     symbol: str
@@ -153,12 +244,17 @@ class ResearchReportData:
         if isinstance(self.publish_date, str):
             self.publish_date = pd.to_datetime(self.publish_date)
         if isinstance(self.report_type, str):
-            self.report_type = ReportType(self.report_type)
+            self.report_type = _REPORT_TYPE_MAP.get(self.report_type) or ReportType(self.report_type)
         if isinstance(self.rating, str):
-            self.rating = ReportRating(self.rating)
+            self.rating = _RATING_MAP.get(self.rating) or ReportRating(self.rating)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[ResearchReportData]:
+        """由原始字典批量构造研报数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('publish_date',))
 
 
-@dataclass
+@dataclass(slots=True)
 class CapitalFlowData:
     """资金流数据"""
     symbol: str
@@ -175,12 +271,17 @@ class CapitalFlowData:
         if isinstance(self.date, str):
             self.date = pd.to_datetime(self.date)
         if isinstance(self.flow_type, str):
-            self.flow_type = FlowType(self.flow_type)
+            self.flow_type = _FLOW_TYPE_MAP.get(self.flow_type) or FlowType(self.flow_type)
         if isinstance(self.direction, str):
-            self.direction = FlowDirection(self.direction)
+            self.direction = _DIRECTION_MAP.get(self.direction) or FlowDirection(self.direction)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[CapitalFlowData]:
+        """由原始字典批量构造资金流数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('date',))
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeData:
     """板块/主题数据"""
     symbol: str
@@ -193,14 +294,19 @@ class ThemeData:
     
     def __post_init__(self):
         if isinstance(self.theme_type, str):
-            self.theme_type = ThemeType(self.theme_type)
+            self.theme_type = _THEME_TYPE_MAP.get(self.theme_type) or ThemeType(self.theme_type)
         if self.start_date and isinstance(self.start_date, str):
             self.start_date = pd.to_datetime(self.start_date)
         if self.end_date and isinstance(self.end_date, str):
             self.end_date = pd.to_datetime(self.end_date)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[ThemeData]:
+        """由原始字典批量构造主题数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('start_date', 'end_date'))
 
 
-@dataclass
+@dataclass(slots=True)
 class DragonTigerData:
     """龙虎榜数据"""
     symbol: str
@@ -219,9 +325,14 @@ class DragonTigerData:
         if isinstance(self.date, str):
             self.date = pd.to_datetime(self.date)
         if isinstance(self.dragon_tiger_type, str):
-            self.dragon_tiger_type = DragonTigerType(self.dragon_tiger_type)
+            self.dragon_tiger_type = _DT_TYPE_MAP.get(self.dragon_tiger_type) or DragonTigerType(self.dragon_tiger_type)
         if isinstance(self.reason, str):
-            self.reason = DragonTigerReason(self.reason)
+            self.reason = _DT_REASON_MAP.get(self.reason) or DragonTigerReason(self.reason)
+    
+    @classmethod
+    def from_batch(cls, rows: List[Dict[str, Any]]) -> List[DragonTigerData]:
+        """由原始字典批量构造龙虎榜数据（日期整列解析）"""
+        return _from_batch(cls, rows, ('date',))
 
 
 # ========== 数据转换函数 ==========
@@ -229,47 +340,60 @@ class DragonTigerData:
 def announcements_to_df(announcements: List[AnnouncementData]) -> pd.DataFrame:
     """将公告数据列表转换为DataFrame"""
     if not announcements:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'title', 'content', 'announcement_date', 'announcement_type',
             'source', 'url', 'keywords', 'importance', 'is_important'
-        ])
-    
-    data = []
-    for ann in announcements:
-        data.append({
-            'symbol': ann.symbol,
-            'title': ann.title,
-            'content': ann.content,
-            'announcement_date': ann.announcement_date,
-            'announcement_type': ann.announcement_type.value,
-            'source': ann.source,
-            'url': ann.url,
-            'keywords': ','.join(ann.keywords),
-            'importance': ann.importance,
-            'is_important': ann.is_important
-        })
-    
-    return pd.DataFrame(data)
+        ]))
+    
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(announcements)
+    importance = np.empty(n, dtype=np.int8)
+    is_important = np.empty(n, dtype=np.bool_)
+    for i, ann in enumerate(announcements):
+        importance[i] = ann.importance
+        is_important[i] = ann.is_important
+    
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [ann.symbol for ann in announcements],
+        'title': [ann.title for ann in announcements],
+        'content': [ann.content for ann in announcements],
+        'announcement_date': [ann.announcement_date for ann in announcements],
+        'announcement_type': _enum_categorical([ann.announcement_type for ann in announcements], AnnouncementType),
+        'source': [ann.source for ann in announcements],
+        'url': [ann.url for ann in announcements],
+        'keywords': _join_lists([ann.keywords for ann in announcements]),
+        'importance': importance,
+        'is_important': is_important
+    }))
 
 
 def df_to_announcements(df: pd.DataFrame) -> List[AnnouncementData]:
     """将DataFrame转换为公告数据列表"""
-    announcements = []
-    for _, row in df.iterrows():
-        keywords = row['keywords'].split(',') if pd.notna(row['keywords']) else []
+    announcements: List[AnnouncementData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    ann_type_of = _ANN_TYPE_MAP.get
+    split = _split_joined
+    append = announcements.append
+    for symbol, title, content, ann_date, ann_type, source, url, keywords, importance, is_important in zip(
+        _intern_column(_column_list(df, 'symbol')), _column_list(df, 'title'), _column_list(df, 'content'),
+        _column_list(df, 'announcement_date'), _column_list(df, 'announcement_type'),
+        _intern_column(_column_list(df, 'source')),
+        _df_column(df, 'url'), _column_list(df, 'keywords'),
+        _df_column(df, 'importance', 1), _df_column(df, 'is_important', False)
+    ):
         ann = AnnouncementData(
-            symbol=row['symbol'],
-            title=row['title'],
-            content=row['content'],
-            announcement_date=row['announcement_date'],
-            announcement_type=AnnouncementType(row['announcement_type']),
-            source=row['source'],
-            url=row.get('url'),
-            keywords=keywords,
-            importance=row.get('importance', 1),
-            is_important=row.get('is_important', False)
+            symbol=symbol,
+            title=title,
+            content=content,
+            announcement_date=ann_date,
+            announcement_type=ann_type_of(ann_type) or AnnouncementType(ann_type),
+            source=source,
+            url=url,
+            keywords=split(keywords),
+            importance=importance,
+            is_important=is_important
         )
-        announcements.append(ann)
+        append(ann)
     
     return announcements
 
@@ -277,47 +401,59 @@ def df_to_announcements(df: pd.DataFrame) -> List[AnnouncementData]:
 def news_sentiments_to_df(sentiments: List[NewsSentimentData]) -> pd.DataFrame:
     """将新闻情绪数据列表转换为DataFrame"""
     if not sentiments:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'title', 'content', 'publish_date', 'sentiment',
             'sentiment_score', 'source', 'url', 'keywords', 'confidence'
-        ])
-    
-    data = []
-    for sent in sentiments:
-        data.append({
-            'symbol': sent.symbol,
-            'title': sent.title,
-            'content': sent.content,
-            'publish_date': sent.publish_date,
-            'sentiment': sent.sentiment.value,
-            'sentiment_score': sent.sentiment_score,
-            'source': sent.source,
-            'url': sent.url,
-            'keywords': ','.join(sent.keywords),
-            'confidence': sent.confidence
-        })
-    
-    return pd.DataFrame(data)
+        ]))
+    
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(sentiments)
+    sentiment_score = np.empty(n, dtype=np.float64)
+    confidence = np.empty(n, dtype=np.float64)
+    for i, sent in enumerate(sentiments):
+        sentiment_score[i] = sent.sentiment_score
+        confidence[i] = sent.confidence
+    
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [sent.symbol for sent in sentiments],
+        'title': [sent.title for sent in sentiments],
+        'content': [sent.content for sent in sentiments],
+        'publish_date': [sent.publish_date for sent in sentiments],
+        'sentiment': _enum_categorical([sent.sentiment for sent in sentiments], NewsSentiment),
+        'sentiment_score': sentiment_score,
+        'source': [sent.source for sent in sentiments],
+        'url': [sent.url for sent in sentiments],
+        'keywords': _join_lists([sent.keywords for sent in sentiments]),
+        'confidence': confidence
+    }))
 
 
 def df_to_news_sentiments(df: pd.DataFrame) -> List[NewsSentimentData]:
     """将DataFrame转换为新闻情绪数据列表"""
-    sentiments = []
-    for _, row in df.iterrows():
-        keywords = row['keywords'].split(',') if pd.notna(row['keywords']) else []
+    sentiments: List[NewsSentimentData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    sentiment_of = _SENTIMENT_MAP.get
+    split = _split_joined
+    append = sentiments.append
+    for symbol, title, content, publish_date, sentiment, score, source, url, keywords, confidence in zip(
+        _intern_column(_column_list(df, 'symbol')), _column_list(df, 'title'), _column_list(df, 'content'),
+        _column_list(df, 'publish_date'), _column_list(df, 'sentiment'), _column_list(df, 'sentiment_score'),
+        _intern_column(_column_list(df, 'source')), _df_column(df, 'url'), _column_list(df, 'keywords'),
+        _df_column(df, 'confidence', 0.0)
+    ):
         sent = NewsSentimentData(
-            symbol=row['symbol'],
-            title=row['title'],
-            content=row['content'],
-            publish_date=row['publish_date'],
-            sentiment=NewsSentiment(row['sentiment']),
-            sentiment_score=row['sentiment_score'],
-            source=row['source'],
-            url=row.get('url'),
-            keywords=keywords,
-            confidence=row.get('confidence', 0.0)
+            symbol=symbol,
+            title=title,
+            content=content,
+            publish_date=publish_date,
+            sentiment=sentiment_of(sentiment) or NewsSentiment(sentiment),
+            sentiment_score=score,
+            source=source,
+            url=url,
+            keywords=split(keywords),
+            confidence=confidence
         )
-        sentiments.append(sent)
+        append(sent)
     
     return sentiments
 
@@ -325,53 +461,68 @@ def df_to_news_sentiments(df: pd.DataFrame) -> List[NewsSentimentData]:
 def research_reports_to_df(reports: List[ResearchReportData]) -> pd.DataFrame:
     """将研报数据列表转换为DataFrame"""
     if not reports:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'title', 'content', 'publish_date', 'report_type',
             'rating', 'target_price', 'current_price', 'analyst', 'institution',
             'source', 'url', 'summary'
-        ])
-    
-    data = []
-    for report in reports:
-        data.append({
-            'symbol': report.symbol,
-            'title': report.title,
-            'content': report.content,
-            'publish_date': report.publish_date,
-            'report_type': report.report_type.value,
-            'rating': report.rating.value,
-            'target_price': report.target_price,
-            'current_price': report.current_price,
-            'analyst': report.analyst,
-            'institution': report.institution,
-            'source': report.source,
-            'url': report.url,
-            'summary': report.summary
-        })
-    
-    return pd.DataFrame(data)
+        ]))
+    
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(reports)
+    target_price = np.empty(n, dtype=np.float64)
+    current_price = np.empty(n, dtype=np.float64)
+    for i, report in enumerate(reports):
+        target_price[i] = report.target_price if report.target_price is not None else np.nan
+        current_price[i] = report.current_price if report.current_price is not None else np.nan
+    
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [report.symbol for report in reports],
+        'title': [report.title for report in reports],
+        'content': [report.content for report in reports],
+        'publish_date': [report.publish_date for report in reports],
+        'report_type': _enum_categorical([report.report_type for report in reports], ReportType),
+        'rating': _enum_categorical([report.rating for report in reports], ReportRating),
+        'target_price': target_price,
+        'current_price': current_price,
+        'analyst': [report.analyst for report in reports],
+        'institution': [report.institution for report in reports],
+        'source': [report.source for report in reports],
+        'url': [report.url for report in reports],
+        'summary': [report.summary for report in reports]
+    }))
 
 
 def df_to_research_reports(df: pd.DataFrame) -> List[ResearchReportData]:
     """将DataFrame转换为研报数据列表"""
-    reports = []
-    for _, row in df.iterrows():
+    reports: List[ResearchReportData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    report_type_of = _REPORT_TYPE_MAP.get
+    rating_of = _RATING_MAP.get
+    append = reports.append
+    for (symbol, title, content, publish_date, report_type, rating, target_price, current_price,
+         analyst, institution, source, url, summary) in zip(
+        _intern_column(_column_list(df, 'symbol')), _column_list(df, 'title'), _column_list(df, 'content'),
+        _column_list(df, 'publish_date'), _column_list(df, 'report_type'), _column_list(df, 'rating'),
+        _optional_column(df, 'target_price'), _optional_column(df, 'current_price'),
+        _intern_column(_df_column(df, 'analyst', '')), _intern_column(_df_column(df, 'institution', '')),
+        _intern_column(_df_column(df, 'source', '')), _df_column(df, 'url'), _df_column(df, 'summary', '')
+    ):
         report = ResearchReportData(
-            symbol=row['symbol'],
-            title=row['title'],
-            content=row['content'],
-            publish_date=row['publish_date'],
-            report_type=ReportType(row['report_type']),
-            rating=ReportRating(row['rating']),
-            target_price=row.get('target_price'),
-            current_price=row.get('current_price'),
-            analyst=row.get('analyst', ''),
-            institution=row.get('institution', ''),
-            source=row.get('source', ''),
-            url=row.get('url'),
-            summary=row.get('summary', '')
+            symbol=symbol,
+            title=title,
+            content=content,
+            publish_date=publish_date,
+            report_type=report_type_of(report_type) or ReportType(report_type),
+            rating=rating_of(rating) or ReportRating(rating),
+            target_price=target_price,
+            current_price=current_price,
+            analyst=analyst,
+            institution=institution,
+            source=source,
+            url=url,
+            summary=summary
         )
-        reports.append(report)
+        append(report)
     
     return reports
 
@@ -379,44 +530,63 @@ def df_to_research_reports(df: pd.DataFrame) -> List[ResearchReportData]:
 def capital_flows_to_df(flows: List[CapitalFlowData]) -> pd.DataFrame:
     """将资金流数据列表转换为DataFrame"""
     if not flows:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'date', 'flow_type', 'direction', 'net_amount',
             'inflow_amount', 'outflow_amount', 'volume', 'turnover_rate'
-        ])
+        ]))
     
-    data = []
-    for flow in flows:
-        data.append({
-            'symbol': flow.symbol,
-            'date': flow.date,
-            'flow_type': flow.flow_type.value,
-            'direction': flow.direction.value,
-            'net_amount': flow.net_amount,
-            'inflow_amount': flow.inflow_amount,
-            'outflow_amount': flow.outflow_amount,
-            'volume': flow.volume,
-            'turnover_rate': flow.turnover_rate
-        })
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(flows)
+    net_amount = np.empty(n, dtype=np.float64)
+    inflow_amount = np.empty(n, dtype=np.float64)
+    outflow_amount = np.empty(n, dtype=np.float64)
+    volume = np.empty(n, dtype=np.float64)
+    turnover_rate = np.empty(n, dtype=np.float64)
+    for i, flow in enumerate(flows):
+        net_amount[i] = flow.net_amount
+        inflow_amount[i] = flow.inflow_amount
+        outflow_amount[i] = flow.outflow_amount
+        volume[i] = flow.volume
+        turnover_rate[i] = flow.turnover_rate
     
-    return pd.DataFrame(data)
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [flow.symbol for flow in flows],
+        'date': [flow.date for flow in flows],
+        'flow_type': _enum_categorical([flow.flow_type for flow in flows], FlowType),
+        'direction': _enum_categorical([flow.direction for flow in flows], FlowDirection),
+        'net_amount': net_amount,
+        'inflow_amount': inflow_amount,
+        'outflow_amount': outflow_amount,
+        'volume': volume,
+        'turnover_rate': turnover_rate
+    }))
 
 
 def df_to_capital_flows(df: pd.DataFrame) -> List[CapitalFlowData]:
     """将DataFrame转换为资金流数据列表"""
-    flows = []
-    for _, row in df.iterrows():
+    flows: List[CapitalFlowData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    flow_type_of = _FLOW_TYPE_MAP.get
+    direction_of = _DIRECTION_MAP.get
+    append = flows.append
+    for symbol, date, flow_type, direction, net_amount, inflow, outflow, volume, turnover_rate in zip(
+        _column_list(df, 'symbol'), _column_list(df, 'date'),
+        _column_list(df, 'flow_type'), _column_list(df, 'direction'),
+        _column_list(df, 'net_amount'), _column_list(df, 'inflow_amount'), _column_list(df, 'outflow_amount'),
+        _df_column(df, 'volume', 0.0), _df_column(df, 'turnover_rate', 0.0)
+    ):
         flow = CapitalFlowData(
-            symbol=row['symbol'],
-            date=row['date'],
-            flow_type=FlowType(row['flow_type']),
-            direction=FlowDirection(row['direction']),
-            net_amount=row['net_amount'],
-            inflow_amount=row['inflow_amount'],
-            outflow_amount=row['outflow_amount'],
-            volume=row.get('volume', 0.0),
-            turnover_rate=row.get('turnover_rate', 0.0)
+            symbol=symbol,
+            date=date,
+            flow_type=flow_type_of(flow_type) or FlowType(flow_type),
+            direction=direction_of(direction) or FlowDirection(direction),
+            net_amount=net_amount,
+            inflow_amount=inflow,
+            outflow_amount=outflow,
+            volume=volume,
+            turnover_rate=turnover_rate
         )
-        flows.append(flow)
+        append(flow)
     
     return flows
 
@@ -424,40 +594,49 @@ def df_to_capital_flows(df: pd.DataFrame) -> List[CapitalFlowData]:
 def themes_to_df(themes: List[ThemeData]) -> pd.DataFrame:
     """将主题数据列表转换为DataFrame"""
     if not themes:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'theme_name', 'theme_type', 'weight',
             'start_date', 'end_date', 'description'
-        ])
+        ]))
     
-    data = []
-    for theme in themes:
-        data.append({
-            'symbol': theme.symbol,
-            'theme_name': theme.theme_name,
-            'theme_type': theme.theme_type.value,
-            'weight': theme.weight,
-            'start_date': theme.start_date,
-            'end_date': theme.end_date,
-            'description': theme.description
-        })
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(themes)
+    weight = np.empty(n, dtype=np.float64)
+    for i, theme in enumerate(themes):
+        weight[i] = theme.weight
     
-    return pd.DataFrame(data)
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [theme.symbol for theme in themes],
+        'theme_name': [theme.theme_name for theme in themes],
+        'theme_type': _enum_categorical([theme.theme_type for theme in themes], ThemeType),
+        'weight': weight,
+        'start_date': [theme.start_date for theme in themes],
+        'end_date': [theme.end_date for theme in themes],
+        'description': [theme.description for theme in themes]
+    }))
 
 
 def df_to_themes(df: pd.DataFrame) -> List[ThemeData]:
     """将DataFrame转换为主题数据列表"""
-    themes = []
-    for _, row in df.iterrows():
+    themes: List[ThemeData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    theme_type_of = _THEME_TYPE_MAP.get
+    append = themes.append
+    for symbol, theme_name, theme_type, weight, start_date, end_date, description in zip(
+        _column_list(df, 'symbol'), _column_list(df, 'theme_name'), _column_list(df, 'theme_type'),
+        _column_list(df, 'weight'), _optional_column(df, 'start_date'), _optional_column(df, 'end_date'),
+        _df_column(df, 'description', '')
+    ):
         theme = ThemeData(
-            symbol=row['symbol'],
-            theme_name=row['theme_name'],
-            theme_type=ThemeType(row['theme_type']),
-            weight=row['weight'],
-            start_date=row.get('start_date'),
-            end_date=row.get('end_date'),
-            description=row.get('description', '')
+            symbol=symbol,
+            theme_name=theme_name,
+            theme_type=theme_type_of(theme_type) or ThemeType(theme_type),
+            weight=weight,
+            start_date=start_date,
+            end_date=end_date,
+            description=description
         )
-        themes.append(theme)
+        append(theme)
     
     return themes
 
@@ -465,55 +644,308 @@ def df_to_themes(df: pd.DataFrame) -> List[ThemeData]:
 def dragon_tigers_to_df(dragon_tigers: List[DragonTigerData]) -> pd.DataFrame:
     """将龙虎榜数据列表转换为DataFrame"""
     if not dragon_tigers:
-        return pd.DataFrame(columns=[
+        return _apply_dtypes(pd.DataFrame(columns=[
             'symbol', 'date', 'dragon_tiger_type', 'reason', 'buy_amount',
             'sell_amount', 'net_amount', 'buy_seats', 'sell_seats',
             'turnover_rate', 'price_change'
-        ])
-    
-    data = []
-    for dt in dragon_tigers:
-        data.append({
-            'symbol': dt.symbol,
-            'date': dt.date,
-            'dragon_tiger_type': dt.dragon_tiger_type.value,
-            'reason': dt.reason.value,
-            'buy_amount': dt.buy_amount,
-            'sell_amount': dt.sell_amount,
-            'net_amount': dt.net_amount,
-            'buy_seats': ','.join(dt.buy_seats),
-            'sell_seats': ','.join(dt.sell_seats),
-            'turnover_rate': dt.turnover_rate,
-            'price_change': dt.price_change
-        })
-    
-    return pd.DataFrame(data)
+        ]))
+    
+    # 数值列预分配定长数组，单次遍历填充
+    n = len(dragon_tigers)
+    buy_amount = np.empty(n, dtype=np.float64)
+    sell_amount = np.empty(n, dtype=np.float64)
+    net_amount = np.empty(n, dtype=np.float64)
+    turnover_rate = np.empty(n, dtype=np.float64)
+    price_change = np.empty(n, dtype=np.float64)
+    for i, dt in enumerate(dragon_tigers):
+        buy_amount[i] = dt.buy_amount
+        sell_amount[i] = dt.sell_amount
+        net_amount[i] = dt.net_amount
+        turnover_rate[i] = dt.turnover_rate
+        price_change[i] = dt.price_change
+    
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [dt.symbol for dt in dragon_tigers],
+        'date': [dt.date for dt in dragon_tigers],
+        'dragon_tiger_type': _enum_categorical([dt.dragon_tiger_type for dt in dragon_tigers], DragonTigerType),
+        'reason': _enum_categorical([dt.reason for dt in dragon_tigers], DragonTigerReason),
+        'buy_amount': buy_amount,
+        'sell_amount': sell_amount,
+        'net_amount': net_amount,
+        'buy_seats': _join_lists([dt.buy_seats for dt in dragon_tigers]),
+        'sell_seats': _join_lists([dt.sell_seats for dt in dragon_tigers]),
+        'turnover_rate': turnover_rate,
+        'price_change': price_change
+    }))
 
 
 def df_to_dragon_tigers(df: pd.DataFrame) -> List[DragonTigerData]:
     """将DataFrame转换为龙虎榜数据列表"""
-    dragon_tigers = []
-    for _, row in df.iterrows():
-        buy_seats = row['buy_seats'].split(',') if pd.notna(row['buy_seats']) else []
-        sell_seats = row['sell_seats'].split(',') if pd.notna(row['sell_seats']) else []
+    dragon_tigers: List[DragonTigerData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    dt_type_of = _DT_TYPE_MAP.get
+    dt_reason_of = _DT_REASON_MAP.get
+    split = _split_joined
+    append = dragon_tigers.append
+    for (symbol, date, dt_type, reason, buy_amount, sell_amount, net_amount,
+         buy_seats, sell_seats, turnover_rate, price_change) in zip(
+        _column_list(df, 'symbol'), _column_list(df, 'date'), _column_list(df, 'dragon_tiger_type'),
+        _column_list(df, 'reason'), _column_list(df, 'buy_amount'), _column_list(df, 'sell_amount'),
+        _column_list(df, 'net_amount'), _column_list(df, 'buy_seats'), _column_list(df, 'sell_seats'),
+        _df_column(df, 'turnover_rate', 0.0), _df_column(df, 'price_change', 0.0)
+    ):
         dt = DragonTigerData(
-            symbol=row['symbol'],
-            date=row['date'],
-            dragon_tiger_type=DragonTigerType(row['dragon_tiger_type']),
-            reason=DragonTigerReason(row['reason']),
-            buy_amount=row['buy_amount'],
-            sell_amount=row['sell_amount'],
-            net_amount=row['net_amount'],
-            buy_seats=buy_seats,
-            sell_seats=sell_seats,
-            turnover_rate=row.get('turnover_rate', 0.0),
-            price_change=row.get('price_change', 0.0)
+            symbol=symbol,
+            date=date,
+            dragon_tiger_type=dt_type_of(dt_type) or DragonTigerType(dt_type),
+            reason=dt_reason_of(reason) or DragonTigerReason(reason),
+            buy_amount=buy_amount,
+            sell_amount=sell_amount,
+            net_amount=net_amount,
+            buy_seats=split(buy_seats),
+            sell_seats=split(sell_seats),
+            turnover_rate=turnover_rate,
+            price_change=price_change
         )
-        dragon_tigers.append(dt)
+        append(dt)
     
     return dragon_tigers
 
 
+# ========== 列式批量容器 ==========
+
+class _DerivativeBatch(_ColumnBatch):
+    """衍生数据列式批量容器，列类型按 DERIVATIVE_DTYPES 存放（计数类列使用 int8）"""
+    _dtypes = staticmethod(lambda: DERIVATIVE_DTYPES)
+
+
+@dataclass(eq=False)
+class AnnouncementBatch(_DerivativeBatch):
+    """公告列式批量数据"""
+    symbol: np.ndarray
+    title: np.ndarray
+    content: np.ndarray
+    announcement_date: np.ndarray
+    announcement_type: pd.Categorical
+    source: np.ndarray
+    url: np.ndarray
+    keywords: np.ndarray
+    importance: np.ndarray
+    is_important: np.ndarray
+    
+    _ITEM: ClassVar[type] = AnnouncementData
+    _ENUMS: ClassVar[Dict[str, type]] = {'announcement_type': AnnouncementType}
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {'keywords': _split_joined}
+    _to_df = staticmethod(announcements_to_df)
+    _from_df = staticmethod(df_to_announcements)
+
+
+@dataclass(eq=False)
+class NewsSentimentBatch(_DerivativeBatch):
+    """新闻情绪列式批量数据"""
+    symbol: np.ndarray
+    title: np.ndarray
+    content: np.ndarray
+    publish_date: np.ndarray
+    sentiment: pd.Categorical
+    sentiment_score: np.ndarray
+    source: np.ndarray
+    url: np.ndarray
+    keywords: np.ndarray
+    confidence: np.ndarray
+    
+    _ITEM: ClassVar[type] = NewsSentimentData
+    _ENUMS: ClassVar[Dict[str, type]] = {'sentiment': NewsSentiment}
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {'keywords': _split_joined}
+    _to_df = staticmethod(news_sentiments_to_df)
+    _from_df = staticmethod(df_to_news_sentiments)
+
+
+@dataclass(eq=False)
+class ResearchReportBatch(_DerivativeBatch):
+    """研报列式批量数据"""
+    symbol: np.ndarray
+    title: np.ndarray
+    content: np.ndarray
+    publish_date: np.ndarray
+    report_type: pd.Categorical
+    rating: pd.Categorical
+    target_price: np.ndarray
+    current_price: np.ndarray
+    analyst: np.ndarray
+    institution: np.ndarray
+    source: np.ndarray
+    url: np.ndarray
+    summary: np.ndarray
+    
+    _ITEM: ClassVar[type] = ResearchReportData
+    _ENUMS: ClassVar[Dict[str, type]] = {'report_type': ReportType, 'rating': ReportRating}
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        'target_price': _optional_scalar, 'current_price': _optional_scalar
+    }
+    _to_df = staticmethod(research_reports_to_df)
+    _from_df = staticmethod(df_to_research_reports)
+
+
+@dataclass(eq=False)
+class CapitalFlowBatch(_DerivativeBatch):
+    """资金流列式批量数据"""
+    symbol: np.ndarray
+    date: np.ndarray
+    flow_type: pd.Categorical
+    direction: pd.Categorical
+    net_amount: np.ndarray
+    inflow_amount: np.ndarray
+    outflow_amount: np.ndarray
+    volume: np.ndarray
+    turnover_rate: np.ndarray
+    
+    _ITEM: ClassVar[type] = CapitalFlowData
+    _ENUMS: ClassVar[Dict[str, type]] = {'flow_type': FlowType, 'direction': FlowDirection}
+    _to_df = staticmethod(capital_flows_to_df)
+    _from_df = staticmethod(df_to_capital_flows)
+
+
+@dataclass(eq=False)
+class ThemeBatch(_DerivativeBatch):
+    """主题列式批量数据"""
+    symbol: np.ndarray
+    theme_name: np.ndarray
+    theme_type: pd.Categorical
+    weight: np.ndarray
+    start_date: np.ndarray
+    end_date: np.ndarray
+    description: np.ndarray
+    
+    _ITEM: ClassVar[type] = ThemeData
+    _ENUMS: ClassVar[Dict[str, type]] = {'theme_type': ThemeType}
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {
+        'start_date': _optional_scalar, 'end_date': _optional_scalar
+    }
+    _to_df = staticmethod(themes_to_df)
+    _from_df = staticmethod(df_to_themes)
+
+
+@dataclass(eq=False)
+class DragonTigerBatch(_DerivativeBatch):
+    """龙虎榜列式批量数据"""
+    symbol: np.ndarray
+    date: np.ndarray
+    dragon_tiger_type: pd.Categorical
+    reason: pd.Categorical
+    buy_amount: np.ndarray
+    sell_amount: np.ndarray
+    net_amount: np.ndarray
+    buy_seats: np.ndarray
+    sell_seats: np.ndarray
+    turnover_rate: np.ndarray
+    price_change: np.ndarray
+    
+    _ITEM: ClassVar[type] = DragonTigerData
+    _ENUMS: ClassVar[Dict[str, type]] = {'dragon_tiger_type': DragonTigerType, 'reason': DragonTigerReason}
+    _CONVERTERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {'buy_seats': _split_joined, 'sell_seats': _split_joined}
+    _to_df = staticmethod(dragon_tigers_to_df)
+    _from_df = staticmethod(df_to_dragon_tigers)
+
+
+# ========== Arrow 转换函数 ==========
+
+def announcements_to_arrow(announcements: List[AnnouncementData]) -> pa.Table:
+    """将公告数据列表转换为Arrow表"""
+    return _arrow_table(ANNOUNCEMENT_SCHEMA, {
+        'symbol': [ann.symbol for ann in announcements],
+        'title': [ann.title for ann in announcements],
+        'content': [ann.content for ann in announcements],
+        'announcement_date': [ann.announcement_date for ann in announcements],
+        'announcement_type': _enum_dictionary([ann.announcement_type for ann in announcements], AnnouncementType),
+        'source': [ann.source for ann in announcements],
+        'url': [ann.url for ann in announcements],
+        'keywords': [ann.keywords for ann in announcements],
+        'importance': [ann.importance for ann in announcements],
+        'is_important': [ann.is_important for ann in announcements]
+    })
+
+
+def news_sentiments_to_arrow(news_sentiments: List[NewsSentimentData]) -> pa.Table:
+    """将新闻情绪数据列表转换为Arrow表"""
+    return _arrow_table(NEWS_SENTIMENT_SCHEMA, {
+        'symbol': [sent.symbol for sent in news_sentiments],
+        'title': [sent.title for sent in news_sentiments],
+        'content': [sent.content for sent in news_sentiments],
+        'publish_date': [sent.publish_date for sent in news_sentiments],
+        'sentiment': _enum_dictionary([sent.sentiment for sent in news_sentiments], NewsSentiment),
+        'sentiment_score': [sent.sentiment_score for sent in news_sentiments],
+        'source': [sent.source for sent in news_sentiments],
+        'url': [sent.url for sent in news_sentiments],
+        'keywords': [sent.keywords for sent in news_sentiments],
+        'confidence': [sent.confidence for sent in news_sentiments]
+    })
+
+
+def research_reports_to_arrow(research_reports: List[ResearchReportData]) -> pa.Table:
+    """将研报数据列表转换为Arrow表"""
+    return _arrow_table(RESEARCH_REPORT_SCHEMA, {
+        'symbol': [report.symbol for report in research_reports],
+        'title': [report.title for report in research_reports],
+        'content': [report.content for report in research_reports],
+        'publish_date': [report.publish_date for report in research_reports],
+        'report_type': _enum_dictionary([report.report_type for report in research_reports], ReportType),
+        'rating': _enum_dictionary([report.rating for report in research_reports], ReportRating),
+        'target_price': [report.target_price for report in research_reports],
+        'current_price': [report.current_price for report in research_reports],
+        'analyst': [report.analyst for report in research_reports],
+        'institution': [report.institution for report in research_reports],
+        'source': [report.source for report in research_reports],
+        'url': [report.url for report in research_reports],
+        'summary': [report.summary for report in research_reports]
+    })
+
+
+def capital_flows_to_arrow(capital_flows: List[CapitalFlowData]) -> pa.Table:
+    """将资金流数据列表转换为Arrow表"""
+    return _arrow_table(CAPITAL_FLOW_SCHEMA, {
+        'symbol': [flow.symbol for flow in capital_flows],
+        'date': [flow.date for flow in capital_flows],
+        'flow_type': _enum_dictionary([flow.flow_type for flow in capital_flows], FlowType),
+        'direction': _enum_dictionary([flow.direction for flow in capital_flows], FlowDirection),
+        'net_amount': [flow.net_amount for flow in capital_flows],
+        'inflow_amount': [flow.inflow_amount for flow in capital_flows],
+        'outflow_amount': [flow.outflow_amount for flow in capital_flows],
+        'volume': [flow.volume for flow in capital_flows],
+        'turnover_rate': [flow.turnover_rate for flow in capital_flows]
+    })
+
+
+def themes_to_arrow(themes: List[ThemeData]) -> pa.Table:
+    """将主题数据列表转换为Arrow表"""
+    return _arrow_table(THEME_SCHEMA, {
+        'symbol': [theme.symbol for theme in themes],
+        'theme_name': [theme.theme_name for theme in themes],
+        'theme_type': _enum_dictionary([theme.theme_type for theme in themes], ThemeType),
+        'weight': [theme.weight for theme in themes],
+        'start_date': [theme.start_date for theme in themes],
+        'end_date': [theme.end_date for theme in themes],
+        'description': [theme.description for theme in themes]
+    })
+
+
+def dragon_tigers_to_arrow(dragon_tigers: List[DragonTigerData]) -> pa.Table:
+    """将龙虎榜数据列表转换为Arrow表"""
+    return _arrow_table(DRAGON_TIGER_SCHEMA, {
+        'symbol': [dt.symbol for dt in dragon_tigers],
+        'date': [dt.date for dt in dragon_tigers],
+        'dragon_tiger_type': _enum_dictionary([dt.dragon_tiger_type for dt in dragon_tigers], DragonTigerType),
+        'reason': _enum_dictionary([dt.reason for dt in dragon_tigers], DragonTigerReason),
+        'buy_amount': [dt.buy_amount for dt in dragon_tigers],
+        'sell_amount': [dt.sell_amount for dt in dragon_tigers],
+        'net_amount': [dt.net_amount for dt in dragon_tigers],
+        'buy_seats': [dt.buy_seats for dt in dragon_tigers],
+        'sell_seats': [dt.sell_seats for dt in dragon_tigers],
+        'turnover_rate': [dt.turnover_rate for dt in dragon_tigers],
+        'price_change': [dt.price_change for dt in dragon_tigers]
+    })
+
+
 # ========== 常量定义 ==========
 
 # 公告数据列名
@@ -554,7 +986,7 @@ DRAGON_TIGER_COLUMNS = [
     'turnover_rate', 'price_change'
 ]
 
-# 数据类型映射
+# 数据类型映射（价格、金额、权重等保持 float64，与 THIRD_PARTY_DTYPES 一致；int8/category 仅用于无损场景）
 DERIVATIVE_DTYPES = {
     'symbol': 'string',
     'title': 'string',
@@ -585,17 +1017,105 @@ DERIVATIVE_DTYPES = {
     'reason': 'category',
     'importance': 'int8',
     'is_important': 'boolean',
-    'sentiment_score': 'float32',
-    'confidence': 'float32',
-    'target_price': 'float32',
-    'current_price': 'float32',
-    'net_amount': 'float32',
-    'inflow_amount': 'float32',
-    'outflow_amount': 'float32',
-    'volume': 'float32',
-    'turnover_rate': 'float32',
-    'weight': 'float32',
-    'buy_amount': 'float32',
-    'sell_amount': 'float32',
-    'price_change': 'float32'
+    'sentiment_score': 'float64',
+    'confidence': 'float64',
+    'target_price': 'float64',
+    'current_price': 'float64',
+    'net_amount': 'float64',
+    'inflow_amount': 'float64',
+    'outflow_amount': 'float64',
+    'volume': 'float64',
+    'turnover_rate': 'float64',
+    'weight': 'float64',
+    'buy_amount': 'float64',
+    'sell_amount': 'float64',
+    'price_change': 'float64'
 }
+
+# ========== Arrow Schema ==========
+
+_ENUM_DICT_TYPE = pa.dictionary(pa.int16(), pa.string())
+
+# 公告数据Arrow Schema
+ANNOUNCEMENT_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('title', pa.string()),
+    ('content', pa.string()),
+    ('announcement_date', pa.timestamp('ns')),
+    ('announcement_type', _ENUM_DICT_TYPE),
+    ('source', pa.string()),
+    ('url', pa.string()),
+    ('keywords', pa.list_(pa.string())),
+    ('importance', pa.int8()),
+    ('is_important', pa.bool_())
+])
+
+# 新闻情绪数据Arrow Schema
+NEWS_SENTIMENT_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('title', pa.string()),
+    ('content', pa.string()),
+    ('publish_date', pa.timestamp('ns')),
+    ('sentiment', _ENUM_DICT_TYPE),
+    ('sentiment_score', pa.float64()),
+    ('source', pa.string()),
+    ('url', pa.string()),
+    ('keywords', pa.list_(pa.string())),
+    ('confidence', pa.float64())
+])
+
+# 研报数据Arrow Schema
+RESEARCH_REPORT_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('title', pa.string()),
+    ('content', pa.string()),
+    ('publish_date', pa.timestamp('ns')),
+    ('report_type', _ENUM_DICT_TYPE),
+    ('rating', _ENUM_DICT_TYPE),
+    ('target_price', pa.float64()),
+    ('current_price', pa.float64()),
+    ('analyst', pa.string()),
+    ('institution', pa.string()),
+    ('source', pa.string()),
+    ('url', pa.string()),
+    ('summary', pa.string())
+])
+
+# 资金流数据Arrow Schema
+CAPITAL_FLOW_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('date', pa.timestamp('ns')),
+    ('flow_type', _ENUM_DICT_TYPE),
+    ('direction', _ENUM_DICT_TYPE),
+    ('net_amount', pa.float64()),
+    ('inflow_amount', pa.float64()),
+    ('outflow_amount', pa.float64()),
+    ('volume', pa.float64()),
+    ('turnover_rate', pa.float64())
+])
+
+# 主题数据Arrow Schema
+THEME_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('theme_name', pa.string()),
+    ('theme_type', _ENUM_DICT_TYPE),
+    ('weight', pa.float64()),
+    ('start_date', pa.timestamp('ns')),
+    ('end_date', pa.timestamp('ns')),
+    ('description', pa.string())
+])
+
+# 龙虎榜数据Arrow Schema
+DRAGON_TIGER_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('date', pa.timestamp('ns')),
+    ('dragon_tiger_type', _ENUM_DICT_TYPE),
+    ('reason', _ENUM_DICT_TYPE),
+    ('buy_amount', pa.float64()),
+    ('sell_amount', pa.float64()),
+    ('net_amount', pa.float64()),
+    ('buy_seats', pa.list_(pa.string())),
+    ('sell_seats', pa.list_(pa.string())),
+    ('turnover_rate', pa.float64()),
+    ('price_change', pa.float64())
+])
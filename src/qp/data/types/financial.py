@@ -3,10 +3,15 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
 import pandas as pd
+import pyarrow as pa
 
-from .common import Exchange, _to_utc
+from .common import (
+    Exchange, _EXCHANGE_MAP, _arrow_table, _df_column, _enum_column, _enum_dictionary,
+    _merge_extra_fields, _sort_order, _to_utc_series
+)
 
 
 class FinancialReportType(Enum):
@@ -26,7 +31,11 @@ class ReportPeriod(Enum):
     ANNUAL = "annual"   # 年度（与Q4等同）
 
 
-@dataclass(frozen=True)
+# 共享的空扩展字段（只读），无扩展指标的实例都指向它
+_EMPTY_EXTRA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class FinancialData:
     """财务报表数据"""
     symbol: str
@@ -70,10 +79,18 @@ class FinancialData:
     current_ratio: Optional[float] = None             # 流动比率
 
     # 扩展字段（JSON存储其他指标）
-    extra_fields: Optional[Dict[str, Any]] = None
+    # 约定：无扩展指标时传 None 或空映射，空映射会被归一为共享的 _EMPTY_EXTRA
+    extra_fields: Optional[Mapping[str, Any]] = None
+
+    def __post_init__(self):
+        if self.extra_fields is not None and not self.extra_fields:
+            object.__setattr__(self, "extra_fields", _EMPTY_EXTRA)
 
 
 # ========== 常量定义 ==========
+_REPORT_TYPE_MAP = {m.value: m for m in FinancialReportType}
+_REPORT_PERIOD_MAP = {m.value: m for m in ReportPeriod}
+
 FINANCIAL_COLUMNS = [
     "symbol", "exchange", "report_date", "publish_date",
     "report_type", "report_period",
@@ -82,6 +99,25 @@ FINANCIAL_COLUMNS = [
     "cash_flow_operating", "roe", "roa"
 ]
 
+# 财务数据Arrow Schema（扩展字段按实际取值追加）
+FINANCIAL_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("exchange", pa.dictionary(pa.int16(), pa.string())),
+    ("report_date", pa.timestamp("ns", tz="UTC")),
+    ("publish_date", pa.timestamp("ns", tz="UTC")),
+    ("report_type", pa.dictionary(pa.int16(), pa.string())),
+    ("report_period", pa.dictionary(pa.int16(), pa.string())),
+    ("total_assets", pa.float64()),
+    ("total_liabilities", pa.float64()),
+    ("total_equity", pa.float64()),
+    ("revenue", pa.float64()),
+    ("net_profit", pa.float64()),
+    ("operating_profit", pa.float64()),
+    ("cash_flow_operating", pa.float64()),
+    ("roe", pa.float64()),
+    ("roa", pa.float64()),
+])
+
 
 # ========== 转换函数 ==========
 def financials_to_df(data_list: list[FinancialData]) -> pd.DataFrame:
@@ -89,33 +125,33 @@ def financials_to_df(data_list: list[FinancialData]) -> pd.DataFrame:
     if not data_list:
         return pd.DataFrame(columns=FINANCIAL_COLUMNS)
 
-    records = []
-    for d in data_list:
-        record = {
-            "symbol": d.symbol,
-            "exchange": d.exchange.value if isinstance(d.exchange, Exchange) else d.exchange,
-            "report_date": _to_utc(d.report_date),
-            "publish_date": _to_utc(d.publish_date),
-            "report_type": d.report_type.value if isinstance(d.report_type, FinancialReportType) else d.report_type,
-            "report_period": d.report_period.value if isinstance(d.report_period, ReportPeriod) else d.report_period,
-            "total_assets": d.total_assets,
-            "total_liabilities": d.total_liabilities,
-            "total_equity": d.total_equity,
-            "revenue": d.revenue,
-            "net_profit": d.net_profit,
-            "operating_profit": d.operating_profit,
-            "cash_flow_operating": d.cash_flow_operating,
-            "roe": d.roe,
-            "roa": d.roa,
-        }
-
-        # 添加扩展字段
-        if d.extra_fields:
-            record.update(d.extra_fields)
-
-        records.append(record)
-
-    return pd.DataFrame(records).sort_values("report_date")
+    # 先规整为UTC再确定日期顺序（允许混合带/不带时区的输入），在Python侧重排记录，
+    # 省去构造后 sort_values 的整表拷贝；上游已有序时直接跳过
+    dates = _to_utc_series(pd.Series([d.report_date for d in data_list]))
+    order = _sort_order(dates)
+    if order is not None:
+        data_list = [data_list[i] for i in order]
+        dates = dates.take(order).reset_index(drop=True)
+    columns = {
+        "symbol": [d.symbol for d in data_list],
+        "exchange": _enum_column([d.exchange for d in data_list], Exchange),
+        "report_date": dates,
+        "publish_date": _to_utc_series(pd.Series([d.publish_date for d in data_list])),
+        "report_type": _enum_column([d.report_type for d in data_list], FinancialReportType),
+        "report_period": _enum_column([d.report_period for d in data_list], ReportPeriod),
+        "total_assets": [d.total_assets for d in data_list],
+        "total_liabilities": [d.total_liabilities for d in data_list],
+        "total_equity": [d.total_equity for d in data_list],
+        "revenue": [d.revenue for d in data_list],
+        "net_profit": [d.net_profit for d in data_list],
+        "operating_profit": [d.operating_profit for d in data_list],
+        "cash_flow_operating": [d.cash_flow_operating for d in data_list],
+        "roe": [d.roe for d in data_list],
+        "roa": [d.roa for d in data_list],
+    }
+
+    # 添加扩展字段
+    return pd.DataFrame(_merge_extra_fields(columns, data_list))
 
 
 def df_to_financials(df: pd.DataFrame) -> list[FinancialData]:
@@ -123,20 +159,63 @@ def df_to_financials(df: pd.DataFrame) -> list[FinancialData]:
     if df.empty:
         return []
 
-    result = []
-    for _, row in df.iterrows():
-        result.append(FinancialData(
-            symbol=str(row.get("symbol", "")),
-            exchange=Exchange(row.get("exchange", "OTHER")),
-            report_date=pd.Timestamp(row["report_date"]),
-            publish_date=pd.Timestamp(row["publish_date"]),
-            report_type=FinancialReportType(row.get("report_type", "income")),
-            report_period=ReportPeriod(row.get("report_period", "q4")),
-            total_assets=float(row.get("total_assets", 0)) if pd.notna(row.get("total_assets")) else None,
-            revenue=float(row.get("revenue", 0)) if pd.notna(row.get("revenue")) else None,
-            net_profit=float(row.get("net_profit", 0)) if pd.notna(row.get("net_profit")) else None,
+    def number(name: str) -> list:
+        return [float(v) if pd.notna(v) else None for v in _df_column(df, name)]
+
+    result: list[FinancialData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    exchange_of = _EXCHANGE_MAP.get
+    report_type_of = _REPORT_TYPE_MAP.get
+    report_period_of = _REPORT_PERIOD_MAP.get
+    timestamp = pd.Timestamp
+    append = result.append
+    for (symbol, exchange, report_date, publish_date, report_type, report_period,
+         total_assets, revenue, net_profit) in zip(
+        _df_column(df, "symbol", ""), _df_column(df, "exchange", "OTHER"),
+        df["report_date"].tolist(), df["publish_date"].tolist(),
+        _df_column(df, "report_type", "income"), _df_column(df, "report_period", "q4"),
+        number("total_assets"), number("revenue"), number("net_profit")
+    ):
+        append(FinancialData(
+            symbol=str(symbol),
+            exchange=exchange_of(exchange) or Exchange(exchange),
+            report_date=timestamp(report_date),
+            publish_date=timestamp(publish_date),
+            report_type=report_type_of(report_type) or FinancialReportType(report_type),
+            report_period=report_period_of(report_period) or ReportPeriod(report_period),
+            total_assets=total_assets,
+            revenue=revenue,
+            net_profit=net_profit,
             # 可以根据需要添加更多字段
         ))
 
     return result
 
+
+def financials_to_arrow(data_list: list[FinancialData]) -> pa.Table:
+    """将财务数据列表转为Arrow表"""
+    table = _arrow_table(FINANCIAL_SCHEMA, {
+        "symbol": [d.symbol for d in data_list],
+        "exchange": _enum_dictionary([d.exchange for d in data_list], Exchange),
+        "report_date": [d.report_date for d in data_list],
+        "publish_date": [d.publish_date for d in data_list],
+        "report_type": _enum_dictionary([d.report_type for d in data_list], FinancialReportType),
+        "report_period": _enum_dictionary([d.report_period for d in data_list], ReportPeriod),
+        "total_assets": [d.total_assets for d in data_list],
+        "total_liabilities": [d.total_liabilities for d in data_list],
+        "total_equity": [d.total_equity for d in data_list],
+        "revenue": [d.revenue for d in data_list],
+        "net_profit": [d.net_profit for d in data_list],
+        "operating_profit": [d.operating_profit for d in data_list],
+        "cash_flow_operating": [d.cash_flow_operating for d in data_list],
+        "roe": [d.roe for d in data_list],
+        "roa": [d.roa for d in data_list],
+    })
+
+    # 追加扩展字段列（与固定列同名的扩展字段以固定列为准）
+    extras = _merge_extra_fields({}, data_list)
+    for key, values in extras.items():
+        if key in table.column_names:
+            continue
+        table = table.append_column(key, pa.array(values))
+    return table.sort_by("report_date")
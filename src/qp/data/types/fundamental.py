@@ -2,13 +2,22 @@
 """基本面数据相关类型定义"""
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
 import pandas as pd
+import pyarrow as pa
 
-from .common import Exchange, _to_utc
+from .common import (
+    Exchange, _EXCHANGE_MAP, _arrow_table, _df_column, _enum_column, _enum_dictionary,
+    _merge_extra_fields, _sort_order, _to_utc_series
+)
 
 
-@dataclass(frozen=True)
+# 共享的空扩展字段（只读），无扩展指标的实例都指向它
+_EMPTY_EXTRA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class FundamentalData:
     """基本面数据（日频或定期更新）"""
     symbol: str
@@ -58,7 +67,12 @@ class FundamentalData:
     payout_ratio: Optional[float] = None            # 分红率
 
     # 扩展字段
-    extra_fields: Optional[Dict[str, Any]] = None
+    # 约定：无扩展指标时传 None 或空映射，空映射会被归一为共享的 _EMPTY_EXTRA
+    extra_fields: Optional[Mapping[str, Any]] = None
+
+    def __post_init__(self):
+        if self.extra_fields is not None and not self.extra_fields:
+            object.__setattr__(self, "extra_fields", _EMPTY_EXTRA)
 
 
 # ========== 常量定义 ==========
@@ -71,6 +85,26 @@ FUNDAMENTAL_COLUMNS = [
     "gross_margin", "net_margin"
 ]
 
+# 基本面数据Arrow Schema（扩展字段按实际取值追加）
+FUNDAMENTAL_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("exchange", pa.dictionary(pa.int16(), pa.string())),
+    ("date", pa.timestamp("ns", tz="UTC")),
+    ("pe_ratio", pa.float64()),
+    ("pe_ttm", pa.float64()),
+    ("pb_ratio", pa.float64()),
+    ("ps_ratio", pa.float64()),
+    ("market_cap", pa.float64()),
+    ("circulating_market_cap", pa.float64()),
+    ("roe", pa.float64()),
+    ("roa", pa.float64()),
+    ("debt_to_asset_ratio", pa.float64()),
+    ("revenue_growth", pa.float64()),
+    ("profit_growth", pa.float64()),
+    ("gross_margin", pa.float64()),
+    ("net_margin", pa.float64()),
+])
+
 
 # ========== 转换函数 ==========
 def fundamentals_to_df(data_list: list[FundamentalData]) -> pd.DataFrame:
@@ -78,33 +112,34 @@ def fundamentals_to_df(data_list: list[FundamentalData]) -> pd.DataFrame:
     if not data_list:
         return pd.DataFrame(columns=FUNDAMENTAL_COLUMNS)
 
-    records = []
-    for d in data_list:
-        record = {
-            "symbol": d.symbol,
-            "exchange": d.exchange.value if isinstance(d.exchange, Exchange) else d.exchange,
-            "date": _to_utc(d.date),
-            "pe_ratio": d.pe_ratio,
-            "pe_ttm": d.pe_ttm,
-            "pb_ratio": d.pb_ratio,
-            "ps_ratio": d.ps_ratio,
-            "market_cap": d.market_cap,
-            "circulating_market_cap": d.circulating_market_cap,
-            "roe": d.roe,
-            "roa": d.roa,
-            "debt_to_asset_ratio": d.debt_to_asset_ratio,
-            "revenue_growth": d.revenue_growth,
-            "profit_growth": d.profit_growth,
-            "gross_margin": d.gross_margin,
-            "net_margin": d.net_margin,
-        }
-
-        if d.extra_fields:
-            record.update(d.extra_fields)
-
-        records.append(record)
-
-    return pd.DataFrame(records).sort_values("date")
+    # 先规整为UTC再确定日期顺序（允许混合带/不带时区的输入），在Python侧重排记录，
+    # 省去构造后 sort_values 的整表拷贝；上游已有序时直接跳过
+    dates = _to_utc_series(pd.Series([d.date for d in data_list]))
+    order = _sort_order(dates)
+    if order is not None:
+        data_list = [data_list[i] for i in order]
+        dates = dates.take(order).reset_index(drop=True)
+    columns = {
+        "symbol": [d.symbol for d in data_list],
+        "exchange": _enum_column([d.exchange for d in data_list], Exchange),
+        "date": dates,
+        "pe_ratio": [d.pe_ratio for d in data_list],
+        "pe_ttm": [d.pe_ttm for d in data_list],
+        "pb_ratio": [d.pb_ratio for d in data_list],
+        "ps_ratio": [d.ps_ratio for d in data_list],
+        "market_cap": [d.market_cap for d in data_list],
+        "circulating_market_cap": [d.circulating_market_cap for d in data_list],
+        "roe": [d.roe for d in data_list],
+        "roa": [d.roa for d in data_list],
+        "debt_to_asset_ratio": [d.debt_to_asset_ratio for d in data_list],
+        "revenue_growth": [d.revenue_growth for d in data_list],
+        "profit_growth": [d.profit_growth for d in data_list],
+        "gross_margin": [d.gross_margin for d in data_list],
+        "net_margin": [d.net_margin for d in data_list],
+    }
+
+    # 添加扩展字段
+    return pd.DataFrame(_merge_extra_fields(columns, data_list))
 
 
 def df_to_fundamentals(df: pd.DataFrame) -> list[FundamentalData]:
@@ -112,18 +147,57 @@ def df_to_fundamentals(df: pd.DataFrame) -> list[FundamentalData]:
     if df.empty:
         return []
 
-    result = []
-    for _, row in df.iterrows():
-        result.append(FundamentalData(
-            symbol=str(row.get("symbol", "")),
-            exchange=Exchange(row.get("exchange", "OTHER")),
-            date=pd.Timestamp(row["date"]),
-            pe_ratio=float(row.get("pe_ratio")) if pd.notna(row.get("pe_ratio")) else None,
-            pb_ratio=float(row.get("pb_ratio")) if pd.notna(row.get("pb_ratio")) else None,
-            market_cap=float(row.get("market_cap")) if pd.notna(row.get("market_cap")) else None,
-            roe=float(row.get("roe")) if pd.notna(row.get("roe")) else None,
+    def number(name: str) -> list:
+        return [float(v) if pd.notna(v) else None for v in _df_column(df, name)]
+
+    result: list[FundamentalData] = []
+    # 循环内频繁使用的全局名绑定为局部变量
+    exchange_of = _EXCHANGE_MAP.get
+    timestamp = pd.Timestamp
+    append = result.append
+    for symbol, exchange, date, pe_ratio, pb_ratio, market_cap, roe in zip(
+        _df_column(df, "symbol", ""), _df_column(df, "exchange", "OTHER"), df["date"].tolist(),
+        number("pe_ratio"), number("pb_ratio"), number("market_cap"), number("roe")
+    ):
+        append(FundamentalData(
+            symbol=str(symbol),
+            exchange=exchange_of(exchange) or Exchange(exchange),
+            date=timestamp(date),
+            pe_ratio=pe_ratio,
+            pb_ratio=pb_ratio,
+            market_cap=market_cap,
+            roe=roe,
             # 可以根据需要添加更多字段
         ))
 
     return result
 
+
+def fundamentals_to_arrow(data_list: list[FundamentalData]) -> pa.Table:
+    """将基本面数据列表转为Arrow表"""
+    table = _arrow_table(FUNDAMENTAL_SCHEMA, {
+        "symbol": [d.symbol for d in data_list],
+        "exchange": _enum_dictionary([d.exchange for d in data_list], Exchange),
+        "date": [d.date for d in data_list],
+        "pe_ratio": [d.pe_ratio for d in data_list],
+        "pe_ttm": [d.pe_ttm for d in data_list],
+        "pb_ratio": [d.pb_ratio for d in data_list],
+        "ps_ratio": [d.ps_ratio for d in data_list],
+        "market_cap": [d.market_cap for d in data_list],
+        "circulating_market_cap": [d.circulating_market_cap for d in data_list],
+        "roe": [d.roe for d in data_list],
+        "roa": [d.roa for d in data_list],
+        "debt_to_asset_ratio": [d.debt_to_asset_ratio for d in data_list],
+        "revenue_growth": [d.revenue_growth for d in data_list],
+        "profit_growth": [d.profit_growth for d in data_list],
+        "gross_margin": [d.gross_margin for d in data_list],
+        "net_margin": [d.net_margin for d in data_list],
+    })
+
+    # 追加扩展字段列（与固定列同名的扩展字段以固定列为准）
+    extras = _merge_extra_fields({}, data_list)
+    for key, values in extras.items():
+        if key in table.column_names:
+            continue
+        table = table.append_column(key, pa.array(values))
+    return table.sort_by("date")
@@ -9,8 +9,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, ClassVar, Iterator, Union
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from .common import (
+    _ColumnBatch, _arrow_table, _column_list, _df_column, _enum_categorical, _enum_dictionary,
+    _iter_row_slices, _narrow_dtypes
+)
 
 
 # ========== 枚举定义 ==========
@@ -67,9 +74,34 @@ class DataFrequency(Enum):
     IRREGULAR = "irregular" # 不定期
 
 
+# 分片转换时每片的行数
+CONVERT_CHUNK_SIZE = 65536
+
+# 枚举取值到成员的查找表（比 Enum(value) 少一次 __call__ 与别名回退）
+_INDEX_TYPE_MAP = {m.value: m for m in IndexType}
+_INDUSTRY_LEVEL_MAP = {m.value: m for m in IndustryLevel}
+_INDUSTRY_STANDARD_MAP = {m.value: m for m in IndustryStandard}
+_MACRO_DATA_TYPE_MAP = {m.value: m for m in MacroDataType}
+_FREQUENCY_MAP = {m.value: m for m in DataFrequency}
+
+# 枚举列名到枚举类型
+_ENUM_COLUMNS = {
+    'index_type': IndexType,
+    'industry_level': IndustryLevel,
+    'industry_standard': IndustryStandard,
+    'data_type': MacroDataType,
+    'frequency': DataFrequency,
+}
+
+
+def _apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """按 THIRD_PARTY_DTYPES 一次性收窄列类型"""
+    return _narrow_dtypes(df, THIRD_PARTY_DTYPES, _ENUM_COLUMNS)
+
+
 # ========== 数据类定义 ==========
 
-@dataclass
+@dataclass(slots=True)
 class IndexComponentData:
     """指数成分数据"""
     index_code: str
@@ -86,15 +118,16 @@ class IndexComponentData:
     source: str = ""  # 数据源
     
     def __post_init__(self):
-        if isinstance(self.index_type, str):
-            self.index_type = IndexType(self.index_type)
+        v = self.index_type
+        if isinstance(v, str):
+            self.index_type = _INDEX_TYPE_MAP.get(v) or IndexType(v)
         if isinstance(self.effective_date, str):
             self.effective_date = pd.to_datetime(self.effective_date)
         if isinstance(self.end_date, str):
             self.end_date = pd.to_datetime(self.end_date)
 
 
-@dataclass
+@dataclass(slots=True)
 class IndustryClassificationData:
     """行业分类数据"""
     symbol: str
@@ -111,17 +144,19 @@ class IndustryClassificationData:
     source: str = ""  # 数据源
     
     def __post_init__(self):
-        if isinstance(self.industry_level, str):
-            self.industry_level = IndustryLevel(self.industry_level)
-        if isinstance(self.industry_standard, str):
-            self.industry_standard = IndustryStandard(self.industry_standard)
+        v = self.industry_level
+        if isinstance(v, str):
+            self.industry_level = _INDUSTRY_LEVEL_MAP.get(v) or IndustryLevel(v)
+        v = self.industry_standard
+        if isinstance(v, str):
+            self.industry_standard = _INDUSTRY_STANDARD_MAP.get(v) or IndustryStandard(v)
         if isinstance(self.effective_date, str):
             self.effective_date = pd.to_datetime(self.effective_date)
         if isinstance(self.end_date, str):
             self.end_date = pd.to_datetime(self.end_date)
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroData:
     """宏观数据"""
     data_code: str
@@ -139,10 +174,12 @@ class MacroData:
     description: str = ""  # 数据描述
     
     def __post_init__(self):
-        if isinstance(self.data_type, str):
-            self.data_type = MacroDataType(self.data_type)
-        if isinstance(self.frequency, str):
-            self.frequency = DataFrequency(self.frequency)
+        v = self.data_type
+        if isinstance(v, str):
+            self.data_type = _MACRO_DATA_TYPE_MAP.get(v) or MacroDataType(v)
+        v = self.frequency
+        if isinstance(v, str):
+            self.frequency = _FREQUENCY_MAP.get(v) or DataFrequency(v)
         if isinstance(self.date, str):
             self.date = pd.to_datetime(self.date)
 
@@ -152,160 +189,244 @@ class MacroData:
 def index_components_to_df(components: List[IndexComponentData]) -> pd.DataFrame:
     """将指数成分数据列表转换为DataFrame"""
     if not components:
-        return pd.DataFrame(columns=[
-            'index_code', 'index_name', 'index_type', 'symbol', 'symbol_name',
-            'weight', 'market_cap', 'free_float', 'effective_date', 'end_date',
-            'is_active', 'source'
-        ])
-    
-    data = []
-    for comp in components:
-        data.append({
-            'index_code': comp.index_code,
-            'index_name': comp.index_name,
-            'index_type': comp.index_type.value,
-            'symbol': comp.symbol,
-            'symbol_name': comp.symbol_name,
-            'weight': comp.weight,
-            'market_cap': comp.market_cap,
-            'free_float': comp.free_float,
-            'effective_date': comp.effective_date,
-            'end_date': comp.end_date,
-            'is_active': comp.is_active,
-            'source': comp.source
-        })
+        return _EMPTY_INDEX_COMPONENT_DF.copy()
     
-    return pd.DataFrame(data)
-
-
-def df_to_index_components(df: pd.DataFrame) -> List[IndexComponentData]:
-    """将DataFrame转换为指数成分数据列表"""
-    components = []
-    for _, row in df.iterrows():
-        comp = IndexComponentData(
-            index_code=row['index_code'],
-            index_name=row['index_name'],
-            index_type=IndexType(row['index_type']),
-            symbol=row['symbol'],
-            symbol_name=row['symbol_name'],
-            weight=row['weight'],
-            market_cap=row.get('market_cap'),
-            free_float=row.get('free_float'),
-            effective_date=row.get('effective_date'),
-            end_date=row.get('end_date'),
-            is_active=row.get('is_active', True),
-            source=row.get('source', '')
+    return _apply_dtypes(pd.DataFrame({
+        'index_code': [comp.index_code for comp in components],
+        'index_name': [comp.index_name for comp in components],
+        'index_type': _enum_categorical([comp.index_type for comp in components], IndexType),
+        'symbol': [comp.symbol for comp in components],
+        'symbol_name': [comp.symbol_name for comp in components],
+        'weight': [comp.weight for comp in components],
+        'market_cap': [comp.market_cap for comp in components],
+        'free_float': [comp.free_float for comp in components],
+        'effective_date': [comp.effective_date for comp in components],
+        'end_date': [comp.end_date for comp in components],
+        'is_active': [comp.is_active for comp in components],
+        'source': [comp.source for comp in components]
+    }))
+
+
+def df_to_index_components(df: Union[pd.DataFrame, pa.Table]) -> List[IndexComponentData]:
+    """将DataFrame转换为指数成分数据列表（也可直接传入Arrow表）"""
+    index_types = _column_list(df, 'index_type')
+    # 每个不同取值只解析一次枚举
+    type_of = {v: _INDEX_TYPE_MAP.get(v) or IndexType(v) for v in set(index_types)}
+    return [
+        IndexComponentData(
+            index_code=index_code,
+            index_name=index_name,
+            index_type=type_of[index_type],
+            symbol=symbol,
+            symbol_name=symbol_name,
+            weight=weight,
+            market_cap=market_cap,
+            free_float=free_float,
+            effective_date=effective_date,
+            end_date=end_date,
+            is_active=is_active,
+            source=source
         )
-        components.append(comp)
-    
-    return components
+        for (index_code, index_name, index_type, symbol, symbol_name, weight, market_cap,
+             free_float, effective_date, end_date, is_active, source) in zip(
+            _column_list(df, 'index_code'), _column_list(df, 'index_name'), index_types,
+            _column_list(df, 'symbol'), _column_list(df, 'symbol_name'), _column_list(df, 'weight'),
+            _df_column(df, 'market_cap'), _df_column(df, 'free_float'),
+            _df_column(df, 'effective_date'), _df_column(df, 'end_date'),
+            _df_column(df, 'is_active', True), _df_column(df, 'source', '')
+        )
+    ]
 
 
 def industry_classifications_to_df(classifications: List[IndustryClassificationData]) -> pd.DataFrame:
     """将行业分类数据列表转换为DataFrame"""
     if not classifications:
-        return pd.DataFrame(columns=[
-            'symbol', 'symbol_name', 'industry_code', 'industry_name',
-            'industry_level', 'industry_standard', 'parent_industry_code',
-            'parent_industry_name', 'effective_date', 'end_date',
-            'is_active', 'source'
-        ])
+        return _EMPTY_INDUSTRY_CLASSIFICATION_DF.copy()
     
-    data = []
-    for cls in classifications:
-        data.append({
-            'symbol': cls.symbol,
-            'symbol_name': cls.symbol_name,
-            'industry_code': cls.industry_code,
-            'industry_name': cls.industry_name,
-            'industry_level': cls.industry_level.value,
-            'industry_standard': cls.industry_standard.value,
-            'parent_industry_code': cls.parent_industry_code,
-            'parent_industry_name': cls.parent_industry_name,
-            'effective_date': cls.effective_date,
-            'end_date': cls.end_date,
-            'is_active': cls.is_active,
-            'source': cls.source
-        })
-    
-    return pd.DataFrame(data)
-
-
-def df_to_industry_classifications(df: pd.DataFrame) -> List[IndustryClassificationData]:
-    """将DataFrame转换为行业分类数据列表"""
-    classifications = []
-    for _, row in df.iterrows():
-        cls = IndustryClassificationData(
-            symbol=row['symbol'],
-            symbol_name=row['symbol_name'],
-            industry_code=row['industry_code'],
-            industry_name=row['industry_name'],
-            industry_level=IndustryLevel(row['industry_level']),
-            industry_standard=IndustryStandard(row['industry_standard']),
-            parent_industry_code=row.get('parent_industry_code'),
-            parent_industry_name=row.get('parent_industry_name'),
-            effective_date=row.get('effective_date'),
-            end_date=row.get('end_date'),
-            is_active=row.get('is_active', True),
-            source=row.get('source', '')
+    return _apply_dtypes(pd.DataFrame({
+        'symbol': [cls.symbol for cls in classifications],
+        'symbol_name': [cls.symbol_name for cls in classifications],
+        'industry_code': [cls.industry_code for cls in classifications],
+        'industry_name': [cls.industry_name for cls in classifications],
+        'industry_level': _enum_categorical([cls.industry_level for cls in classifications], IndustryLevel),
+        'industry_standard': _enum_categorical([cls.industry_standard for cls in classifications], IndustryStandard),
+        'parent_industry_code': [cls.parent_industry_code for cls in classifications],
+        'parent_industry_name': [cls.parent_industry_name for cls in classifications],
+        'effective_date': [cls.effective_date for cls in classifications],
+        'end_date': [cls.end_date for cls in classifications],
+        'is_active': [cls.is_active for cls in classifications],
+        'source': [cls.source for cls in classifications]
+    }))
+
+
+def df_to_industry_classifications(df: Union[pd.DataFrame, pa.Table]) -> List[IndustryClassificationData]:
+    """将DataFrame转换为行业分类数据列表（也可直接传入Arrow表）"""
+    levels = _column_list(df, 'industry_level')
+    standards = _column_list(df, 'industry_standard')
+    # 每个不同取值只解析一次枚举
+    level_of = {v: _INDUSTRY_LEVEL_MAP.get(v) or IndustryLevel(v) for v in set(levels)}
+    standard_of = {v: _INDUSTRY_STANDARD_MAP.get(v) or IndustryStandard(v) for v in set(standards)}
+    return [
+        IndustryClassificationData(
+            symbol=symbol,
+            symbol_name=symbol_name,
+            industry_code=industry_code,
+            industry_name=industry_name,
+            industry_level=level_of[level],
+            industry_standard=standard_of[standard],
+            parent_industry_code=parent_code,
+            parent_industry_name=parent_name,
+            effective_date=effective_date,
+            end_date=end_date,
+            is_active=is_active,
+            source=source
         )
-        classifications.append(cls)
-    
-    return classifications
+        for (symbol, symbol_name, industry_code, industry_name, level, standard, parent_code,
+             parent_name, effective_date, end_date, is_active, source) in zip(
+            _column_list(df, 'symbol'), _column_list(df, 'symbol_name'),
+            _column_list(df, 'industry_code'), _column_list(df, 'industry_name'), levels, standards,
+            _df_column(df, 'parent_industry_code'), _df_column(df, 'parent_industry_name'),
+            _df_column(df, 'effective_date'), _df_column(df, 'end_date'),
+            _df_column(df, 'is_active', True), _df_column(df, 'source', '')
+        )
+    ]
 
 
 def macro_data_to_df(macro_data: List[MacroData]) -> pd.DataFrame:
     """将宏观数据列表转换为DataFrame"""
     if not macro_data:
-        return pd.DataFrame(columns=[
-            'data_code', 'data_name', 'data_type', 'frequency', 'date', 'value',
-            'unit', 'previous_value', 'change_value', 'change_rate',
-            'seasonally_adjusted', 'source', 'description'
-        ])
+        return _EMPTY_MACRO_DATA_DF.copy()
     
-    data = []
-    for macro in macro_data:
-        data.append({
-            'data_code': macro.data_code,
-            'data_name': macro.data_name,
-            'data_type': macro.data_type.value,
-            'frequency': macro.frequency.value,
-            'date': macro.date,
-            'value': macro.value,
-            'unit': macro.unit,
-            'previous_value': macro.previous_value,
-            'change_value': macro.change_value,
-            'change_rate': macro.change_rate,
-            'seasonally_adjusted': macro.seasonally_adjusted,
-            'source': macro.source,
-            'description': macro.description
-        })
-    
-    return pd.DataFrame(data)
-
-
-def df_to_macro_data(df: pd.DataFrame) -> List[MacroData]:
-    """将DataFrame转换为宏观数据列表"""
-    macro_data = []
-    for _, row in df.iterrows():
-        macro = MacroData(
-            data_code=row['data_code'],
-            data_name=row['data_name'],
-            data_type=MacroDataType(row['data_type']),
-            frequency=DataFrequency(row['frequency']),
-            date=row['date'],
-            value=row['value'],
-            unit=row.get('unit', ''),
-            previous_value=row.get('previous_value'),
-            change_value=row.get('change_value'),
-            change_rate=row.get('change_rate'),
-            seasonally_adjusted=row.get('seasonally_adjusted', False),
-            source=row.get('source', ''),
-            description=row.get('description', '')
+    return _apply_dtypes(pd.DataFrame({
+        'data_code': [macro.data_code for macro in macro_data],
+        'data_name': [macro.data_name for macro in macro_data],
+        'data_type': _enum_categorical([macro.data_type for macro in macro_data], MacroDataType),
+        'frequency': _enum_categorical([macro.frequency for macro in macro_data], DataFrequency),
+        'date': [macro.date for macro in macro_data],
+        'value': [macro.value for macro in macro_data],
+        'unit': [macro.unit for macro in macro_data],
+        'previous_value': [macro.previous_value for macro in macro_data],
+        'change_value': [macro.change_value for macro in macro_data],
+        'change_rate': [macro.change_rate for macro in macro_data],
+        'seasonally_adjusted': [macro.seasonally_adjusted for macro in macro_data],
+        'source': [macro.source for macro in macro_data],
+        'description': [macro.description for macro in macro_data]
+    }))
+
+
+def df_to_macro_data(df: Union[pd.DataFrame, pa.Table]) -> List[MacroData]:
+    """将DataFrame转换为宏观数据列表（也可直接传入Arrow表）"""
+    data_types = _column_list(df, 'data_type')
+    frequencies = _column_list(df, 'frequency')
+    # 每个不同取值只解析一次枚举
+    type_of = {v: _MACRO_DATA_TYPE_MAP.get(v) or MacroDataType(v) for v in set(data_types)}
+    frequency_of = {v: _FREQUENCY_MAP.get(v) or DataFrequency(v) for v in set(frequencies)}
+    return [
+        MacroData(
+            data_code=data_code,
+            data_name=data_name,
+            data_type=type_of[data_type],
+            frequency=frequency_of[frequency],
+            date=date,
+            value=value,
+            unit=unit,
+            previous_value=previous_value,
+            change_value=change_value,
+            change_rate=change_rate,
+            seasonally_adjusted=seasonally_adjusted,
+            source=source,
+            description=description
         )
-        macro_data.append(macro)
-    
-    return macro_data
+        for (data_code, data_name, data_type, frequency, date, value, unit, previous_value,
+             change_value, change_rate, seasonally_adjusted, source, description) in zip(
+            _column_list(df, 'data_code'), _column_list(df, 'data_name'), data_types, frequencies,
+            _column_list(df, 'date'), _column_list(df, 'value'), _df_column(df, 'unit', ''),
+            _df_column(df, 'previous_value'), _df_column(df, 'change_value'),
+            _df_column(df, 'change_rate'), _df_column(df, 'seasonally_adjusted', False),
+            _df_column(df, 'source', ''), _df_column(df, 'description', '')
+        )
+    ]
+
+
+# ========== 分片转换 ==========
+# 超大表逐片转换：对象构造受GIL约束，多线程无法提速，分片可限制单次驻留的对象数量
+
+def iter_index_components(df: Union[pd.DataFrame, pa.Table],
+                          chunk_size: int = CONVERT_CHUNK_SIZE) -> Iterator[List[IndexComponentData]]:
+    """按行分片将指数成分表转换为数据列表，逐片产出"""
+    for part in _iter_row_slices(df, chunk_size):
+        yield df_to_index_components(part)
+
+
+def iter_industry_classifications(df: Union[pd.DataFrame, pa.Table],
+                                  chunk_size: int = CONVERT_CHUNK_SIZE) -> Iterator[List[IndustryClassificationData]]:
+    """按行分片将行业分类表转换为数据列表，逐片产出"""
+    for part in _iter_row_slices(df, chunk_size):
+        yield df_to_industry_classifications(part)
+
+
+def iter_macro_data(df: Union[pd.DataFrame, pa.Table],
+                    chunk_size: int = CONVERT_CHUNK_SIZE) -> Iterator[List[MacroData]]:
+    """按行分片将宏观数据表转换为数据列表，逐片产出"""
+    for part in _iter_row_slices(df, chunk_size):
+        yield df_to_macro_data(part)
+
+
+# ========== Arrow 转换函数 ==========
+
+def index_components_to_arrow(components: List[IndexComponentData]) -> pa.Table:
+    """将指数成分数据列表转换为Arrow表"""
+    return _arrow_table(INDEX_COMPONENT_SCHEMA, {
+        'index_code': [comp.index_code for comp in components],
+        'index_name': [comp.index_name for comp in components],
+        'index_type': _enum_dictionary([comp.index_type for comp in components], IndexType),
+        'symbol': [comp.symbol for comp in components],
+        'symbol_name': [comp.symbol_name for comp in components],
+        'weight': [comp.weight for comp in components],
+        'market_cap': [comp.market_cap for comp in components],
+        'free_float': [comp.free_float for comp in components],
+        'effective_date': [comp.effective_date for comp in components],
+        'end_date': [comp.end_date for comp in components],
+        'is_active': [comp.is_active for comp in components],
+        'source': [comp.source for comp in components]
+    })
+
+
+def industry_classifications_to_arrow(classifications: List[IndustryClassificationData]) -> pa.Table:
+    """将行业分类数据列表转换为Arrow表"""
+    return _arrow_table(INDUSTRY_CLASSIFICATION_SCHEMA, {
+        'symbol': [cls.symbol for cls in classifications],
+        'symbol_name': [cls.symbol_name for cls in classifications],
+        'industry_code': [cls.industry_code for cls in classifications],
+        'industry_name': [cls.industry_name for cls in classifications],
+        'industry_level': _enum_dictionary([cls.industry_level for cls in classifications], IndustryLevel),
+        'industry_standard': _enum_dictionary([cls.industry_standard for cls in classifications], IndustryStandard),
+        'parent_industry_code': [cls.parent_industry_code for cls in classifications],
+        'parent_industry_name': [cls.parent_industry_name for cls in classifications],
+        'effective_date': [cls.effective_date for cls in classifications],
+        'end_date': [cls.end_date for cls in classifications],
+        'is_active': [cls.is_active for cls in classifications],
+        'source': [cls.source for cls in classifications]
+    })
+
+
+def macro_data_to_arrow(macro_data: List[MacroData]) -> pa.Table:
+    """将宏观数据列表转换为Arrow表"""
+    return _arrow_table(MACRO_DATA_SCHEMA, {
+        'data_code': [macro.data_code for macro in macro_data],
+        'data_name': [macro.data_name for macro in macro_data],
+        'data_type': _enum_dictionary([macro.data_type for macro in macro_data], MacroDataType),
+        'frequency': _enum_dictionary([macro.frequency for macro in macro_data], DataFrequency),
+        'date': [macro.date for macro in macro_data],
+        'value': [macro.value for macro in macro_data],
+        'unit': [macro.unit for macro in macro_data],
+        'previous_value': [macro.previous_value for macro in macro_data],
+        'change_value': [macro.change_value for macro in macro_data],
+        'change_rate': [macro.change_rate for macro in macro_data],
+        'seasonally_adjusted': [macro.seasonally_adjusted for macro in macro_data],
+        'source': [macro.source for macro in macro_data],
+        'description': [macro.description for macro in macro_data]
+    })
 
 
 # ========== 常量定义 ==========
@@ -332,7 +453,7 @@ MACRO_DATA_COLUMNS = [
     'seasonally_adjusted', 'source', 'description'
 ]
 
-# 数据类型映射
+# 数据类型映射（权重、宏观数值等保持 float64，读回时不引入 float32 舍入误差）
 THIRD_PARTY_DTYPES = {
     'index_code': 'string',
     'index_name': 'string',
@@ -355,13 +476,147 @@ THIRD_PARTY_DTYPES = {
     'industry_standard': 'category',
     'data_type': 'category',
     'frequency': 'category',
-    'weight': 'float32',
-    'market_cap': 'float32',
-    'free_float': 'float32',
-    'value': 'float32',
-    'previous_value': 'float32',
-    'change_value': 'float32',
-    'change_rate': 'float32',
+    'weight': 'float64',
+    'market_cap': 'float64',
+    'free_float': 'float64',
+    'value': 'float64',
+    'previous_value': 'float64',
+    'change_value': 'float64',
+    'change_rate': 'float64',
     'is_active': 'boolean',
     'seasonally_adjusted': 'boolean'
 }
+
+# 预先按 THIRD_PARTY_DTYPES 定型的空表骨架（空结果与真实数据拼接时不再重新推断/升级类型）
+_EMPTY_INDEX_COMPONENT_DF = _apply_dtypes(pd.DataFrame(columns=INDEX_COMPONENT_COLUMNS))
+_EMPTY_INDUSTRY_CLASSIFICATION_DF = _apply_dtypes(pd.DataFrame(columns=INDUSTRY_CLASSIFICATION_COLUMNS))
+_EMPTY_MACRO_DATA_DF = _apply_dtypes(pd.DataFrame(columns=MACRO_DATA_COLUMNS))
+
+# ========== Arrow Schema ==========
+
+_ENUM_DICT_TYPE = pa.dictionary(pa.int16(), pa.string())
+
+# 指数成分数据Arrow Schema
+INDEX_COMPONENT_SCHEMA = pa.schema([
+    ('index_code', pa.string()),
+    ('index_name', pa.string()),
+    ('index_type', _ENUM_DICT_TYPE),
+    ('symbol', pa.string()),
+    ('symbol_name', pa.string()),
+    ('weight', pa.float64()),
+    ('market_cap', pa.float64()),
+    ('free_float', pa.float64()),
+    ('effective_date', pa.timestamp('ns')),
+    ('end_date', pa.timestamp('ns')),
+    ('is_active', pa.bool_()),
+    ('source', pa.string())
+])
+
+# 行业分类数据Arrow Schema
+INDUSTRY_CLASSIFICATION_SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('symbol_name', pa.string()),
+    ('industry_code', pa.string()),
+    ('industry_name', pa.string()),
+    ('industry_level', _ENUM_DICT_TYPE),
+    ('industry_standard', _ENUM_DICT_TYPE),
+    ('parent_industry_code', pa.string()),
+    ('parent_industry_name', pa.string()),
+    ('effective_date', pa.timestamp('ns')),
+    ('end_date', pa.timestamp('ns')),
+    ('is_active', pa.bool_()),
+    ('source', pa.string())
+])
+
+# 宏观数据Arrow Schema
+MACRO_DATA_SCHEMA = pa.schema([
+    ('data_code', pa.string()),
+    ('data_name', pa.string()),
+    ('data_type', _ENUM_DICT_TYPE),
+    ('frequency', _ENUM_DICT_TYPE),
+    ('date', pa.timestamp('ns')),
+    ('value', pa.float64()),
+    ('unit', pa.string()),
+    ('previous_value', pa.float64()),
+    ('change_value', pa.float64()),
+    ('change_rate', pa.float64()),
+    ('seasonally_adjusted', pa.bool_()),
+    ('source', pa.string()),
+    ('description', pa.string())
+])
+
+
+# ========== 列式批量容器 ==========
+
+class _ThirdPartyBatch(_ColumnBatch):
+    """第三方数据列式批量容器，列类型按 THIRD_PARTY_DTYPES 存放"""
+    _dtypes = staticmethod(lambda: THIRD_PARTY_DTYPES)
+
+
+@dataclass(eq=False)
+class IndexComponentBatch(_ThirdPartyBatch):
+    """指数成分列式批量数据"""
+    index_code: np.ndarray
+    index_name: np.ndarray
+    index_type: pd.Categorical
+    symbol: np.ndarray
+    symbol_name: np.ndarray
+    weight: np.ndarray
+    market_cap: np.ndarray
+    free_float: np.ndarray
+    effective_date: np.ndarray
+    end_date: np.ndarray
+    is_active: np.ndarray
+    source: np.ndarray
+    
+    _ITEM: ClassVar[type] = IndexComponentData
+    _ENUMS: ClassVar[Dict[str, type]] = {'index_type': IndexType}
+    _to_df = staticmethod(index_components_to_df)
+    _from_df = staticmethod(df_to_index_components)
+
+
+@dataclass(eq=False)
+class IndustryClassificationBatch(_ThirdPartyBatch):
+    """行业分类列式批量数据"""
+    symbol: np.ndarray
+    symbol_name: np.ndarray
+    industry_code: np.ndarray
+    industry_name: np.ndarray
+    industry_level: pd.Categorical
+    industry_standard: pd.Categorical
+    parent_industry_code: np.ndarray
+    parent_industry_name: np.ndarray
+    effective_date: np.ndarray
+    end_date: np.ndarray
+    is_active: np.ndarray
+    source: np.ndarray
+    
+    _ITEM: ClassVar[type] = IndustryClassificationData
+    _ENUMS: ClassVar[Dict[str, type]] = {
+        'industry_level': IndustryLevel, 'industry_standard': IndustryStandard
+    }
+    _to_df = staticmethod(industry_classifications_to_df)
+    _from_df = staticmethod(df_to_industry_classifications)
+
+
+@dataclass(eq=False)
+class MacroDataBatch(_ThirdPartyBatch):
+    """宏观数据列式批量数据"""
+    data_code: np.ndarray
+    data_name: np.ndarray
+    data_type: pd.Categorical
+    frequency: pd.Categorical
+    date: np.ndarray
+    value: np.ndarray
+    unit: np.ndarray
+    previous_value: np.ndarray
+    change_value: np.ndarray
+    change_rate: np.ndarray
+    seasonally_adjusted: np.ndarray
+    source: np.ndarray
+    description: np.ndarray
+    
+    _ITEM: ClassVar[type] = MacroData
+    _ENUMS: ClassVar[Dict[str, type]] = {'data_type': MacroDataType, 'frequency': DataFrequency}
+    _to_df = staticmethod(macro_data_to_df)
+    _from_df = staticmethod(df_to_macro_data)
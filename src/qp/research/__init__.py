@@ -11,6 +11,7 @@ from .selector import (
     StockScreener,
     create_stock_selector,
     run_stock_selection,
+    run_stock_selection_batch,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "StockScreener",
     "create_stock_selector",
     "run_stock_selection",
+    "run_stock_selection_batch",
 ]
@@ -0,0 +1,250 @@
+"""
+因子计算的JIT加速内核
+
+价格按 (symbol, trade_date) 排序后各股票为连续区段，内核按区段并行计算动量与波动率；
+另含逐列滚动标准差与带单票上限的 softmax 权重注水求解。numba 为可选依赖：已安装时按固定签名编译（cache=True 落盘复用），未安装时退回等价的
+numpy 实现，调用方无需区分。
+"""
+from __future__ import annotations
+import logging
+from typing import Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 尝试导入numba，如果失败则使用numpy实现
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    logger.debug("numba未安装，因子计算使用numpy实现")
+
+
+def _mom_vol_py(close: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                mom_win: int, vol_win: int,
+                out_mom: np.ndarray, out_vol: np.ndarray) -> None:
+    """逐区段计算动量与末尾 vol_win 个收益率的样本标准差（Welford 单遍）"""
+    for g in prange(starts.shape[0]):
+        start = starts[g]
+        end = ends[g]
+        last = end - 1
+
+        # 动量：末值相对 mom_win 条之前的涨跌幅
+        base = last - mom_win
+        out_mom[g] = close[last] / close[base] - 1.0 if base >= start else np.nan
+
+        # 波动率：区段首行无前值，收益率从 start+1 开始
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(max(start + 1, end - vol_win), end):
+            r = close[i] / close[i - 1] - 1.0
+            if r != r:
+                continue
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+        out_vol[g] = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+
+if HAS_NUMBA:
+    _mom_vol = njit(
+        "void(float64[:], int64[:], int64[:], int64, int64, float64[:], float64[:])",
+        parallel=True, cache=True
+    )(_mom_vol_py)
+else:
+    def _mom_vol(close: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                 mom_win: int, vol_win: int,
+                 out_mom: np.ndarray, out_vol: np.ndarray) -> None:
+        last = ends - 1
+        base = last - mom_win
+        has_base = base >= starts
+        out_mom[:] = np.nan
+        out_mom[has_base] = close[last[has_base]] / close[base[has_base]] - 1.0
+
+        # 区段内简单收益率，区段首行无前值记为NaN
+        ret = np.full(len(close), np.nan)
+        if len(close) > 1:
+            ret[1:] = close[1:] / close[:-1] - 1.0
+        ret[starts] = np.nan
+
+        # 各区段末尾窗口展开为 (组数, vol_win) 矩阵，区段外填NaN
+        pos = (ends - vol_win)[:, None] + np.arange(vol_win)
+        inside = pos >= starts[:, None]
+        vals = np.where(inside, ret[np.clip(pos, 0, None)], np.nan)
+
+        valid = ~np.isnan(vals)
+        count = valid.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(valid, vals, 0.0).sum(axis=1) / count
+            sq = np.where(valid, (vals - mean[:, None]) ** 2, 0.0).sum(axis=1)
+            out_vol[:] = np.sqrt(sq / (count - 1))
+        out_vol[count < 2] = np.nan
+
+
+def compute_mom_vol(close: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                    mom_win: int, vol_win: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    按区段计算动量与波动率
+
+    Args:
+        close: 收盘价（各股票按日期升序连续排列）
+        starts: 各区段起始位置
+        ends: 各区段结束位置（不含）
+        mom_win: 动量回看条数（末值相对 mom_win 条之前，不足时为NaN）
+        vol_win: 波动率回看的收益率个数（等价于 pct_change().tail(vol_win).std()）
+
+    Returns:
+        (动量数组, 波动率数组)，长度均为区段数
+    """
+    n_groups = len(starts)
+    out_mom = np.empty(n_groups, dtype=np.float64)
+    out_vol = np.empty(n_groups, dtype=np.float64)
+    if n_groups == 0:
+        return out_mom, out_vol
+    _mom_vol(
+        np.ascontiguousarray(close, dtype=np.float64),
+        np.ascontiguousarray(starts, dtype=np.int64),
+        np.ascontiguousarray(ends, dtype=np.int64),
+        int(mom_win), int(vol_win), out_mom, out_vol
+    )
+    return out_mom, out_vol
+
+
+def _rolling_std_py(a: np.ndarray, window: int) -> np.ndarray:
+    """逐列滚动样本标准差（窗口不满或含NaN时为NaN，与 rolling(window).std() 一致）"""
+    n_rows, n_cols = a.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    for j in prange(n_cols):
+        for i in range(window - 1, n_rows):
+            # 窗口内两遍求均值与离差平方和，window 很小时无需增量更新
+            total = 0.0
+            for k in range(i - window + 1, i + 1):
+                total += a[k, j]
+            if total != total or window < 2:
+                continue
+            mean = total / window
+            m2 = 0.0
+            for k in range(i - window + 1, i + 1):
+                d = a[k, j] - mean
+                m2 += d * d
+            out[i, j] = np.sqrt(m2 / (window - 1))
+    return out
+
+
+if HAS_NUMBA:
+    _rolling_std = njit("float64[:, :](float64[:, :], int64)", parallel=True, cache=True)(_rolling_std_py)
+else:
+    def _rolling_std(a: np.ndarray, window: int) -> np.ndarray:
+        from numpy.lib.stride_tricks import sliding_window_view
+        out = np.full(a.shape, np.nan)
+        if a.shape[0] < window or window < 2:
+            return out
+        # (行数-window+1, 列数, window) 的窗口视图，不拷贝
+        windows = sliding_window_view(a, window, axis=0)
+        out[window - 1:] = windows.std(axis=-1, ddof=1)
+        return out
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    逐列滚动标准差（等价于 DataFrame.rolling(window).std()）
+    
+    Args:
+        values: 二维数值数组（行是时间，列是股票）
+        window: 窗口长度
+        
+    Returns:
+        与输入同形状的标准差数组（float64）
+    """
+    return _rolling_std(np.ascontiguousarray(values, dtype=np.float64), int(window))
+
+
+def _water_fill_py(scores: np.ndarray, tau: float, cap: float) -> np.ndarray:
+    """带上限的 softmax 注水：超限者冻结在 cap，剩余额度在未冻结者间按 softmax 重新分配"""
+    n = scores.shape[0]
+    out = np.zeros(n, dtype=np.float64)
+    # NaN 得分不参与分配，权重为0
+    active = np.empty(n, dtype=np.bool_)
+    n_active = 0
+    for i in range(n):
+        active[i] = not np.isnan(scores[i])
+        if active[i]:
+            n_active += 1
+    n_valid = n_active
+    if n_valid == 0:
+        return out
+    expo = np.empty(n, dtype=np.float64)
+    budget = 1.0
+    while n_active > 0:
+        # 每轮在未冻结者中减去最大值防止 exp 溢出/下溢：领先者冻结后其余得分不会整体下溢为0
+        top = -np.inf
+        for i in range(n):
+            if active[i] and scores[i] > top:
+                top = scores[i]
+        total = 0.0
+        for i in range(n):
+            if active[i]:
+                expo[i] = np.exp((scores[i] - top) / tau)
+                total += expo[i]
+        frozen = 0
+        for i in range(n):
+            if active[i]:
+                out[i] = budget * expo[i] / total
+                if out[i] > cap:
+                    out[i] = cap
+                    active[i] = False
+                    frozen += 1
+        if frozen == 0:
+            return out
+        budget -= frozen * cap
+        n_active -= frozen
+    # 上限过小（n * cap <= 1）时无法满足约束，退化为等权
+    for i in range(n):
+        out[i] = 0.0 if np.isnan(scores[i]) else 1.0 / n_valid
+    return out
+
+
+if HAS_NUMBA:
+    _water_fill = njit("float64[:](float64[:], float64, float64)", cache=True)(_water_fill_py)
+else:
+    def _water_fill(scores: np.ndarray, tau: float, cap: float) -> np.ndarray:
+        valid = ~np.isnan(scores)
+        out = np.zeros(len(scores), dtype=np.float64)
+        n_valid = int(valid.sum())
+        if n_valid == 0:
+            return out
+        active = valid.copy()
+        budget = 1.0
+        while active.any():
+            # 每轮按未冻结者的最大值居中，避免领先者冻结后其余 exp 全部下溢
+            expo = np.exp((scores[active] - scores[active].max()) / tau)
+            out[active] = budget * expo / expo.sum()
+            over = active & (out > cap)
+            if not over.any():
+                return out
+            out[over] = cap
+            active &= ~over
+            budget -= over.sum() * cap
+        return np.where(valid, 1.0 / n_valid, 0.0)
+
+
+def capped_softmax(scores: np.ndarray, tau: float, cap: float) -> np.ndarray:
+    """
+    带单票上限的 softmax 权重
+    
+    反复冻结超过上限的权重并把剩余额度按 softmax 分给其余股票，直到没有新的超限，
+    结果总和为1且每只不超过 cap（n * cap < 1 时无解，返回等权）；NaN 得分的权重为0。
+    
+    Args:
+        scores: 得分数组
+        tau: 温度参数
+        cap: 单只股票最大权重
+        
+    Returns:
+        权重数组
+    """
+    return _water_fill(np.ascontiguousarray(scores, dtype=np.float64), float(tau), float(cap))
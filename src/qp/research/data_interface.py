@@ -6,7 +6,8 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 
 # 导入数据API
@@ -18,9 +19,30 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 本地模拟数据的缓存容量（同参数重复调用直接复用，结果是确定的）
+LOCAL_CACHE_SIZE = 128
+
+# 模拟数据使用的行业分类
+INDUSTRIES = ['银行', '科技', '医药', '消费', '制造', '地产', '能源', '材料', '公用事业', '金融']
+
+# 模拟基本面字段的取值区间（None 表示从行业分类中抽取）
+_FUNDAMENTAL_FIELDS = {
+    'pe_ttm': (5, 50),
+    'industry': None,
+    'free_float_mkt_cap': (1e8, 1e12),
+    'market_cap': (1e8, 1e12),
+    'pb_ratio': (0.5, 5.0),
+    'ps_ratio': (0.5, 10.0),
+    'roe': (0.05, 0.25),
+    'roa': (0.02, 0.15),
+    'revenue_growth_yoy': (-0.2, 0.5),
+    'profit_growth_yoy': (-0.3, 0.6),
+}
+
 
 def get_price(symbols: List[str], start_offset: int, end_date: str, 
-              freq: str = "1d", adjust: str = "adj") -> pd.DataFrame:
+              freq: str = "1d", adjust: str = "adj",
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     获取价格数据
     
@@ -30,17 +52,18 @@ def get_price(symbols: List[str], start_offset: int, end_date: str,
         end_date: 结束日期
         freq: 频率，默认"1d"（日线）
         adjust: 复权方式，"adj"表示前复权
+        columns: 只返回的列（可选，默认全部列）
         
     Returns:
         价格数据DataFrame
     """
     try:
         from ..data import get_price as api_get_price
-        return api_get_price(symbols, start_offset, end_date, freq, adjust)
+        return api_get_price(symbols, start_offset, end_date, freq, adjust, columns=columns)
     except ImportError:
         # 本地实现
         logger.warning("使用本地价格数据实现")
-        return _local_get_price(symbols, start_offset, end_date, freq, adjust)
+        return _local_get_price(symbols, start_offset, end_date, freq, adjust, columns)
 
 
 def get_fundamental(symbols: List[str], asof_date: str, 
@@ -86,10 +109,21 @@ def get_universe_meta(universe: str, asof_date: str) -> pd.DataFrame:
 
 
 def _local_get_price(symbols: List[str], start_offset: int, end_date: str, 
-                     freq: str = "1d", adjust: str = "adj") -> pd.DataFrame:
+                     freq: str = "1d", adjust: str = "adj",
+                     columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
-    本地价格数据实现
+    本地价格数据实现（按参数缓存，返回副本以免调用方修改缓存；指定 columns 时只拷贝所需列）
     """
+    df = _cached_local_price(tuple(symbols), start_offset, end_date, freq, adjust)
+    if columns is not None:
+        return df[list(columns)].copy()
+    return df.copy()
+
+
+@lru_cache(maxsize=LOCAL_CACHE_SIZE)
+def _cached_local_price(symbols: Tuple[str, ...], start_offset: int, end_date: str,
+                        freq: str, adjust: str) -> pd.DataFrame:
+    """生成本地模拟价格数据"""
     from datetime import datetime, timedelta
     
     # 计算开始日期
@@ -99,105 +133,84 @@ def _local_get_price(symbols: List[str], start_offset: int, end_date: str,
     # 生成日期范围
     dates = pd.date_range(start=start_dt, end=end_dt, freq=freq)
     
-    # 模拟价格数据生成
-    data = []
-    np.random.seed(42)  # 确保结果可重现
+    # 模拟价格数据生成：按列整块生成（股票 × 日期 的二维数组），不逐行构造字典
+    rng = np.random.default_rng(42)  # 确保结果可重现
+    n_symbols, n_dates = len(symbols), len(dates)
+    shape = (n_symbols, n_dates)
     
-    for symbol in symbols:
-        # 为每只股票生成基础价格
-        base_price = 10 + np.random.normal(0, 2)
-        
-        for trade_date in dates:
-            # 模拟价格走势
-            price_change = np.random.normal(0, 0.02)
-            base_price *= (1 + price_change)
-            
-            # 确保价格为正
-            close = max(base_price, 0.1)
-            
-            # 生成其他价格字段
-            open_price = close * (1 + np.random.normal(0, 0.01))
-            high = max(open_price, close) * (1 + abs(np.random.normal(0, 0.01)))
-            low = min(open_price, close) * (1 - abs(np.random.normal(0, 0.01)))
-            
-            # 生成成交量和成交额
-            volume = np.random.randint(1000000, 10000000)
-            amount = close * volume
-            vwap = close * (1 + np.random.normal(0, 0.005))  # 模拟VWAP
-            
-            data.append({
-                'symbol': symbol,
-                'trade_date': trade_date,
-                'close': close,
-                'open': open_price,
-                'high': high,
-                'low': low,
-                'volume': volume,
-                'amount': amount,
-                'vwap': vwap
-            })
+    # 每只股票的基础价格，按日收益率累乘模拟价格走势
+    base_price = 10 + rng.normal(0, 2, size=(n_symbols, 1))
+    path = base_price * np.cumprod(1 + rng.normal(0, 0.02, size=shape), axis=1)
+    
+    # 确保价格为正
+    close = np.maximum(path, 0.1)
     
-    return pd.DataFrame(data)
+    # 生成其他价格字段
+    open_price = close * (1 + rng.normal(0, 0.01, size=shape))
+    high = np.maximum(open_price, close) * (1 + np.abs(rng.normal(0, 0.01, size=shape)))
+    low = np.minimum(open_price, close) * (1 - np.abs(rng.normal(0, 0.01, size=shape)))
+    
+    # 生成成交量和成交额
+    volume = rng.integers(1000000, 10000000, size=shape)
+    amount = close * volume
+    vwap = close * (1 + rng.normal(0, 0.005, size=shape))  # 模拟VWAP
+    
+    # 行序与逐股票、逐日期生成一致：股票为外层，日期为内层
+    return pd.DataFrame({
+        'symbol': np.repeat(np.asarray(symbols, dtype=object), n_dates),
+        'trade_date': np.tile(dates.values, n_symbols),
+        'close': close.ravel(),
+        'open': open_price.ravel(),
+        'high': high.ravel(),
+        'low': low.ravel(),
+        'volume': volume.ravel(),
+        'amount': amount.ravel(),
+        'vwap': vwap.ravel()
+    })
 
 
 def _local_get_fundamental(symbols: List[str], asof_date: str, 
                           fields: List[str]) -> pd.DataFrame:
     """
-    本地基本面数据实现
+    本地基本面数据实现（按参数缓存，返回副本以免调用方修改缓存）
     """
-    # 模拟基本面数据生成
-    data = []
-    np.random.seed(42)  # 确保结果可重现
-    
-    # 行业分类
-    industries = ['银行', '科技', '医药', '消费', '制造', '地产', '能源', '材料', '公用事业', '金融']
+    return _cached_local_fundamental(tuple(symbols), asof_date, tuple(fields)).copy()
+
+
+@lru_cache(maxsize=LOCAL_CACHE_SIZE)
+def _cached_local_fundamental(symbols: Tuple[str, ...], asof_date: str,
+                              fields: Tuple[str, ...]) -> pd.DataFrame:
+    """生成本地模拟基本面数据"""
+    # 模拟基本面数据生成：每个字段一次批量抽样
+    rng = np.random.default_rng(42)  # 确保结果可重现
+    n = len(symbols)
+    fields_set = set(fields)
     
-    for symbol in symbols:
-        row = {'symbol': symbol}
-        
-        # 根据字段列表生成数据
-        if 'pe_ttm' in fields:
-            row['pe_ttm'] = np.random.uniform(5, 50)
-        
-        if 'industry' in fields:
-            row['industry'] = np.random.choice(industries)
-        
-        if 'free_float_mkt_cap' in fields:
-            row['free_float_mkt_cap'] = np.random.uniform(1e8, 1e12)
-        
-        if 'market_cap' in fields:
-            row['market_cap'] = np.random.uniform(1e8, 1e12)
-        
-        if 'pb_ratio' in fields:
-            row['pb_ratio'] = np.random.uniform(0.5, 5.0)
-        
-        if 'ps_ratio' in fields:
-            row['ps_ratio'] = np.random.uniform(0.5, 10.0)
-        
-        if 'roe' in fields:
-            row['roe'] = np.random.uniform(0.05, 0.25)
-        
-        if 'roa' in fields:
-            row['roa'] = np.random.uniform(0.02, 0.15)
-        
-        if 'revenue_growth_yoy' in fields:
-            row['revenue_growth_yoy'] = np.random.uniform(-0.2, 0.5)
-        
-        if 'profit_growth_yoy' in fields:
-            row['profit_growth_yoy'] = np.random.uniform(-0.3, 0.6)
-        
-        data.append(row)
+    # 根据字段列表生成数据（按 _FUNDAMENTAL_FIELDS 的固定顺序输出列）
+    columns: Dict[str, Any] = {'symbol': list(symbols)}
+    for name, spec in _FUNDAMENTAL_FIELDS.items():
+        if name not in fields_set:
+            continue
+        if spec is None:
+            columns[name] = rng.choice(INDUSTRIES, size=n)
+        else:
+            columns[name] = rng.uniform(spec[0], spec[1], size=n)
     
-    return pd.DataFrame(data)
+    return pd.DataFrame(columns)
 
 
 def _local_get_universe_meta(universe: str, asof_date: str) -> pd.DataFrame:
     """
-    本地股票池元数据实现
+    本地股票池元数据实现（按参数缓存，返回副本以免调用方修改缓存）
     """
-    # 模拟股票池数据
-    data = []
-    np.random.seed(42)  # 确保结果可重现
+    return _cached_local_universe_meta(universe, asof_date).copy()
+
+
+@lru_cache(maxsize=LOCAL_CACHE_SIZE)
+def _cached_local_universe_meta(universe: str, asof_date: str) -> pd.DataFrame:
+    """生成本地模拟股票池元数据"""
+    # 模拟股票池数据：使用局部 Generator，不修改全局随机状态
+    rng = np.random.default_rng(42)  # 确保结果可重现
     
     # 根据股票池生成不同的股票列表
     if universe == "CSI300":
@@ -209,36 +222,28 @@ def _local_get_universe_meta(universe: str, asof_date: str) -> pd.DataFrame:
     else:
         # 默认股票池
         symbols = [f"{i:06d}" for i in range(1, 101)]  # 000001-000100
+    n = len(symbols)
     
-    # 行业分类
-    industries = ['银行', '科技', '医药', '消费', '制造', '地产', '能源', '材料', '公用事业', '金融']
+    # 模拟股票状态（每个字段一次批量抽样）
+    is_tradable = rng.random(n) > 0.05  # 95%的股票可交易
+    is_st = rng.random(n) < 0.02  # 2%的股票是ST
+    is_suspended = rng.random(n) < 0.01  # 1%的股票停牌
+    is_limit_up = rng.random(n) < 0.01  # 1%的股票涨停
+    is_limit_down = rng.random(n) < 0.01  # 1%的股票跌停
     
-    for symbol in symbols:
-        # 模拟股票状态
-        is_tradable = np.random.random() > 0.05  # 95%的股票可交易
-        is_st = np.random.random() < 0.02  # 2%的股票是ST
-        is_suspended = np.random.random() < 0.01  # 1%的股票停牌
-        is_limit_up = np.random.random() < 0.01  # 1%的股票涨停
-        is_limit_down = np.random.random() < 0.01  # 1%的股票跌停
-        
-        # 如果股票是ST、停牌、涨跌停，则不可交易
-        if is_st or is_suspended or is_limit_up or is_limit_down:
-            is_tradable = False
-        
-        row = {
-            'symbol': symbol,
-            'is_tradable': is_tradable,
-            'industry': np.random.choice(industries),
-            'free_float_mkt_cap': np.random.uniform(1e8, 1e12),
-            'is_st': is_st,
-            'is_suspended': is_suspended,
-            'is_limit_up': is_limit_up,
-            'is_limit_down': is_limit_down
-        }
-        
-        data.append(row)
+    # 如果股票是ST、停牌、涨跌停，则不可交易
+    is_tradable &= ~(is_st | is_suspended | is_limit_up | is_limit_down)
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'symbol': symbols,
+        'is_tradable': is_tradable,
+        'industry': rng.choice(INDUSTRIES, size=n),
+        'free_float_mkt_cap': rng.uniform(1e8, 1e12, size=n),
+        'is_st': is_st,
+        'is_suspended': is_suspended,
+        'is_limit_up': is_limit_up,
+        'is_limit_down': is_limit_down
+    })
 
 
 def create_data_interface():
@@ -7,19 +7,64 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Any
+import pyarrow as pa
+import pyarrow.parquet as pq
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import copy
+from typing import List, Optional, Dict, Any, Tuple
+import hashlib
 import logging
 from pathlib import Path
 import os
+import threading
 
 from .selector import select_daily, SelectionConfig
+from ._factor_kernels import compute_mom_vol
 from .data_interface import get_price, get_fundamental, get_universe_meta
 import yaml
 
+# 优先使用 libyaml 的C实现解析配置，未编译libyaml时退回纯Python实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 因子计算用到的价格列（读取时只取这些列）
+PRICE_FACTOR_COLUMNS = ["symbol", "trade_date", "close"]
+
+# 分批计算技术因子时每批的股票数
+FACTOR_SYMBOL_BATCH = 500
+
+# 选股信号必需的列（按输出顺序）
+SIGNAL_REQUIRED_COLUMNS = ('trade_date', 'symbol', 'score', 'rank', 'direction', 'weight', 'model_name', 'version')
+
+# 选股信号的Parquet写入参数：重复字符串列字典编码，ZSTD 低级别压缩，1MB 数据页
+SIGNAL_DICTIONARY_COLUMNS = ('symbol', 'model_name', 'version', 'industry')
+SIGNAL_PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 1,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
+# 因子结果缓存：进程内保留最近 FACTOR_CACHE_SIZE 份，磁盘缓存目录默认 FACTOR_CACHE_DIR
+FACTOR_CACHE_SIZE = 64
+FACTOR_CACHE_DIR = "data/cache/factors"
+
 # 设置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 进程内因子缓存（键 -> 因子DataFrame，按最近使用顺序淘汰）
+_factor_cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+# 选股信号后台写入线程（单线程，按提交顺序落盘）及未完成的写入
+_SIGNAL_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signal-writer")
+_pending_writes: List[Future] = []
+_pending_lock = threading.Lock()
+
 
 def load_config(cfg_path: str) -> Dict[str, Any]:
     """
@@ -32,15 +77,86 @@ def load_config(cfg_path: str) -> Dict[str, Any]:
         配置字典
     """
     try:
-        with open(cfg_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # 按 (路径, 修改时间) 缓存解析结果，文件被修改后自动重新解析
+        config = _parse_config(cfg_path, os.path.getmtime(cfg_path))
         logger.info(f"配置文件加载成功: {cfg_path}")
-        return config
+        return copy.deepcopy(config)
     except Exception as e:
         logger.error(f"配置文件加载失败: {e}")
         raise
 
 
+@lru_cache(maxsize=32)
+def _parse_config(cfg_path: str, mtime: float) -> Dict[str, Any]:
+    """解析YAML配置文件（mtime 只参与缓存键）"""
+    with open(cfg_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _group_bounds(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    已排序键数组中各组的 [start, end) 区间
+    
+    Args:
+        keys: 已按分组键排序的数组
+        
+    Returns:
+        (各组起始位置, 各组结束位置)
+    """
+    n = len(keys)
+    if n == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], n]
+    return starts, ends
+
+
+def _symbol_dtype(meta: pd.DataFrame) -> pd.CategoricalDtype:
+    """以股票池代码为类别的分类类型（价格、基本面与元数据共用，合并时键类型一致）"""
+    return pd.CategoricalDtype(meta["symbol"].unique())
+
+
+def _factor_frame(px: pd.DataFrame, momentum_window: int, volatility_window: int,
+                  min_obs: int = 0) -> pd.DataFrame:
+    """
+    按股票计算动量与波动率（整表排序一次，由因子内核逐区段计算）
+    
+    Args:
+        px: 价格数据
+        momentum_window: 动量回看条数
+        volatility_window: 波动率回看的收益率个数
+        min_obs: 最少历史条数，不足的股票不输出
+        
+    Returns:
+        DataFrame，列: symbol, trade_date, momentum_120, volatility_20
+    """
+    # 整表按 (symbol, trade_date) 排序一次，各股票数据成为连续区段
+    # （symbol 为分类列时按整数编码划分区段）
+    px = px.sort_values(["symbol", "trade_date"], kind="mergesort")
+    symbol_col = px["symbol"]
+    if isinstance(symbol_col.dtype, pd.CategoricalDtype):
+        starts, ends = _group_bounds(symbol_col.cat.codes.to_numpy())
+    else:
+        starts, ends = _group_bounds(symbol_col.to_numpy())
+    
+    # 只保留历史长度足够的股票
+    keep = (ends - starts) >= min_obs
+    starts, ends = starts[keep], ends[keep]
+    last = ends - 1
+    
+    momentum, volatility = compute_mom_vol(
+        px["close"].to_numpy(dtype=float), starts, ends, momentum_window, volatility_window
+    )
+    
+    return pd.DataFrame({
+        "symbol": symbol_col.array[last],
+        "trade_date": px["trade_date"].to_numpy()[last],
+        "momentum_120": momentum,
+        "volatility_20": volatility
+    })
+
+
 def compute_factors(px: pd.DataFrame, f: Dict[str, Any]) -> pd.DataFrame:
     """
     计算因子数据
@@ -58,32 +174,8 @@ def compute_factors(px: pd.DataFrame, f: Dict[str, Any]) -> pd.DataFrame:
     momentum_window = f.get("lookback_momentum", 120)
     volatility_window = f.get("lookback_volatility", 20)
     
-    # 按股票分组计算因子
-    factors = []
-    for symbol, group in px.groupby("symbol"):
-        if len(group) < momentum_window:
-            continue
-            
-        # 按日期排序
-        group = group.sort_values("trade_date")
-        
-        # 计算动量因子
-        momentum = (group["close"].iloc[-1] / group["close"].iloc[-(momentum_window+1)]) - 1.0
-        
-        # 计算波动率因子
-        volatility = group["close"].pct_change().tail(volatility_window).std()
-        
-        # 获取最新交易日期
-        trade_date = group["trade_date"].iloc[-1]
-        
-        factors.append({
-            "symbol": symbol,
-            "trade_date": trade_date,
-            "momentum_120": momentum,
-            "volatility_20": volatility
-        })
-    
-    factor_df = pd.DataFrame(factors)
+    # 按股票计算因子（历史不足 momentum_window 条的股票跳过）
+    factor_df = _factor_frame(px, momentum_window, volatility_window, min_obs=momentum_window)
     
     if not factor_df.empty:
         logger.info(f"因子计算完成，股票数: {len(factor_df)}")
@@ -93,6 +185,84 @@ def compute_factors(px: pd.DataFrame, f: Dict[str, Any]) -> pd.DataFrame:
     return factor_df
 
 
+def _factor_cache_key(symbols: List[str], trade_date: Any, f: Dict[str, Any]) -> str:
+    """
+    因子缓存键：股票集合、交易日期与因子窗口参数的摘要
+    
+    Args:
+        symbols: 股票代码列表（与顺序无关）
+        trade_date: 交易日期
+        f: 因子配置（只取影响 compute_factors 结果的窗口参数）
+        
+    Returns:
+        十六进制摘要字符串
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\n".join(sorted(map(str, symbols))).encode())
+    h.update(f"|{trade_date}|{f.get('lookback_momentum', 120)}|{f.get('lookback_volatility', 20)}".encode())
+    return h.hexdigest()
+
+
+def _load_cached_factors(key: str, cache_dir: Optional[str]) -> Optional[pd.DataFrame]:
+    """
+    读取缓存的因子结果（先查进程内缓存，再查磁盘）
+    
+    Args:
+        key: 缓存键
+        cache_dir: 磁盘缓存目录（None 表示只用进程内缓存）
+        
+    Returns:
+        因子DataFrame副本，未命中时返回None
+    """
+    df = _factor_cache.get(key)
+    if df is not None:
+        _factor_cache.move_to_end(key)
+        return df.copy()
+    
+    if cache_dir is None:
+        return None
+    path = Path(cache_dir) / f"{key}.parquet"
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_parquet(path)
+    except Exception as e:
+        logger.warning(f"读取因子缓存失败: {path}, {e}")
+        return None
+    _remember_factors(key, df)
+    return df.copy()
+
+
+def _store_cached_factors(key: str, df: pd.DataFrame, cache_dir: Optional[str]) -> None:
+    """
+    写入因子结果缓存（磁盘写临时文件后原子替换，写入失败只记录警告）
+    
+    Args:
+        key: 缓存键
+        df: 因子DataFrame
+        cache_dir: 磁盘缓存目录（None 表示只用进程内缓存）
+    """
+    _remember_factors(key, df.copy())
+    if cache_dir is None or df.empty:
+        return
+    path = Path(cache_dir) / f"{key}.parquet"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.parquet")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning(f"写入因子缓存失败: {path}, {e}")
+
+
+def _remember_factors(key: str, df: pd.DataFrame) -> None:
+    """放入进程内缓存，超出容量时淘汰最久未用的条目"""
+    _factor_cache[key] = df
+    _factor_cache.move_to_end(key)
+    while len(_factor_cache) > FACTOR_CACHE_SIZE:
+        _factor_cache.popitem(last=False)
+
+
 def build_signals_from_cfg(cfg_path: str = "configs/selection.yaml") -> pd.DataFrame:
     """
     从配置文件构建选股信号
@@ -120,41 +290,56 @@ def build_signals_from_cfg(cfg_path: str = "configs/selection.yaml") -> pd.DataF
         # 调用数据接口
         meta = get_universe_meta(universe=universe, asof_date=trade_date)
         symbols = meta.loc[meta["is_tradable"], "symbol"].tolist()
-        px = get_price(symbols, start_offset=-f["lookback_momentum"]-10, end_date=trade_date, freq="1d", adjust="adj")
+        
+        # symbol 统一转为同一分类类型，分组与合并按整数编码进行
+        sym_dtype = _symbol_dtype(meta)
+        meta = meta.astype({"symbol": sym_dtype})
 
-        # 计算因子
-        df = compute_factors(px, f)   # 例如封装动量、波动率、PE
+        # 计算因子（按股票集合、日期与窗口参数缓存，命中时连价格数据也不再获取）
+        output_config = cfg.get("output", {})
+        cache_dir = output_config.get("factor_cache_dir", FACTOR_CACHE_DIR)
+        cache_key = _factor_cache_key(symbols, trade_date, f)
+        df = _load_cached_factors(cache_key, cache_dir)
+        if df is None:
+            px = get_price(symbols, start_offset=-f["lookback_momentum"]-10, end_date=trade_date, freq="1d", adjust="adj",
+                           columns=PRICE_FACTOR_COLUMNS)
+            px = px.astype({"symbol": sym_dtype})
+            df = compute_factors(px, f)   # 例如封装动量、波动率、PE
+            _store_cached_factors(cache_key, df, cache_dir)
+        else:
+            logger.info(f"因子缓存命中: {cache_key}")
+            df = df.astype({"symbol": sym_dtype})
         
         # 获取基本面数据
         fin = get_fundamental(symbols, asof_date=trade_date, fields=["pe_ttm", "industry", "free_float_mkt_cap"])
-        fin = fin.rename(columns={"free_float_mkt_cap": "mkt_cap"})
+        fin = fin.rename(columns={"free_float_mkt_cap": "mkt_cap"}).astype({"symbol": sym_dtype})
         
-        # 为基本面数据添加trade_date列
-        fin['trade_date'] = pd.to_datetime(trade_date)
+        # 为基本面数据添加trade_date列（与因子表的日期类型一致，merge 时无需强转键类型）
+        fin['trade_date'] = pd.Series(pd.to_datetime(trade_date), index=fin.index).astype(df["trade_date"].dtype)
         
-        # 合并因子和基本面数据
-        df = df.merge(fin, on=["symbol", "trade_date"], how="inner")
+        # 合并因子和基本面数据（两侧键类型已对齐，不拷贝输入）
+        df = df.merge(fin, on=["symbol", "trade_date"], how="inner", copy=False)
         
         if df.empty:
             logger.warning("合并因子和基本面数据后无有效数据")
             return pd.DataFrame()
         
         # 应用可交易股票掩码
-        uni_mask = meta.set_index("symbol")["is_tradable"]
+        tradable = frozenset(symbols)
         
         # 执行选股
-        sel = select_daily(df, uni_mask, top_n=top_n)
+        sel = select_daily(df, tradable, top_n=top_n)
 
         if sel.empty:
             logger.warning("选股结果为空")
             return pd.DataFrame()
 
+        sel["symbol"] = sel["symbol"].astype(str)
         sel.insert(0, "trade_date", trade_date)
         sel["model_name"] = s["strategy_name"]
         sel["version"] = s["model_version"]
 
         # 从配置中获取保存路径
-        output_config = cfg.get("output", {})
         save_path = output_config.get("save_path", "data/dws/signals/")
         save_signals(sel, strategy=s["strategy_name"], save_path=save_path)
         logger.info(f"选股信号构建完成，选择股票数量: {len(sel)}")
@@ -196,28 +381,29 @@ def build_signals(trade_date: str, universe: str = "CSI300", top_n: int = 50) ->
             logger.warning("没有可交易的股票")
             return pd.DataFrame()
         
-        # 2) 获取价格数据用于因子计算
-        logger.info("获取价格数据...")
-        px = get_price(symbols=tradable_stocks, start_offset=-130, end_date=trade_date, freq="1d", adjust="adj")
-        
-        if px.empty:
+        # symbol 统一转为同一分类类型，分组与合并按整数编码进行
+        sym_dtype = _symbol_dtype(meta)
+        meta = meta.astype({"symbol": sym_dtype})
+        
+        # 2) 分批获取价格数据并计算技术因子（每批 FACTOR_SYMBOL_BATCH 只股票，限制峰值内存）
+        #    动量为最近120条首尾涨跌幅，不足120条的股票为NaN
+        logger.info("获取价格数据并计算技术因子...")
+        feat_parts = []
+        for start in range(0, len(tradable_stocks), FACTOR_SYMBOL_BATCH):
+            px = get_price(symbols=tradable_stocks[start:start + FACTOR_SYMBOL_BATCH], start_offset=-130,
+                           end_date=trade_date, freq="1d", adjust="adj", columns=PRICE_FACTOR_COLUMNS)
+            if px.empty:
+                continue
+            px = px.astype({"symbol": sym_dtype})
+            feat_parts.append(_factor_frame(px, momentum_window=119, volatility_window=20).drop(columns="trade_date"))
+        
+        if not feat_parts:
             logger.warning("价格数据为空")
             return pd.DataFrame()
+        feat = pd.concat(feat_parts, ignore_index=True)
         
-        # 确保有足够的历史数据
-        last_px = px.groupby("symbol").tail(120).reset_index(drop=True)
-        
-        # 计算技术因子
-        logger.info("计算技术因子...")
-        feat = last_px.groupby("symbol").apply(lambda g: pd.Series({
-            "momentum_120": (g["close"].iloc[-1] / g["close"].iloc[0]) - 1.0 if len(g) >= 120 else np.nan,
-            "volatility_20": g["close"].pct_change().tail(20).std() if len(g) >= 20 else np.nan,
-        })).reset_index()
-        
-        # 去除无效数据
-        feat = feat.dropna()
-        
-        if feat.empty:
+        # 无有效因子时提前结束（缺失值在合并后与其他条件一起过滤，这里不生成中间表）
+        if not feat[["momentum_120", "volatility_20"]].notna().to_numpy().all(axis=1).any():
             logger.warning("技术因子计算后无有效数据")
             return pd.DataFrame()
         
@@ -231,35 +417,36 @@ def build_signals(trade_date: str, universe: str = "CSI300", top_n: int = 50) ->
             return pd.DataFrame()
         
         # 重命名列以保持一致性
-        fin = fin.rename(columns={"free_float_mkt_cap": "mkt_cap"})
+        fin = fin.rename(columns={"free_float_mkt_cap": "mkt_cap"}).astype({"symbol": sym_dtype})
         
-        # 4) 合并数据
+        # 4) 合并数据（symbol 两侧同为 sym_dtype 分类列，不拷贝输入）
         logger.info("合并因子数据...")
-        df = feat.merge(fin, on="symbol", how="inner")
+        df = feat.merge(fin, on="symbol", how="inner", copy=False)
         
         if df.empty:
             logger.warning("合并后无有效数据")
             return pd.DataFrame()
         
-        # 去除缺失值
-        df = df.dropna()
+        # 5) 去除缺失值并应用可交易股票掩码（合成一个布尔掩码，只取一次子集）
+        tradable = frozenset(tradable_stocks)
+        mask = df.notna().to_numpy().all(axis=1)
+        mask &= df["symbol"].isin(tradable).to_numpy()
+        df = df.loc[mask]
         
         if df.empty:
             logger.warning("去除缺失值后无有效数据")
             return pd.DataFrame()
         
-        # 5) 应用可交易股票掩码
-        uni_mask = meta.set_index("symbol")["is_tradable"]
-        
         # 6) 执行选股
         logger.info("执行选股...")
-        sel = select_daily(df, uni_mask, top_n=top_n)
+        sel = select_daily(df, tradable, top_n=top_n)
         
         if sel.empty:
             logger.warning("选股结果为空")
             return pd.DataFrame()
         
-        # 7) 添加交易日期和模型信息
+        # 7) 添加交易日期和模型信息（symbol 还原为字符串，输出格式不变）
+        sel["symbol"] = sel["symbol"].astype(str)
         sel.insert(0, "trade_date", trade_date)
         sel["model_name"] = "rank_topn_neutral"
         sel["version"] = "v1.0"
@@ -272,7 +459,52 @@ def build_signals(trade_date: str, universe: str = "CSI300", top_n: int = 50) ->
         return pd.DataFrame()
 
 
-def save_signals(df: pd.DataFrame, strategy: str, save_path: str = "data/dws/signals/") -> str:
+def build_signals_batch(dates: List[str], universe: str = "CSI300", top_n: int = 50,
+                        max_concurrent: int = 8) -> Dict[str, pd.DataFrame]:
+    """
+    并行构建多个交易日的选股信号
+    
+    各交易日相互独立，在进程池中并行执行（因子计算为CPU密集，进程间不受GIL限制）。
+    
+    Args:
+        dates: 交易日期列表
+        universe: 股票池名称，默认CSI300
+        top_n: 选择前N只股票
+        max_concurrent: 最大并行进程数
+        
+    Returns:
+        {交易日期: 选股信号DataFrame}，按输入日期顺序排列
+    """
+    dates = list(dict.fromkeys(dates))
+    if not dates:
+        return {}
+    
+    logger.info(f"并行构建选股信号，日期数: {len(dates)}, 并行度: {min(max_concurrent, len(dates))}")
+    results: Dict[str, pd.DataFrame] = {}
+    with ProcessPoolExecutor(max_workers=min(max_concurrent, len(dates))) as executor:
+        futures = {
+            executor.submit(build_signals, trade_date, universe, top_n): trade_date
+            for trade_date in dates
+        }
+        for future in as_completed(futures):
+            trade_date = futures[future]
+            try:
+                results[trade_date] = future.result()
+            except Exception as e:
+                logger.error(f"构建选股信号失败，日期: {trade_date}, {e}")
+                results[trade_date] = pd.DataFrame()
+    
+    return {trade_date: results[trade_date] for trade_date in dates}
+
+
+def _signal_dictionary_columns(columns) -> List[str]:
+    """选股信号中需要字典编码的列（只取实际存在的列）"""
+    present = set(columns)
+    return [col for col in SIGNAL_DICTIONARY_COLUMNS if col in present]
+
+
+def save_signals(df: pd.DataFrame, strategy: str, save_path: str = "data/dws/signals/",
+                 background: bool = False) -> str:
     """
     保存选股信号到Parquet文件
     
@@ -280,6 +512,7 @@ def save_signals(df: pd.DataFrame, strategy: str, save_path: str = "data/dws/sig
         df: 选股信号DataFrame
         strategy: 策略名称
         save_path: 保存路径前缀
+        background: 为True时交给后台写入线程并立即返回，需调用 flush_signals() 等待落盘
         
     Returns:
         保存的文件路径
@@ -291,15 +524,32 @@ def save_signals(df: pd.DataFrame, strategy: str, save_path: str = "data/dws/sig
     try:
         # 获取交易日期
         trade_date = df['trade_date'].iloc[0]
-        
-        # 构建保存路径
-        path = f"{save_path.rstrip('/')}/{strategy}/dt={trade_date}.parquet"
-        
+    except Exception as e:
+        logger.error(f"保存选股信号失败: {e}")
+        return ""
+    
+    # 构建保存路径
+    path = f"{save_path.rstrip('/')}/{strategy}/dt={trade_date}.parquet"
+    
+    if not background:
+        return _write_signals(df, path)
+    
+    future = _SIGNAL_WRITER.submit(_write_signals, df.copy(), path)
+    with _pending_lock:
+        _pending_writes.append(future)
+    return path
+
+
+def _write_signals(df: pd.DataFrame, path: str) -> str:
+    """写入单个选股信号文件（失败时记录错误并返回空字符串）"""
+    try:
         # 创建目录
         os.makedirs(os.path.dirname(path), exist_ok=True)
         
         # 保存为Parquet文件
-        df.to_parquet(path, index=False)
+        df.to_parquet(path, index=False, engine="pyarrow",
+                      use_dictionary=_signal_dictionary_columns(df.columns),
+                      **SIGNAL_PARQUET_OPTIONS)
         
         logger.info(f"选股信号已保存: {path}")
         return path
@@ -309,6 +559,62 @@ def save_signals(df: pd.DataFrame, strategy: str, save_path: str = "data/dws/sig
         return ""
 
 
+def save_signals_batch(frames: List[pd.DataFrame], strategy: str,
+                       save_path: str = "data/dws/signals/", max_workers: int = 4) -> List[str]:
+    """
+    一次保存多个交易日的选股信号
+    
+    文件布局与 save_signals 相同（{strategy}/dt={trade_date}.parquet）。各交易日转为Arrow表后
+    在线程池中并行写出，Parquet 编码与压缩期间释放GIL。
+    
+    Args:
+        frames: 各交易日的选股信号DataFrame列表
+        strategy: 策略名称
+        save_path: 保存路径前缀
+        max_workers: 并行写入的线程数
+        
+    Returns:
+        成功写入的文件路径列表（按输入顺序，空信号跳过）
+    """
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        logger.warning("选股信号为空，无法保存")
+        return []
+    
+    base = f"{save_path.rstrip('/')}/{strategy}"
+    os.makedirs(base, exist_ok=True)
+    
+    def write(df: pd.DataFrame) -> str:
+        path = f"{base}/dt={df['trade_date'].iloc[0]}.parquet"
+        try:
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path,
+                           use_dictionary=_signal_dictionary_columns(df.columns),
+                           **SIGNAL_PARQUET_OPTIONS)
+            return path
+        except Exception as e:
+            logger.error(f"保存选股信号失败: {path}, {e}")
+            return ""
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(frames))) as executor:
+        paths = [path for path in executor.map(write, frames) if path]
+    
+    logger.info(f"选股信号已批量保存: {base}, 文件数: {len(paths)}")
+    return paths
+
+
+def flush_signals() -> List[str]:
+    """
+    等待所有后台提交的选股信号写入完成
+    
+    Returns:
+        成功写入的文件路径列表（按提交顺序）
+    """
+    with _pending_lock:
+        pending = list(_pending_writes)
+        _pending_writes.clear()
+    return [path for path in (future.result() for future in pending) if path]
+
+
 def run_daily_selection(trade_date: str, universe: str = "CSI300", 
                        top_n: int = 50, strategy: str = "rank_topn_neutral") -> tuple:
     """
@@ -353,8 +659,8 @@ def validate_signals(df: pd.DataFrame) -> bool:
         return False
     
     # 检查必需的列
-    required_cols = ['trade_date', 'symbol', 'score', 'rank', 'direction', 'weight', 'model_name', 'version']
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    present = set(df.columns)
+    missing_cols = [col for col in SIGNAL_REQUIRED_COLUMNS if col not in present]
     
     if missing_cols:
         logger.error(f"选股信号缺少必需列: {missing_cols}")
@@ -373,13 +679,14 @@ def validate_signals(df: pd.DataFrame) -> bool:
     if not pd.api.types.is_numeric_dtype(df['weight']):
         logger.warning("weight列不是数值类型")
     
-    # 检查权重和
-    weight_sum = df['weight'].sum()
+    # 检查权重和（直接在numpy数组上求和，NaN 视为0，与 Series.sum 一致）
+    weight_sum = np.nansum(df['weight'].to_numpy(dtype=float))
     if abs(weight_sum - 1.0) > 0.01:
         logger.warning(f"权重和不为1: {weight_sum}")
     
     # 检查排名
-    if not df['rank'].is_monotonic_increasing:
+    rank = df['rank'].to_numpy()
+    if len(rank) > 1 and bool(np.any(rank[1:] < rank[:-1])):
         logger.warning("排名不是单调递增")
     
     logger.info("选股信号验证通过")
@@ -7,23 +7,56 @@
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
+import hashlib
+from typing import AbstractSet, List, Tuple, Optional, Dict, Any, Union
 import logging
 from pathlib import Path
 import warnings
 
+from ._factor_kernels import capped_softmax, rolling_std
+
 # 设置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 尝试导入sklearn，如果失败则使用简单实现
+# 尝试导入numexpr，如果失败则使用numpy实现
 try:
-    from sklearn.linear_model import LinearRegression
-    HAS_SKLEARN = True
+    import numexpr as ne
+    HAS_NUMEXPR = True
 except ImportError:
-    HAS_SKLEARN = False
-    logger.warning("sklearn未安装，将使用简化的中性化方法")
+    HAS_NUMEXPR = False
+
+# 使用numexpr截尾的最小元素数（小数组上线程调度开销大于收益）
+NUMEXPR_MIN_SIZE = 1 << 16
+
+# 模拟基本面数据使用的行业分类
+INDUSTRIES = ('银行', '科技', '医药', '消费', '制造')
+
+# select_stocks 默认回看天数
+DEFAULT_LOOKBACK_DAYS = 150
+
+# 中性化设计矩阵缓存容量（按截面的行业与市值取值）
+DESIGN_CACHE_SIZE = 16
+
+# 标准化+中性化结果缓存容量（按输入内容哈希）
+PREPROCESS_CACHE_SIZE = 256
+
+# 选股结果的Parquet写入参数：重复字符串列字典编码，ZSTD 压缩，单日结果写为一个行组
+RESULT_DICTIONARY_COLUMNS = ('symbol', 'industry', 'model_name', 'version')
+RESULT_PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "write_statistics": True,
+}
+
+# 标准化+中性化结果缓存（内容哈希 -> 残差矩阵，按最近使用顺序淘汰）
+_preprocess_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
 
 @dataclass
@@ -57,6 +90,28 @@ class SelectionConfig:
     version: str = "v1.0"
 
 
+def _winsorize_np(a: np.ndarray, p: float = 0.01) -> np.ndarray:
+    """按 p / 1-p 分位数原地截尾（忽略NaN，与 Series.quantile 的线性插值一致）"""
+    if a.size == 0:
+        return a
+    with warnings.catch_warnings():
+        # 全为NaN时分位数为NaN，结果保持NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lo, hi = np.nanpercentile(a, [p * 100, (1 - p) * 100])
+    if HAS_NUMEXPR and a.size >= NUMEXPR_MIN_SIZE:
+        # 大数组多线程截尾；NaN 两个比较均为假，保持NaN
+        return ne.evaluate('where(x < lo, lo, where(x > hi, hi, x))',
+                           local_dict={'x': a, 'lo': lo, 'hi': hi}, out=a)
+    return np.clip(a, lo, hi, out=a)
+
+
+def _zscore_np(a: np.ndarray) -> np.ndarray:
+    """Z-score标准化（忽略NaN，样本标准差）"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return (a - np.nanmean(a)) / np.nanstd(a, ddof=1)
+
+
 def winsorize(s: pd.Series, p: float = 0.01) -> pd.Series:
     """
     对序列进行Winsorize处理
@@ -68,9 +123,7 @@ def winsorize(s: pd.Series, p: float = 0.01) -> pd.Series:
     Returns:
         Winsorize后的序列
     """
-    lower_bound = s.quantile(p)
-    upper_bound = s.quantile(1 - p)
-    return s.clip(lower=lower_bound, upper=upper_bound)
+    return pd.Series(_winsorize_np(s.to_numpy(dtype=np.float64, copy=True), p), index=s.index)
 
 
 def zscore(s: pd.Series) -> pd.Series:
@@ -83,7 +136,7 @@ def zscore(s: pd.Series) -> pd.Series:
     Returns:
         Z-score标准化后的序列
     """
-    return (s - s.mean()) / s.std()
+    return pd.Series(_zscore_np(s.to_numpy(dtype=np.float64)), index=s.index)
 
 
 def neutralize(series: pd.Series, industry: pd.Series, cap: Optional[pd.Series] = None) -> pd.Series:
@@ -98,49 +151,121 @@ def neutralize(series: pd.Series, industry: pd.Series, cap: Optional[pd.Series]
     Returns:
         中性化后的因子序列
     """
-    if not HAS_SKLEARN:
-        # 简化的中性化方法
-        logger.warning("使用简化的中性化方法（sklearn未安装）")
-        return series - series.mean()
+    if len(series) <= 1:
+        # 单样本回归无意义，直接返回
+        return series
     
     try:
-        # 准备特征矩阵
-        features = []
-        
-        # 行业虚拟变量
-        industry_dummies = pd.get_dummies(industry, prefix='industry')
-        features.append(industry_dummies)
-        
-        # 对数市值
-        if cap is not None:
-            log_cap = np.log(cap + 1e-8)
-            features.append(log_cap.to_frame('log_cap'))
-        
-        # 合并特征
-        if features:
-            X = pd.concat(features, axis=1)
-            X = X.fillna(0)  # 填充缺失值
-            
-            # 添加截距项
-            X['intercept'] = 1
-            
-            # OLS回归
-            model = LinearRegression(fit_intercept=False)  # 手动添加了截距
-            model.fit(X, series)
-            
-            # 计算残差
-            predicted = model.predict(X)
-            residuals = series - predicted
-            
-            return pd.Series(residuals, index=series.index)
-        else:
-            return series
-            
+        # 行业虚拟变量、对数市值与截距项直接最小二乘求残差
+        return neutralize_frame(series.to_frame(), industry, cap).iloc[:, 0]
     except Exception as e:
         logger.warning(f"中性化失败，使用原始序列: {e}")
         return series
 
 
+def _neutralize_design(industry: pd.Series, cap: Optional[pd.Series] = None) -> np.ndarray:
+    """
+    中性化设计矩阵：行业虚拟变量、对数市值（可选）与截距项，float64
+    
+    按 (行业取值, 市值字节) 缓存，同一截面上的多次中性化只构造一次（返回只读数组）。
+    """
+    # 分类列直接复用编码，其余按取值编码；缺失行业编码为 -1
+    codes, uniques = pd.factorize(industry)
+    cap_bytes = None if cap is None else cap.to_numpy(dtype=np.float64).tobytes()
+    return _cached_design(codes.astype(np.int64).tobytes(), len(uniques), cap_bytes)
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _cached_design(code_bytes: bytes, n_industries: int, cap_bytes: Optional[bytes]) -> np.ndarray:
+    """构造中性化设计矩阵（供缓存复用）"""
+    codes = np.frombuffer(code_bytes, dtype=np.int64)
+    # 单位阵按编码取行得到行业虚拟变量；多出的末列对应缺失行业（-1），截掉后该行全为0
+    parts = [np.eye(n_industries + 1)[codes][:, :n_industries]]
+    if cap_bytes is not None:
+        log_cap = np.log(np.frombuffer(cap_bytes, dtype=np.float64) + 1e-8)
+        parts.append(np.nan_to_num(log_cap)[:, None])  # 填充缺失值
+    parts.append(np.ones((len(codes), 1)))
+    X = np.hstack(parts)
+    X.flags.writeable = False
+    return X
+
+
+def neutralize_frame(factors: pd.DataFrame, industry: pd.Series,
+                     cap: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    对多个因子同时做截面行业和市值中性化
+    
+    设计矩阵只构造一次，各因子作为 (N, K) 的多列因变量由一次 lstsq 求解；
+    含缺失值的行不参与回归，其残差保持NaN。
+    
+    Args:
+        factors: 因子截面（每列一个因子，行与 industry / cap 对齐）
+        industry: 行业分类序列
+        cap: 市值序列（可选）
+        
+    Returns:
+        中性化后的因子DataFrame（索引与列同 factors）
+    """
+    X = _neutralize_design(industry, cap)
+    Y = factors.to_numpy(dtype=np.float64)
+    rows = np.isfinite(Y).all(axis=1)
+    if not rows.any():
+        return factors
+    beta = np.linalg.lstsq(X[rows], Y[rows], rcond=None)[0]
+    return pd.DataFrame(Y - X @ beta, index=factors.index, columns=factors.columns)
+
+
+def _content_key(factors: np.ndarray, industry: pd.Series, cap: Optional[pd.Series], p: float) -> str:
+    """按因子矩阵、行业与市值的内容计算缓存键"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((factors.shape, p, cap is None)).encode())
+    h.update(np.ascontiguousarray(factors).tobytes())
+    h.update(pd.util.hash_pandas_object(industry, index=False).to_numpy().tobytes())
+    if cap is not None:
+        h.update(cap.to_numpy(dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def standardize_neutralize(factors: np.ndarray, industry: pd.Series,
+                           cap: Optional[pd.Series] = None, p: float = 0.01) -> np.ndarray:
+    """
+    因子矩阵逐列 Winsorize、Z-score 后统一做行业和市值中性化
+    
+    结果按输入内容哈希缓存，参数扫描等场景下相同截面不再重复计算。
+    
+    Args:
+        factors: 因子矩阵 (N, K)，每列一个因子，行与 industry / cap 对齐
+        industry: 行业分类序列
+        cap: 市值序列（可选）
+        p: Winsorize截尾比例
+        
+    Returns:
+        中性化后的因子矩阵 (N, K)
+    """
+    factors = np.asarray(factors, dtype=np.float64)
+    key = _content_key(factors, industry, cap, p)
+    cached = _preprocess_cache.get(key)
+    if cached is not None:
+        _preprocess_cache.move_to_end(key)
+        return cached.copy()
+    
+    normed = factors.copy()
+    for j in range(normed.shape[1]):
+        normed[:, j] = _zscore_np(_winsorize_np(normed[:, j].copy(), p))
+    result = neutralize_frame(pd.DataFrame(normed), industry, cap).to_numpy(dtype=np.float64)
+    
+    _preprocess_cache[key] = result
+    while len(_preprocess_cache) > PREPROCESS_CACHE_SIZE:
+        _preprocess_cache.popitem(last=False)
+    return result.copy()
+
+
+def cache_clear() -> None:
+    """清空中性化设计矩阵与标准化结果缓存"""
+    _cached_design.cache_clear()
+    _preprocess_cache.clear()
+
+
 def softmax_weight(score: pd.Series, tau: float = 0.15, cap_per_name: float = 0.05) -> pd.Series:
     """
     使用Softmax计算权重，带单只股票权重上限
@@ -153,26 +278,41 @@ def softmax_weight(score: pd.Series, tau: float = 0.15, cap_per_name: float = 0.
     Returns:
         权重序列
     """
-    # Softmax计算
-    exp_scores = np.exp(score / tau)
-    weights = exp_scores / exp_scores.sum()
-    
-    # 应用权重上限
-    weights = weights.clip(upper=cap_per_name)
+    # Softmax计算并注水：超限者固定在上限，剩余额度重新分配直至无新超限
+    weights = capped_softmax(score.to_numpy(dtype=np.float64), tau, cap_per_name)
+    return pd.Series(weights, index=score.index)
+
+
+def top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """
+    得分最高的前 n 个位置，按得分降序排列（NaN 排在最后）
     
-    # 重新归一化
-    weights = weights / weights.sum()
+    n 远小于总数时先用 argpartition 在 O(M) 内选出前 n 个，再只对这 n 个排序。
     
-    return weights
+    Args:
+        scores: 得分数组
+        n: 选取数量
+        
+    Returns:
+        位置索引数组
+    """
+    neg = -np.asarray(scores, dtype=float)
+    k = min(max(n, 0), len(neg))
+    if k < len(neg):
+        idx = np.argpartition(neg, k)[:k]
+    else:
+        idx = np.arange(len(neg))
+    return idx[np.argsort(neg[idx], kind="stable")]
 
 
-def select_daily(df_factors: pd.DataFrame, universe_mask: pd.Series, top_n: int = 50) -> pd.DataFrame:
+def select_daily(df_factors: pd.DataFrame, universe_mask: Union[pd.Series, AbstractSet[str]],
+                 top_n: int = 50) -> pd.DataFrame:
     """
     执行日度选股
     
     Args:
         df_factors: 因子数据，必须包含列: symbol, momentum_120, volatility_20, pe_ttm, industry, mkt_cap
-        universe_mask: 可交易股票掩码
+        universe_mask: 可交易股票掩码（以代码为索引的布尔Series），或可交易代码集合
         top_n: 选择前N只股票
         
     Returns:
@@ -185,62 +325,103 @@ def select_daily(df_factors: pd.DataFrame, universe_mask: pd.Series, top_n: int
         raise ValueError(f"因子数据缺少必需列: {missing_cols}")
     
     # 应用可交易股票掩码
-    df_filtered = df_factors[df_factors['symbol'].isin(universe_mask[universe_mask].index)].copy()
+    if isinstance(universe_mask, pd.Series):
+        tradable = universe_mask.index[universe_mask.to_numpy(dtype=bool)]
+    else:
+        tradable = universe_mask
+    df_filtered = df_factors[df_factors['symbol'].isin(tradable)].copy()
     
     if df_filtered.empty:
         logger.warning("没有可交易的股票")
         return pd.DataFrame()
     
-    # 计算因子得分
-    # 动量因子（正收益）
-    momentum_score = df_filtered['momentum_120']
-    
-    # 波动率因子（低波动率更好，取负值）
-    volatility_score = -df_filtered['volatility_20']
-    
-    # 估值因子（低PE更好，取负值）
-    valuation_score = -df_filtered['pe_ttm']
+    # 计算因子得分（直接在ndarray上计算）
+    factors = np.column_stack([
+        df_filtered['momentum_120'].to_numpy(dtype=np.float64),  # 动量因子（正收益）
+        -df_filtered['volatility_20'].to_numpy(dtype=np.float64),  # 波动率因子（低波动率更好，取负值）
+        -df_filtered['pe_ttm'].to_numpy(dtype=np.float64)  # 估值因子（低PE更好，取负值）
+    ])
     
-    # 标准化处理
-    momentum_norm = zscore(winsorize(momentum_score))
-    volatility_norm = zscore(winsorize(volatility_score))
-    valuation_norm = zscore(winsorize(valuation_score))
-    
-    # 中性化处理
-    momentum_neutral = neutralize(momentum_norm, df_filtered['industry'], df_filtered['mkt_cap'])
-    volatility_neutral = neutralize(volatility_norm, df_filtered['industry'], df_filtered['mkt_cap'])
-    valuation_neutral = neutralize(valuation_norm, df_filtered['industry'], df_filtered['mkt_cap'])
+    # 标准化与中性化处理（三个因子共用设计矩阵，一次回归）
+    neutral = standardize_neutralize(factors, df_filtered['industry'], df_filtered['mkt_cap'])
     
     # 计算综合得分（等权重平均）
-    composite_score = (momentum_neutral + volatility_neutral + valuation_neutral) / 3
-    
-    # 创建结果DataFrame
-    result = df_filtered[['symbol']].copy()
-    result['score'] = composite_score
+    scores = neutral.mean(axis=1)
     
-    # 按得分排序
-    result = result.sort_values('score', ascending=False)
+    # 选择得分最高的前N只股票（部分排序，只对入选的N只排序）
+    order = top_n_indices(scores, top_n)
     
-    # 选择前N只股票
-    result = result.head(top_n).copy()
+    # 创建结果DataFrame
+    result = df_filtered[['symbol']].iloc[order].copy()
+    result['score'] = scores[order]
     
     # 添加排名
-    result['rank'] = range(1, len(result) + 1)
+    result['rank'] = np.arange(1, len(result) + 1, dtype=np.int32)
     
     # 添加方向（做多）
-    result['direction'] = 1
+    result['direction'] = np.ones(len(result), dtype=np.int8)
     
     # 计算权重
     result['weight'] = softmax_weight(result['score'])
     
     # 添加模型信息
-    result['model_name'] = "rank_topn_neutral"
-    result['version'] = "v1.0"
+    result['model_name'] = _constant_categorical("rank_topn_neutral", len(result))
+    result['version'] = _constant_categorical("v1.0", len(result))
     
     logger.info(f"选股完成，选择前 {len(result)} 只股票")
     return result
 
 
+def _symbol_dtype(symbols: List[str]) -> pd.CategoricalDtype:
+    """股票代码的分类类型（类别为去重排序后的代码）"""
+    return pd.CategoricalDtype(sorted(set(symbols)))
+
+
+def _symbol_categorical(symbols: List[str]) -> pd.Categorical:
+    """按股票代码列表构造分类列"""
+    return pd.Categorical(symbols, dtype=_symbol_dtype(symbols))
+
+
+def _constant_categorical(value: str, n: int) -> pd.Categorical:
+    """单一取值重复 n 次的分类列（写Parquet时为单项字典）"""
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def _momentum(close: pd.Series, window: int) -> pd.Series:
+    """window 日收益率序列"""
+    return close.pct_change(periods=window)
+
+
+def _volatility(close: pd.Series, window: int) -> pd.Series:
+    """window 日滚动收益率标准差序列"""
+    returns = close.pct_change().to_numpy(dtype=np.float64)
+    return pd.Series(rolling_std(returns[:, None], window)[:, 0], index=close.index)
+
+
+def _pe_inverse(pe: pd.Series) -> pd.Series:
+    """PE倒数（避免除零）"""
+    return 1.0 / (pe + 1e-8)
+
+
+def _last_momentum(close: np.ndarray, window: int) -> np.ndarray:
+    """宽表（日期 × 股票）最后一行相对 window 行之前的收益率，行数不足时为NaN"""
+    if close.shape[0] <= window:
+        return np.full(close.shape[1], np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return close[-1] / close[-1 - window] - 1.0
+
+
+def _last_volatility(close: np.ndarray, window: int) -> np.ndarray:
+    """宽表（日期 × 股票）末尾 window 个收益率的样本标准差（与 rolling(window).std() 末行一致）"""
+    tail = close[-(window + 1):]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ret = tail[1:] / tail[:-1] - 1.0
+    if ret.shape[0] < window:
+        return np.full(close.shape[1], np.nan)
+    # 与 rolling 默认 min_periods=window 一致：窗口内有缺失即为NaN
+    return ret.std(axis=0, ddof=1)
+
+
 class FactorCalculator:
     """因子计算器"""
     
@@ -268,7 +449,7 @@ class FactorCalculator:
             raise ValueError("价格数据必须包含close列")
         
         # 计算120日收益率
-        momentum = price_data['close'].pct_change(periods=self.config.momentum_window)
+        momentum = _momentum(price_data['close'], self.config.momentum_window)
         
         self.logger.info(f"计算动量因子完成，窗口期: {self.config.momentum_window}天")
         return momentum
@@ -287,8 +468,7 @@ class FactorCalculator:
             raise ValueError("价格数据必须包含close列")
         
         # 计算20日滚动波动率
-        returns = price_data['close'].pct_change()
-        volatility = returns.rolling(window=self.config.volatility_window).std()
+        volatility = _volatility(price_data['close'], self.config.volatility_window)
         
         self.logger.info(f"计算波动率因子完成，窗口期: {self.config.volatility_window}天")
         return volatility
@@ -307,11 +487,26 @@ class FactorCalculator:
             raise ValueError("基本面数据必须包含pe_ttm列")
         
         # 计算PE倒数（避免除零）
-        pe_inverse = 1.0 / (fundamental_data['pe_ttm'] + 1e-8)
+        pe_inverse = _pe_inverse(fundamental_data['pe_ttm'])
         
         self.logger.info("计算估值因子完成")
         return pe_inverse
     
+    def calculate_panel_factors(self, close: pd.DataFrame) -> pd.DataFrame:
+        """
+        在收盘价宽表上一次性计算最后一个交易日的动量与波动率截面
+        
+        Args:
+            close: 收盘价宽表（行是升序日期，列是股票）
+            
+        Returns:
+            以股票为索引、包含 momentum / volatility 列的DataFrame
+        """
+        values = close.to_numpy(dtype=float)
+        momentum = _last_momentum(values, self.config.momentum_window)
+        volatility = _last_volatility(values, self.config.volatility_window)
+        return pd.DataFrame({'momentum': momentum, 'volatility': volatility}, index=close.columns)
+    
     def winsorize_factor(self, factor: pd.Series) -> pd.Series:
         """
         对因子进行Winsorize处理
@@ -381,28 +576,36 @@ class StockScreener:
         # 合并数据
         merged_data = pd.merge(price_data, fundamental_data, 
                               on=['symbol', 'trade_date'], how='inner')
+        return self.screen_merged(merged_data)
+    
+    def screen_merged(self, merged_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        在已合并的价格和基本面数据上筛选股票
         
-        # 基本筛选条件
-        filtered_data = merged_data.copy()
+        Args:
+            merged_data: 已合并的价格和基本面数据
+            
+        Returns:
+            筛选后的股票数据
+        """
+        # 基本筛选条件：各条件合成一个布尔掩码，最后只索引一次
+        columns = set(merged_data.columns)
+        mask = np.ones(len(merged_data), dtype=bool)
         
         # 市值筛选
-        if 'market_cap' in filtered_data.columns:
-            filtered_data = filtered_data[
-                filtered_data['market_cap'] >= self.config.min_market_cap
-            ]
+        if 'market_cap' in columns:
+            mask &= merged_data['market_cap'].to_numpy(dtype=np.float64, na_value=np.nan) >= self.config.min_market_cap
         
         # 成交量筛选
-        if 'volume' in filtered_data.columns:
-            filtered_data = filtered_data[
-                filtered_data['volume'] >= self.config.min_volume
-            ]
+        if 'volume' in columns:
+            mask &= merged_data['volume'].to_numpy(dtype=np.float64, na_value=np.nan) >= self.config.min_volume
         
         # PE筛选（去除异常值）
-        if 'pe_ttm' in filtered_data.columns:
-            filtered_data = filtered_data[
-                (filtered_data['pe_ttm'] > 0) & 
-                (filtered_data['pe_ttm'] < 100)
-            ]
+        if 'pe_ttm' in columns:
+            pe = merged_data['pe_ttm'].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask &= (pe > 0) & (pe < 100)
+        
+        filtered_data = merged_data.loc[mask]
         
         self.logger.info(f"股票筛选完成，筛选前: {len(merged_data)} 只，筛选后: {len(filtered_data)} 只")
         return filtered_data
@@ -441,23 +644,21 @@ class StockSelector:
         # 实际使用时替换为真实的数据获取逻辑
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        data = []
-        for symbol in symbols:
-            for trade_date in dates:
-                # 模拟数据
-                close = 10 + np.random.normal(0, 2)
-                volume = np.random.randint(1000000, 10000000)
-                amount = close * volume
-                
-                data.append({
-                    'symbol': symbol,
-                    'trade_date': trade_date,
-                    'close': close,
-                    'volume': volume,
-                    'amount': amount
-                })
-        
-        df = pd.DataFrame(data)
+        # 模拟数据：按 (股票 × 日期) 整块抽样，行序为股票外层、日期内层
+        rng = np.random.default_rng()
+        n_symbols, n_dates = len(symbols), len(dates)
+        close = 10 + rng.normal(0, 2, size=(n_symbols, n_dates))
+        volume = rng.integers(1000000, 10000000, size=(n_symbols, n_dates))
+        
+        # 股票代码为分类列，与基本面数据共用同一组类别，合并时直接按编码对齐
+        codes = _symbol_categorical(symbols).codes
+        df = pd.DataFrame({
+            'symbol': pd.Categorical.from_codes(np.repeat(codes, n_dates), dtype=_symbol_dtype(symbols)),
+            'trade_date': np.tile(dates.values, n_symbols),
+            'close': close.ravel(),
+            'volume': volume.ravel(),
+            'amount': (close * volume).ravel()
+        })
         self.logger.info(f"获取价格数据完成，股票数: {len(symbols)}, 日期范围: {start_date} 到 {end_date}")
         return df
     
@@ -475,21 +676,16 @@ class StockSelector:
         """
         # 模拟基本面数据API
         # 实际使用时替换为真实的数据获取逻辑
-        data = []
-        for symbol in symbols:
-            pe_ttm = np.random.uniform(5, 50)
-            industry = np.random.choice(['银行', '科技', '医药', '消费', '制造'])
-            market_cap = np.random.uniform(1e8, 1e12)
-            
-            data.append({
-                'symbol': symbol,
-                'trade_date': pd.to_datetime(trade_date),
-                'pe_ttm': pe_ttm,
-                'industry': industry,
-                'market_cap': market_cap
-            })
-        
-        df = pd.DataFrame(data)
+        # 每个字段一次批量抽样
+        rng = np.random.default_rng()
+        n = len(symbols)
+        df = pd.DataFrame({
+            'symbol': _symbol_categorical(symbols),
+            'trade_date': pd.to_datetime(trade_date),
+            'pe_ttm': rng.uniform(5, 50, size=n),
+            'industry': pd.Categorical(rng.choice(INDUSTRIES, size=n), categories=INDUSTRIES),
+            'market_cap': rng.uniform(1e8, 1e12, size=n)
+        })
         self.logger.info(f"获取基本面数据完成，股票数: {len(symbols)}, 日期: {trade_date}")
         return df
     
@@ -497,85 +693,69 @@ class StockSelector:
         """
         从已合并的数据计算因子
         
+        收盘价透视为 (日期 × 股票) 宽表后整块计算最后一个交易日的截面因子，
+        不再逐股票循环；标准化与中性化均在该截面上进行。
+        
         Args:
             merged_data: 已合并的价格和基本面数据
             
         Returns:
             包含所有因子的DataFrame
         """
-        # 按股票分组计算因子
-        factor_data = []
-        
-        for symbol, group in merged_data.groupby('symbol'):
-            if len(group) < self.config.momentum_window:
-                self.logger.warning(f"股票 {symbol} 数据不足，跳过")
-                continue  # 跳过数据不足的股票
-            
-            # 按日期排序
-            group = group.sort_values('trade_date')
-            
-            # 计算原始因子
-            momentum = self.factor_calculator.calculate_momentum_factor(group)
-            volatility = self.factor_calculator.calculate_volatility_factor(group)
-            
-            # 检查基本面数据
-            if 'pe_ttm' not in group.columns:
-                self.logger.warning(f"股票 {symbol} 缺少pe_ttm数据，跳过")
-                continue
-            
-            valuation = self.factor_calculator.calculate_valuation_factor(group)
-            
-            # 标准化处理
-            momentum_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(momentum)
-            )
-            volatility_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(volatility)
-            )
-            valuation_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(valuation)
-            )
-            
-            # 中性化处理
-            industry = group['industry'].iloc[0] if 'industry' in group.columns else 'Unknown'
-            market_cap = group['market_cap'].iloc[0] if 'market_cap' in group.columns else 1e9
-            
-            # 只取最后一个日期的因子值
-            last_idx = len(group) - 1
-            if last_idx >= 0:
-                momentum_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([momentum_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                volatility_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([volatility_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                valuation_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([valuation_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                factor_data.append({
-                    'symbol': symbol,
-                    'trade_date': group['trade_date'].iloc[last_idx],
-                    'momentum_120': momentum_neutral,
-                    'volatility_20': volatility_neutral,
-                    'pe_ttm': group['pe_ttm'].iloc[last_idx],
-                    'industry': industry,
-                    'mkt_cap': market_cap
-                })
-        
-        factor_df = pd.DataFrame(factor_data)
-        if not factor_df.empty:
-            self.logger.info(f"因子计算完成，股票数: {len(factor_df['symbol'].unique())}")
-        else:
+        if 'pe_ttm' not in merged_data.columns:
+            self.logger.warning("缺少pe_ttm数据，无法计算因子")
+            return pd.DataFrame()
+        
+        # 数据不足的股票整体剔除（分类列中未出现的类别计数为0，不计入）
+        counts = merged_data['symbol'].value_counts()
+        n_rows = counts.to_numpy()
+        short = counts.index[(n_rows > 0) & (n_rows < self.config.momentum_window)]
+        if len(short) > 0:
+            self.logger.warning(f"{len(short)} 只股票数据不足，跳过")
+            merged_data = merged_data[~merged_data['symbol'].isin(short)]
+        if merged_data.empty:
             self.logger.warning("因子计算完成，但无有效数据")
+            return pd.DataFrame()
+        
+        # 分类代码列去掉筛选后未出现的类别，避免透视出全为NaN的股票列
+        if isinstance(merged_data['symbol'].dtype, pd.CategoricalDtype):
+            merged_data = merged_data.assign(symbol=merged_data['symbol'].cat.remove_unused_categories())
+        
+        # 按 (股票, 日期) 排序后取各股票的首行（行业、市值）与末行（PE）
+        ordered = merged_data.sort_values(['symbol', 'trade_date'])
+        first = ordered.drop_duplicates('symbol', keep='first').set_index('symbol')
+        last = ordered.drop_duplicates('symbol', keep='last').set_index('symbol')
+        
+        # 收盘价宽表：行是日期，列是股票
+        wide = ordered.pivot(index='trade_date', columns='symbol', values='close').sort_index()
+        snapshot = self.factor_calculator.calculate_panel_factors(wide)
+        symbols = snapshot.index
+        
+        pe_ttm = last['pe_ttm'].reindex(symbols)
+        industry = (first['industry'].reindex(symbols) if 'industry' in first.columns
+                    else pd.Series('Unknown', index=symbols))
+        market_cap = (first['market_cap'].reindex(symbols) if 'market_cap' in first.columns
+                      else pd.Series(1e9, index=symbols))
+        valuation = self.factor_calculator.calculate_valuation_factor(pe_ttm.to_frame())
+        
+        # 截面标准化与中性化：三个因子共用一个设计矩阵，一次回归
+        neutral = standardize_neutralize(
+            np.column_stack([snapshot['momentum'].to_numpy(dtype=np.float64),
+                             snapshot['volatility'].to_numpy(dtype=np.float64),
+                             valuation.to_numpy(dtype=np.float64)]),
+            industry, market_cap, self.config.winsorize_limits[0]
+        )
+        
+        factor_df = pd.DataFrame({
+            'symbol': symbols,
+            'trade_date': wide.index[-1],
+            'momentum_120': neutral[:, 0],
+            'volatility_20': neutral[:, 1],
+            'pe_ttm': pe_ttm.to_numpy(),
+            'industry': industry.to_numpy(),
+            'mkt_cap': market_cap.to_numpy()
+        })
+        self.logger.info(f"因子计算完成，股票数: {len(factor_df)}")
         return factor_df
     
     def calculate_factors(self, price_data: pd.DataFrame, 
@@ -593,81 +773,7 @@ class StockSelector:
         # 合并数据
         merged_data = pd.merge(price_data, fundamental_data, 
                               on=['symbol', 'trade_date'], how='inner')
-        
-        # 按股票分组计算因子
-        factor_data = []
-        
-        for symbol, group in merged_data.groupby('symbol'):
-            if len(group) < self.config.momentum_window:
-                self.logger.warning(f"股票 {symbol} 数据不足，跳过")
-                continue  # 跳过数据不足的股票
-            
-            # 按日期排序
-            group = group.sort_values('trade_date')
-            
-            # 计算原始因子
-            momentum = self.factor_calculator.calculate_momentum_factor(group)
-            volatility = self.factor_calculator.calculate_volatility_factor(group)
-            
-            # 检查基本面数据
-            if 'pe_ttm' not in group.columns:
-                self.logger.warning(f"股票 {symbol} 缺少pe_ttm数据，跳过")
-                continue
-            
-            valuation = self.factor_calculator.calculate_valuation_factor(group)
-            
-            # 标准化处理
-            momentum_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(momentum)
-            )
-            volatility_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(volatility)
-            )
-            valuation_norm = self.factor_calculator.zscore_normalize(
-                self.factor_calculator.winsorize_factor(valuation)
-            )
-            
-            # 中性化处理
-            industry = group['industry'].iloc[0] if 'industry' in group.columns else 'Unknown'
-            market_cap = group['market_cap'].iloc[0] if 'market_cap' in group.columns else 1e9
-            
-            # 只取最后一个日期的因子值
-            last_idx = len(group) - 1
-            if last_idx >= 0:
-                momentum_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([momentum_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                volatility_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([volatility_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                valuation_neutral = self.factor_calculator.neutralize_factor(
-                    pd.Series([valuation_norm.iloc[last_idx]]), 
-                    pd.Series([industry]), 
-                    pd.Series([market_cap])
-                ).iloc[0]
-                
-                factor_data.append({
-                    'symbol': symbol,
-                    'trade_date': group['trade_date'].iloc[last_idx],
-                    'momentum_120': momentum_neutral,
-                    'volatility_20': volatility_neutral,
-                    'pe_ttm': group['pe_ttm'].iloc[last_idx],
-                    'industry': industry,
-                    'mkt_cap': market_cap
-                })
-        
-        factor_df = pd.DataFrame(factor_data)
-        if not factor_df.empty:
-            self.logger.info(f"因子计算完成，股票数: {len(factor_df['symbol'].unique())}")
-        else:
-            self.logger.warning("因子计算完成，但无有效数据")
-        return factor_df
+        return self.calculate_factors_from_merged(merged_data)
     
     def calculate_composite_score(self, factor_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -693,27 +799,26 @@ class StockSelector:
             factor_data['pe_ttm'] * weights['pe_ttm']
         )
         
-        # 按得分排序
-        factor_data = factor_data.sort_values('score', ascending=False)
+        # 选择得分最高的前N只股票（部分排序，只对入选的N只排序）
+        order = top_n_indices(factor_data['score'].to_numpy(dtype=np.float64), self.config.top_n)
+        top_stocks = factor_data.iloc[order].copy()
         
         # 添加排名
-        factor_data['rank'] = range(1, len(factor_data) + 1)
-        
-        # 选择前N只股票
-        top_stocks = factor_data.head(self.config.top_n).copy()
+        top_stocks['rank'] = np.arange(1, len(top_stocks) + 1, dtype=np.int32)
         
         # 添加其他字段
-        top_stocks['direction'] = 'long'  # 做多方向
+        top_stocks['direction'] = _constant_categorical('long', len(top_stocks))  # 做多方向
         top_stocks['weight'] = 1.0 / len(top_stocks)  # 等权重
-        top_stocks['model_name'] = self.config.model_name
-        top_stocks['version'] = self.config.version
+        top_stocks['model_name'] = _constant_categorical(self.config.model_name, len(top_stocks))
+        top_stocks['version'] = _constant_categorical(self.config.version, len(top_stocks))
         
         self.logger.info(f"综合得分计算完成，选择前 {self.config.top_n} 只股票")
         return top_stocks
     
     def select_stocks(self, symbols: List[str], 
                      trade_date: str,
-                     lookback_days: int = 150) -> pd.DataFrame:
+                     lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+                     price_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         执行股票选择
         
@@ -721,6 +826,7 @@ class StockSelector:
             symbols: 股票代码列表
             trade_date: 交易日期
             lookback_days: 回看天数
+            price_data: 预先获取的价格数据（可选，覆盖回看区间即可，按区间截取）
             
         Returns:
             选股结果DataFrame
@@ -729,14 +835,22 @@ class StockSelector:
         start_date = (pd.to_datetime(trade_date) - pd.Timedelta(days=lookback_days)).strftime('%Y-%m-%d')
         
         # 获取数据
-        price_data = self.get_price_data(symbols, start_date, trade_date)
+        if price_data is None:
+            price_data = self.get_price_data(symbols, start_date, trade_date)
+        else:
+            dates = price_data['trade_date']
+            price_data = price_data[(dates >= pd.Timestamp(start_date)) & (dates <= pd.Timestamp(trade_date))]
         fundamental_data = self.get_fundamental_data(symbols, trade_date)
         
+        # 合并数据（只合并一次，筛选与因子计算共用）
+        merged_data = pd.merge(price_data, fundamental_data, 
+                              on=['symbol', 'trade_date'], how='inner')
+        
         # 筛选股票
-        screened_data = self.stock_screener.screen_stocks(price_data, fundamental_data)
+        screened_data = self.stock_screener.screen_merged(merged_data)
         
         # 计算因子
-        factor_data = self.calculate_factors(screened_data, fundamental_data)
+        factor_data = self.calculate_factors_from_merged(screened_data)
         
         # 计算综合得分
         result = self.calculate_composite_score(factor_data)
@@ -768,7 +882,11 @@ class StockSelector:
         filepath = output_dir / filename
         
         # 保存为Parquet文件
-        results.to_parquet(filepath, index=False)
+        present = set(results.columns)
+        pq.write_table(pa.Table.from_pandas(results, preserve_index=False), filepath,
+                       use_dictionary=[col for col in RESULT_DICTIONARY_COLUMNS if col in present],
+                       row_group_size=max(1, len(results)),
+                       **RESULT_PARQUET_OPTIONS)
         
         self.logger.info(f"选股结果已保存: {filepath}")
         return str(filepath)
@@ -792,7 +910,8 @@ def create_stock_selector(config: Optional[SelectionConfig] = None) -> StockSele
 
 def run_stock_selection(symbols: List[str], 
                        trade_date: str,
-                       config: Optional[SelectionConfig] = None) -> Tuple[pd.DataFrame, str]:
+                       config: Optional[SelectionConfig] = None,
+                       price_data: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, str]:
     """
     运行股票选择
     
@@ -800,6 +919,7 @@ def run_stock_selection(symbols: List[str],
         symbols: 股票代码列表
         trade_date: 交易日期
         config: 选股配置
+        price_data: 预先获取的价格数据（可选）
         
     Returns:
         (选股结果DataFrame, 保存路径)
@@ -808,7 +928,7 @@ def run_stock_selection(symbols: List[str],
     selector = create_stock_selector(config)
     
     # 执行选股
-    results = selector.select_stocks(symbols, trade_date)
+    results = selector.select_stocks(symbols, trade_date, price_data=price_data)
     
     # 保存结果
     save_path = selector.save_results(results, trade_date)
@@ -816,6 +936,54 @@ def run_stock_selection(symbols: List[str],
     return results, save_path
 
 
+def run_stock_selection_batch(symbols: List[str],
+                              trade_dates: List[str],
+                              config: Optional[SelectionConfig] = None,
+                              max_workers: int = 8) -> Dict[str, Tuple[pd.DataFrame, str]]:
+    """
+    并行运行多个交易日的股票选择
+    
+    价格数据按全部日期的并集区间只获取一次，各交易日截取所需区间后在进程池中并行选股。
+    
+    Args:
+        symbols: 股票代码列表
+        trade_dates: 交易日期列表
+        config: 选股配置
+        max_workers: 最大并行进程数
+        
+    Returns:
+        {交易日期: (选股结果DataFrame, 保存路径)}，按输入日期顺序排列
+    """
+    trade_dates = list(dict.fromkeys(trade_dates))
+    if not trade_dates:
+        return {}
+    
+    # 一次获取覆盖所有交易日回看区间的价格数据
+    dates = pd.to_datetime(trade_dates)
+    start_date = (dates.min() - pd.Timedelta(days=DEFAULT_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+    end_date = dates.max().strftime('%Y-%m-%d')
+    panel = create_stock_selector(config).get_price_data(symbols, start_date, end_date)
+    
+    logger.info(f"并行运行股票选择，日期数: {len(trade_dates)}, 并行度: {min(max_workers, len(trade_dates))}")
+    results: Dict[str, Tuple[pd.DataFrame, str]] = {}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(trade_dates))) as executor:
+        futures = {}
+        for trade_date, ts in zip(trade_dates, dates):
+            # 只传递该交易日回看区间内的价格，减少进程间序列化
+            window = panel[(panel['trade_date'] >= ts - pd.Timedelta(days=DEFAULT_LOOKBACK_DAYS))
+                           & (panel['trade_date'] <= ts)]
+            futures[executor.submit(run_stock_selection, symbols, trade_date, config, window)] = trade_date
+        for future in as_completed(futures):
+            trade_date = futures[future]
+            try:
+                results[trade_date] = future.result()
+            except Exception as e:
+                logger.error(f"股票选择失败，日期: {trade_date}, {e}")
+                results[trade_date] = (pd.DataFrame(), "")
+    
+    return {trade_date: results[trade_date] for trade_date in trade_dates}
+
+
 # 示例用法
 if __name__ == "__main__":
     # 配置日志